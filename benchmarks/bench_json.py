@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Compare JSON decoding backends on listing and menu payloads.
+
+  python benchmarks/bench_json.py [--repeat N]
+
+For every backend in swiggy_json that is installed here (orjson, msgspec,
+stdlib json) reports per-response time for:
+
+  loads            decoding the whole listing body
+  loads+parse      loads then SwiggyClient._parse_restaurants (dict walk)
+  restaurants      swiggy_json decode_restaurants (typed/fast path)
+  menu             loads then SwiggyClient._parse_menu
+
+with the speedup over stdlib json. Payloads are the recorded fixtures in
+benchmarks/fixtures when present, synthetic ones otherwise.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import swiggy_json
+from payloads import listing_payloads, load_recorded, synthesize_menu
+from swiggy import SwiggyClient
+
+
+def cases(backend):
+    return [
+        ("loads", "listing", backend.loads),
+        ("loads+parse", "listing", lambda raw: SwiggyClient._parse_restaurants(None, backend.loads(raw))),
+        ("restaurants", "listing", backend.decode_restaurants),
+        ("menu", "menu", lambda raw: SwiggyClient._parse_menu(None, backend.loads(raw))),
+    ]
+
+
+def time_per_response(fn, payloads, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for raw in payloads:
+            fn(raw)
+        best = min(best, time.perf_counter() - start)
+    return best / len(payloads)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark JSON decoding backends")
+    parser.add_argument("--repeat", type=int, default=20, help="Timing repetitions (best is kept)")
+    args = parser.parse_args()
+
+    payloads = {
+        'listing': listing_payloads(),
+        'menu': load_recorded("menu_pl") or [synthesize_menu(seed, items=400) for seed in range(10)],
+    }
+    for kind, bodies in payloads.items():
+        print(f"{kind}: {len(bodies)} payload(s), {sum(len(b) for b in bodies) / len(bodies) / 1024:.0f} KB average")
+
+    names = swiggy_json.available_backends()
+    missing = [name for name in swiggy_json.BACKENDS if name not in names]
+    if missing:
+        print(f"Not installed: {', '.join(missing)}")
+
+    backends = {name: swiggy_json.get_backend(name) for name in names}
+    counts = {name: sum(len(backend.decode_restaurants(raw)) for raw in payloads['listing'])
+              for name, backend in backends.items()}
+    if len(set(counts.values())) != 1:
+        print(f"Backends disagree on restaurant counts: {counts}")
+        sys.exit(1)
+
+    baseline = {}
+    print(f"\n{'backend':<10} {'case':<14} {'ms/response':>12} {'vs json':>8}")
+    for name in reversed(names):
+        for case, kind, fn in cases(backends[name]):
+            per_response = time_per_response(fn, payloads[kind], args.repeat)
+            if name == 'json':
+                baseline[case] = per_response
+            speedup = baseline[case] / per_response if case in baseline else 0
+            print(f"{name:<10} {case:<14} {per_response * 1000:>12.3f} {speedup:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
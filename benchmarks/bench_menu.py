@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Time menu parsing on large nested menus.
+
+  python benchmarks/bench_menu.py [--items N] [--repeat N]
+
+Decodes nested menu/pl payloads (recorded ones when present, otherwise
+synthetic ones with N items) once, then times swiggy_menu.parse_menu
+building the whole menu against the early-stopping cases: the first 10
+items, and a single category taken from the middle of the menu.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from payloads import load_recorded, synthesize_nested_menu
+from swiggy_menu import iter_categories, parse_menu
+
+
+def best_time(fn, datas, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for data in datas:
+            fn(data)
+        best = min(best, time.perf_counter() - start)
+    return best / len(datas)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark nested menu parsing")
+    parser.add_argument("--items", type=int, default=600, help="Items per synthetic menu")
+    parser.add_argument("--repeat", type=int, default=20, help="Timing repetitions (best is kept)")
+    args = parser.parse_args()
+
+    bodies = load_recorded("menu_pl") or [synthesize_nested_menu(seed, items=args.items) for seed in range(5)]
+    datas = [json.loads(body) for body in bodies]
+    counts = [len(parse_menu(data)) for data in datas]
+    print(f"{len(datas)} menu(s), {sum(counts) / len(counts):.0f} items average")
+
+    # A category from the middle of each menu, by title
+    middles = {}
+    for i, data in enumerate(datas):
+        titles = [title for title, _ in iter_categories(data) if title]
+        middles[id(data)] = titles[len(titles) // 2] if titles else ''
+
+    cases = [
+        ("full menu", lambda data: parse_menu(data)),
+        ("first 10 items", lambda data: parse_menu(data, limit=10)),
+        ("one category", lambda data: parse_menu(data, category=middles[id(data)])),
+    ]
+    full = None
+    print(f"\n{'case':<16} {'ms/menu':>9} {'vs full':>8}")
+    for name, fn in cases:
+        per_menu = best_time(fn, datas, args.repeat)
+        full = full or per_menu
+        print(f"{name:<16} {per_menu * 1000:>9.3f} {full / per_menu:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
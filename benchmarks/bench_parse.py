@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Compare restaurant listing parsers on fixture payloads.
+
+  python benchmarks/bench_parse.py [--repeat N]
+
+Reports per-response parse time and peak traced memory for the dict-based
+SwiggyClient._parse_restaurants (after a full json.loads) and the streaming
+swiggy_parse.iter_restaurants.
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import json
+
+from payloads import listing_payloads
+from swiggy import SwiggyClient
+from swiggy_parse import iter_restaurants
+
+
+def parse_dicts(raw):
+    return SwiggyClient._parse_restaurants(None, json.loads(raw))
+
+
+def parse_streaming(raw):
+    return list(iter_restaurants(raw))
+
+
+PARSERS = [
+    ("json.loads + _parse_restaurants", parse_dicts),
+    ("iter_restaurants", parse_streaming),
+]
+
+
+def time_per_response(parse, payloads, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for raw in payloads:
+            parse(raw)
+        best = min(best, time.perf_counter() - start)
+    return best / len(payloads)
+
+
+def peak_memory(parse, payloads):
+    """Largest tracemalloc peak while parsing (and holding) a single response"""
+    peak = 0
+    for raw in payloads:
+        tracemalloc.start()
+        result = parse(raw)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+        del result
+    return peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark restaurant listing parsers")
+    parser.add_argument("--repeat", type=int, default=20, help="Timing repetitions (best is kept)")
+    args = parser.parse_args()
+
+    payloads = listing_payloads()
+    avg_kb = sum(len(p) for p in payloads) / len(payloads) / 1024
+    print(f"{len(payloads)} payload(s), {avg_kb:.0f} KB average")
+
+    counts = {name: sum(len(parse(raw)) for raw in payloads) for name, parse in PARSERS}
+    if len(set(counts.values())) != 1:
+        print(f"Parsers disagree on restaurant counts: {counts}")
+        sys.exit(1)
+
+    print(f"{'parser':<34} {'ms/response':>12} {'peak KB':>10}")
+    for name, parse in PARSERS:
+        per_response = time_per_response(parse, payloads, args.repeat)
+        peak = peak_memory(parse, payloads)
+        print(f"{name:<34} {per_response * 1000:>12.3f} {peak / 1024:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Compare adaptive coverage planning with uniform grids.
+
+  python benchmarks/bench_plan.py [--restaurants N] [--radius KM] [--seed N]
+
+Scatters N synthetic restaurants over a Bangalore-sized box (most of them
+in a few dense clusters, the rest spread evenly). A search at a point
+returns the nearest restaurants within --radius km, at most --page of
+them, like a listing page. Reports the searches swiggy_plan.CoveragePlanner
+needs and the restaurants it finds, next to uniform grids at several
+spacings.
+"""
+
+import argparse
+import math
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from swiggy_plan import KM_PER_DEG_LAT, CoveragePlanner, km_per_deg_lng
+
+BBOX = (12.85, 77.50, 13.10, 77.75)
+CLUSTERS = [(12.97, 77.59), (12.93, 77.62), (13.03, 77.55), (12.91, 77.68)]
+
+
+def synthesize_city(count, seed):
+    rng = random.Random(seed)
+    south, west, north, east = BBOX
+    restaurants = []
+    for i in range(count):
+        if rng.random() < 0.8:
+            lat, lng = rng.choice(CLUSTERS)
+            restaurants.append((str(i), rng.gauss(lat, 0.012), rng.gauss(lng, 0.012)))
+        else:
+            restaurants.append((str(i), rng.uniform(south, north), rng.uniform(west, east)))
+    return restaurants
+
+
+def make_search(restaurants, radius, page):
+    def listing(lat, lng):
+        scale = km_per_deg_lng(lat)
+        near = sorted((math.hypot((r_lat - lat) * KM_PER_DEG_LAT, (r_lng - lng) * scale), rid)
+                      for rid, r_lat, r_lng in restaurants)
+        return [{'id': rid} for distance, rid in near[:page] if distance < radius]
+    return listing
+
+
+def uniform(listing, spacing):
+    south, west, north, east = BBOX
+    rows = int(math.ceil((north - south) * KM_PER_DEG_LAT / spacing)) + 1
+    cols = int(math.ceil((east - west) * km_per_deg_lng((south + north) / 2) / spacing)) + 1
+    seen = set()
+    for r in range(rows):
+        for c in range(cols):
+            lat = south + (north - south) * r / (rows - 1)
+            lng = west + (east - west) * c / (cols - 1)
+            seen.update(item['id'] for item in listing(lat, lng))
+    return rows * cols, len(seen)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark adaptive coverage planning")
+    parser.add_argument("--restaurants", type=int, default=3000, help="Synthetic restaurants")
+    parser.add_argument("--radius", type=float, default=3.0, help="Delivery radius in km")
+    parser.add_argument("--page", type=int, default=60, help="Restaurants per search response")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    restaurants = synthesize_city(args.restaurants, args.seed)
+    listing = make_search(restaurants, args.radius, args.page)
+
+    def search(locations):
+        for lat, lng in locations:
+            yield lat, lng, listing(float(lat), float(lng))
+
+    print(f"{args.restaurants} restaurants, {args.radius:g} km radius, {args.page} per response\n")
+    print(f"{'strategy':<22} {'searches':>9} {'found':>7} {'coverage':>9}")
+    planner = CoveragePlanner(search, BBOX)
+    for _ in planner.run():
+        pass
+    print(f"{'adaptive':<22} {planner.requests:>9} {len(planner.seen):>7} "
+          f"{len(planner.seen) / args.restaurants * 100:>8.1f}%")
+    for spacing in (2.0, 1.0, 0.5):
+        searches, found = uniform(listing, spacing)
+        print(f"{f'uniform {spacing:g} km':<22} {searches:>9} {found:>7} {found / args.restaurants * 100:>8.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Time search result ranking on a large result set.
+
+  python benchmarks/bench_rank.py [--rows N] [--repeat N]
+
+Builds N restaurants from the listing payloads (as a grid sweep would) and
+times swiggy_rank.rank with its list backend, its NumPy backend when NumPy
+is installed, and a plain sorted()/filter baseline that re-reads and
+re-parses every field inside the sort key.
+"""
+
+import argparse
+import math
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import swiggy_rank
+from payloads import listing_payloads
+from swiggy_parse import iter_restaurants
+
+FILTERS = {'min_rating': 4.0, 'max_eta': 45, 'open_only': True}
+
+
+def baseline(restaurants, sort):
+    """What an inline implementation would do: filter, then sort on a per-row key"""
+    def number(value):
+        try:
+            value = float(value)
+        except (TypeError, ValueError):
+            return math.nan
+        return value if value > 0 else math.nan
+
+    kept = [r for r in restaurants
+            if number(r.get('avgRating')) >= FILTERS['min_rating']
+            and number(r.get('deliveryTime')) <= FILTERS['max_eta']
+            and r.get('isOpen')]
+    if sort == 'rating':
+        return sorted(kept, key=lambda r: -number(r.get('avgRating')))
+    return sorted(kept, key=lambda r: number(swiggy_rank._NUMBER.search(r.get('costForTwo') or '0')
+                                             .group().replace(',', '')))
+
+
+def run_lists(restaurants, sort):
+    numpy_finder = swiggy_rank._numpy
+    swiggy_rank._numpy = lambda: None
+    try:
+        return swiggy_rank.rank(restaurants, sort, **FILTERS)
+    finally:
+        swiggy_rank._numpy = numpy_finder
+
+
+def run_default(restaurants, sort):
+    return swiggy_rank.rank(restaurants, sort, **FILTERS)
+
+
+def best_time(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark search result ranking")
+    parser.add_argument("--rows", type=int, default=50000, help="Number of restaurants to rank")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing repetitions (best is kept)")
+    args = parser.parse_args()
+
+    sample = [r for raw in listing_payloads() for r in iter_restaurants(raw)]
+    restaurants = [sample[i % len(sample)] for i in range(args.rows)]
+
+    rankers = [("sorted() baseline", baseline), ("rank (lists)", run_lists)]
+    if swiggy_rank._numpy() is not None:
+        rankers.append(("rank (numpy)", run_default))
+    else:
+        print("NumPy not installed; skipping the numpy backend")
+
+    print(f"{len(restaurants)} restaurants")
+    print(f"{'ranker':<20} {'sort':<8} {'ms':>10} {'kept':>8}")
+    for sort in ('rating', 'cost'):
+        for name, fn in rankers:
+            kept = len(fn(restaurants, sort))
+            elapsed = best_time(lambda: fn(restaurants, sort), args.repeat)
+            print(f"{name:<20} {sort:<8} {elapsed * 1000:>10.1f} {kept:>8}")
+
+
+if __name__ == "__main__":
+    main()
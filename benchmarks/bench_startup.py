@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Measure CLI startup cost with python -X importtime.
+
+  python benchmarks/bench_startup.py [--repeat N] [--budget-ms MS] [--top N]
+
+Runs commands that never touch the network (--help, logout) and reports the
+import time each spends beyond a bare interpreter, plus best-of-N wall time.
+Exits with status 1 if any command goes over the import budget or imports
+one of the heavy modules that are meant to load only on demand, so CI can
+run it as a check.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CASES = [
+    ("swiggy.py", ["--help"]),
+    ("swiggy.py", ["logout"]),
+    ("swiggy_v2.py", ["--help"]),
+]
+
+# Must not be imported by the commands above
+HEAVY_MODULES = ("requests", "urllib3", "asyncio", "sqlite3", "concurrent.futures")
+
+DEFAULT_BUDGET_MS = 40
+
+
+def run_importtime(argv, env):
+    """Return {module: self_us} for one interpreter run"""
+    result = subprocess.run([sys.executable, "-X", "importtime"] + argv, env=env,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = int(self_us)
+    return modules
+
+
+def wall_time(argv, env, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable] + argv, env=env,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark CLI startup imports")
+    parser.add_argument("--repeat", type=int, default=10, help="Wall-time repetitions (best is kept)")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS,
+                        help=f"Max import time beyond a bare interpreter (default: {DEFAULT_BUDGET_MS})")
+    parser.add_argument("--top", type=int, default=5, help="Slowest imports to list per command")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as home:
+        # A throwaway HOME so logout can't touch a real session
+        env = dict(os.environ, HOME=home, NO_COLOR="1")
+        baseline = run_importtime(["-c", "pass"], env)
+        bare = wall_time(["-c", "pass"], env, args.repeat)
+        print(f"bare interpreter: {bare * 1000:.1f} ms wall")
+        print(f"{'command':<26} {'imports ms':>10} {'wall ms':>8} {'modules':>8}")
+
+        failures = []
+        for script, script_args in CASES:
+            argv = [os.path.join(ROOT, script)] + script_args
+            modules = run_importtime(argv, env)
+            extra = {name: us for name, us in modules.items() if name not in baseline}
+            import_ms = sum(extra.values()) / 1000
+            wall = wall_time(argv, env, args.repeat)
+            label = " ".join([script] + script_args)
+            print(f"{label:<26} {import_ms:>10.1f} {wall * 1000:>8.1f} {len(extra):>8}")
+            for name, us in sorted(extra.items(), key=lambda item: -item[1])[:args.top]:
+                print(f"    {us / 1000:>6.1f} ms  {name}")
+
+            if import_ms > args.budget_ms:
+                failures.append(f"{label}: {import_ms:.1f} ms of imports (budget {args.budget_ms:g} ms)")
+            heavy = sorted(name for name in extra if name in HEAVY_MODULES)
+            if heavy:
+                failures.append(f"{label}: imports {', '.join(heavy)}")
+
+    if failures:
+        print("\nOver budget:")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+    print(f"\nAll commands within {args.budget_ms:g} ms import budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Offline benchmark suite: parsers, search, menu and the order monitor.
+
+  python benchmarks/bench_suite.py [--fixtures DIR] [--latency MS] [--error-rate P]
+                                   [--repeat N] [--only NAME] [--json OUT]
+                                   [--compare BASELINE] [--tolerance PCT]
+
+The client paths run against swiggy_fixtures.ReplayServer serving the
+exchanges recorded with `swiggy --record` (default benchmarks/fixtures).
+When none have been recorded, synthetic listing, menu and order exchanges
+are generated into a temporary directory instead. --latency and
+--error-rate are passed to the replay server.
+
+--json writes the results; a later run with --compare reports the change
+per case and exits with status 1 if any case's throughput dropped by more
+than --tolerance percent, so releases can be checked against each other.
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from payloads import listing_payloads, load_recorded, synthesize_listing, synthesize_menu, synthesize_order
+from swiggy import SwiggyClient
+from swiggy_async import iter_grid_search
+from swiggy_cache import ResponseCache
+from swiggy_fixtures import FIXTURES_DIR, FixtureRecorder, ReplayServer, load_exchanges
+from swiggy_index import MenuIndex
+from swiggy_monitor import OrderMonitor, iter_order_updates
+from swiggy_parse import iter_restaurants
+
+SEARCHES = 50
+GRID_POINTS = 32
+GRID_CONCURRENCY = 8
+MENUS = 50
+ORDERS = 8
+POLLS_PER_ORDER = 10
+
+
+def synthesize_fixtures(directory):
+    """Write synthetic exchanges in the --record layout"""
+    recorder = FixtureRecorder(directory)
+    base = "https://www.swiggy.com/dapi"
+
+    def save(name, endpoint, params, body):
+        response = SimpleNamespace(content=body, status_code=200,
+                                   headers={'Content-Type': 'application/json'})
+        recorder.save(name, "GET", f"{base}/{endpoint}", params, response)
+
+    for seed in range(10):
+        save("restaurants_list", "restaurants/list/v5",
+             {"lat": "12.9716", "lng": "77.5946", "search": f"query{seed}"}, synthesize_listing(seed))
+        save("menu_pl", "menu/pl", {"restaurant-menu-id": str(seed)}, synthesize_menu(seed))
+        save("orders", f"orders/{900000 + seed}", {"lat": "12.9716", "lng": "77.5946"},
+             synthesize_order(seed))
+
+
+# Each case takes the shared context and returns (operations, per-op latencies or None)
+
+def bench_parse_listing_dicts(ctx):
+    latencies = []
+    for raw in ctx.listings:
+        start = time.perf_counter()
+        SwiggyClient._parse_restaurants(None, json.loads(raw))
+        latencies.append(time.perf_counter() - start)
+    return len(latencies), latencies
+
+
+def bench_parse_listing_streaming(ctx):
+    latencies = []
+    for raw in ctx.listings:
+        start = time.perf_counter()
+        list(iter_restaurants(raw))
+        latencies.append(time.perf_counter() - start)
+    return len(latencies), latencies
+
+
+def bench_parse_menu(ctx):
+    latencies = []
+    for raw in ctx.menus:
+        start = time.perf_counter()
+        SwiggyClient._parse_menu(None, json.loads(raw))
+        latencies.append(time.perf_counter() - start)
+    return len(latencies), latencies
+
+
+def _timed_calls(fn, count):
+    latencies, failures = [], 0
+    for i in range(count):
+        start = time.perf_counter()
+        try:
+            fn(i)
+        except RuntimeError:
+            failures += 1
+        latencies.append(time.perf_counter() - start)
+    return latencies, failures
+
+
+def bench_search(ctx):
+    latencies, ctx.failures = _timed_calls(
+        lambda i: ctx.client.fetch_restaurants(f"query{i % 10}", "12.9716", "77.5946"), SEARCHES)
+    return len(latencies), latencies
+
+
+def bench_search_grid(ctx):
+    locations = [(f"{12.9 + i * 0.01:.2f}", "77.59") for i in range(GRID_POINTS)]
+    results = list(iter_grid_search(ctx.client, "pizza", locations, GRID_CONCURRENCY,
+                                    api_base=ctx.server.api_base))
+    ctx.failures = sum(1 for result in results if result.error is not None)
+    return len(results), None
+
+
+def bench_menu(ctx):
+    latencies, ctx.failures = _timed_calls(
+        lambda i: ctx.client.fetch_menu(str(i % 10), "12.9716", "77.5946"), MENUS)
+    return len(latencies), latencies
+
+
+def bench_monitor(ctx):
+    polls = {}
+
+    def fetch_status(order_id):
+        info = ctx.client.fetch_order_status(order_id, "12.9716", "77.5946")
+        count = polls[order_id] = polls.get(order_id, 0) + 1
+        # A new status every poll, so every poll produces an update
+        status = "Delivered" if count >= POLLS_PER_ORDER else f"Preparing ({count})"
+        return dict(info or {}, status=status)
+
+    monitor = OrderMonitor(fetch_status, interval=0, intervals={'preparing': 0, 'delivering': 0},
+                           coalesce_window=0)
+    updates = list(iter_order_updates(monitor, [str(900000 + i) for i in range(ORDERS)]))
+    ctx.failures = sum(1 for update in updates if update.error is not None)
+    return sum(polls.values()), None
+
+
+CASES = [
+    ("parse.listing.dicts", bench_parse_listing_dicts),
+    ("parse.listing.streaming", bench_parse_listing_streaming),
+    ("parse.menu", bench_parse_menu),
+    ("search.sequential", bench_search),
+    ("search.grid", bench_search_grid),
+    ("menu.fetch", bench_menu),
+    ("monitor.poll", bench_monitor),
+]
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))]
+
+
+def run_case(fn, ctx, repeat):
+    """Best-of-repeat throughput plus latency percentiles over every round"""
+    best, latencies, ops, failures = float("inf"), [], 0, 0
+    for _ in range(repeat):
+        ctx.failures = 0
+        start = time.perf_counter()
+        ops, round_latencies = fn(ctx)
+        best = min(best, time.perf_counter() - start)
+        failures += ctx.failures
+        latencies.extend(round_latencies or ())
+    result = {'ops': ops, 'seconds': best, 'ops_per_sec': ops / best if best else 0.0,
+              'failures': failures}
+    if latencies:
+        result['p50_ms'] = percentile(latencies, 50) * 1000
+        result['p95_ms'] = percentile(latencies, 95) * 1000
+    return result
+
+
+def compare(results, baseline_path, tolerance):
+    """Print throughput change per case; returns the names of regressed cases"""
+    with open(baseline_path) as f:
+        baseline = json.load(f)['results']
+    regressed = []
+    print(f"\n{'case':<26} {'baseline ops/s':>15} {'now ops/s':>12} {'change':>8}")
+    for name, result in results.items():
+        if name not in baseline or not baseline[name]['ops_per_sec']:
+            continue
+        before = baseline[name]['ops_per_sec']
+        change = (result['ops_per_sec'] - before) / before * 100
+        flag = ""
+        if change < -tolerance:
+            regressed.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:<26} {before:>15.1f} {result['ops_per_sec']:>12.1f} {change:>+7.1f}%{flag}")
+    return regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline benchmark suite for Swiggy CLI")
+    parser.add_argument("--fixtures", default=FIXTURES_DIR, help="Recorded exchanges directory")
+    parser.add_argument("--latency", type=float, default=0.0, metavar="MS",
+                        help="Replay server latency per response")
+    parser.add_argument("--error-rate", type=float, default=0.0, metavar="P",
+                        help="Fraction of replayed requests answered with HTTP 503")
+    parser.add_argument("--repeat", type=int, default=3, help="Rounds per case (best throughput is kept)")
+    parser.add_argument("--only", metavar="PREFIX", help="Run only cases whose name starts with PREFIX")
+    parser.add_argument("--json", metavar="OUT", help="Write results to OUT")
+    parser.add_argument("--compare", metavar="BASELINE", help="Compare against an earlier --json file")
+    parser.add_argument("--tolerance", type=float, default=10.0, metavar="PCT",
+                        help="Throughput drop that counts as a regression with --compare")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="swiggy-bench-")
+    try:
+        fixtures = args.fixtures
+        if not load_exchanges(fixtures):
+            fixtures = os.path.join(workdir, "fixtures")
+            synthesize_fixtures(fixtures)
+            print("No recorded exchanges; using synthetic fixtures")
+
+        with ReplayServer(fixtures, latency=args.latency / 1000.0, error_rate=args.error_rate,
+                          seed=0) as server:
+            ctx = SimpleNamespace(
+                server=server,
+                listings=listing_payloads(),
+                menus=load_recorded("menu_pl") or [synthesize_menu(seed) for seed in range(10)],
+                client=SwiggyClient(cache=ResponseCache(enabled=False),
+                                    menu_index=MenuIndex(os.path.join(workdir, "menu_index.db")),
+                                    api_base=server.api_base),
+                failures=0,
+            )
+            print(f"{len(server)} recorded exchange(s), latency {args.latency:g} ms, "
+                  f"error rate {args.error_rate:g}")
+            print(f"{'case':<26} {'ops':>6} {'ops/s':>10} {'p50 ms':>9} {'p95 ms':>9} {'failed':>7}")
+
+            results = {}
+            for name, fn in CASES:
+                if args.only and not name.startswith(args.only):
+                    continue
+                result = results[name] = run_case(fn, ctx, args.repeat)
+                p50 = f"{result['p50_ms']:.3f}" if 'p50_ms' in result else "-"
+                p95 = f"{result['p95_ms']:.3f}" if 'p95_ms' in result else "-"
+                print(f"{name:<26} {result['ops']:>6} {result['ops_per_sec']:>10.1f} "
+                      f"{p50:>9} {p95:>9} {result['failures']:>7}")
+            ctx.client.menu_index.close()
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({'created': time.time(), 'python': sys.version.split()[0],
+                       'latency_ms': args.latency, 'error_rate': args.error_rate,
+                       'results': results}, f, indent=2)
+    if args.compare:
+        regressed = compare(results, args.compare, args.tolerance)
+        if regressed:
+            print(f"\n{len(regressed)} case(s) regressed by more than {args.tolerance:g}%")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Benchmark payloads for Swiggy CLI
+
+Recorded response bodies are read from benchmarks/fixtures/<endpoint>/*.json.
+When none have been recorded, deterministic synthetic payloads shaped like
+real restaurants/list/v5 responses (banners, filter facets, carousels and
+restaurant grids) are generated instead; synthesize_menu,
+synthesize_nested_menu and synthesize_order do the same for menu/pl and
+orders/{id}.
+"""
+
+import glob
+import json
+import os
+import random
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+CUISINES = ["North Indian", "South Indian", "Chinese", "Biryani", "Pizzas", "Italian",
+            "Desserts", "Beverages", "Fast Food", "Kebabs", "Andhra", "Chettinad",
+            "Burgers", "Healthy Food", "Salads", "Bakery", "Ice Cream", "Thalis"]
+AREAS = ["Koramangala", "Indiranagar", "HSR Layout", "Jayanagar", "Whitefield",
+         "Marathahalli", "BTM Layout", "Malleshwaram", "JP Nagar", "Bellandur"]
+WORDS = ["Royal", "Spice", "Kitchen", "House", "Biryani", "Pizza", "Cafe", "Grill",
+         "Express", "Dhaba", "Corner", "Bowl", "Tandoor", "Meghana", "Empire", "Truffles"]
+
+
+def load_recorded(endpoint="restaurants_list"):
+    """Return recorded response bodies (bytes) for an endpoint fixture directory"""
+    bodies = []
+    for path in sorted(glob.glob(os.path.join(FIXTURES_DIR, endpoint, "*.json"))):
+        with open(path, "rb") as f:
+            bodies.append(f.read())
+    return bodies
+
+
+def _restaurant_card(rng, index):
+    rating = round(rng.uniform(3.2, 4.8), 1)
+    eta = rng.randint(15, 60)
+    area = rng.choice(AREAS)
+    info = {
+        "id": str(100000 + index * 37 + rng.randint(0, 36)),
+        "name": " ".join(rng.sample(WORDS, 2)),
+        "cloudinaryImageId": "%032x" % rng.getrandbits(128),
+        "locality": f"{rng.randint(1, 12)}th Block, {area}",
+        "areaName": area,
+        "costForTwo": f"₹{rng.choice([150, 200, 250, 300, 350, 400, 500, 600, 800])} for two",
+        "cuisines": rng.sample(CUISINES, rng.randint(1, 5)),
+        "avgRating": rating,
+        "parentId": str(rng.randint(1000, 999999)),
+        "avgRatingString": str(rating),
+        "totalRatingsString": rng.choice(["100+", "500+", "1K+", "5K+", "10K+"]),
+        "sla": {
+            "deliveryTime": eta,
+            "lastMileTravel": round(rng.uniform(0.5, 9.0), 1),
+            "serviceability": "SERVICEABLE",
+            "slaString": f"{eta}-{eta + 5} mins",
+            "lastMileTravelString": f"{rng.uniform(0.5, 9.0):.1f} km",
+            "iconType": "ICON_TYPE_EMPTY",
+        },
+        "availability": {"nextCloseTime": "2026-10-17 23:59:00", "opened": True},
+        "badges": {"imageBadges": [{"imageId": "v1695133679/badges/Pure_Veg111.png",
+                                    "description": "pureveg"}]},
+        "isOpen": rng.random() > 0.1,
+        "type": "F",
+        "badgesV2": {"entityBadges": {"imageBased": {}, "textBased": {}, "textExtendedBadges": {}}},
+        "aggregatedDiscountInfoV3": {"header": "20% OFF", "subHeader": "UPTO ₹50"},
+        "differentiatedUi": {"displayType": "ADS_UI_DISPLAY_TYPE_ENUM_DEFAULT",
+                             "differentiatedUiMediaDetails": {"lottie": {}, "video": {}}},
+        "reviewsSummary": {},
+        "displayType": "RESTAURANT_DISPLAY_TYPE_DEFAULT",
+        "restaurantOfferPresentationInfo": {},
+        "externalRatings": {"aggregatedRating": {"rating": "--"}},
+        "ratingsDisplayPreference": "RATINGS_DISPLAY_PREFERENCE_SHOW_SWIGGY",
+    }
+    return {
+        "info": info,
+        "analytics": {"context": "seo-data-%032x" % rng.getrandbits(128)},
+        "cta": {"link": f"https://www.swiggy.com/restaurants/{info['id']}",
+                "text": "RESTAURANT_MENU", "type": "WEBLINK"},
+        "widgetId": "collectionV5RestaurantListWidget_SimRestoRelevance_food_seo",
+    }
+
+
+def _grid_card(restaurants, widget_id):
+    return {"card": {"card": {
+        "@type": "type.googleapis.com/swiggy.gandalf.widgets.v2.GridWidget",
+        "header": {"title": "Restaurants with online food delivery"},
+        "layout": {"rows": 1, "columns": 4, "horizontalScrollEnabled": False,
+                   "itemSpacing": 12, "widgetPadding": {}, "containerStyle": {}},
+        "id": widget_id,
+        "gridElements": {"infoWithStyle": {
+            "@type": "type.googleapis.com/swiggy.presentation.food.v2.FavouriteRestaurantInfoWithStyle",
+            "restaurants": restaurants,
+            "theme": "Restaurant_Group_WebView_SEO_PB_Theme",
+            "style": {"width": {"type": "TYPE_RELATIVE", "value": 0.75}},
+        }},
+    }}}
+
+
+def synthesize_listing(seed=0, restaurants=48, grids=3):
+    """Generate one restaurants/list/v5 response body as bytes"""
+    rng = random.Random(seed)
+    banners = [{"id": rng.randint(1, 99999), "imageId": "%032x" % rng.getrandbits(128),
+                "action": {"link": "swiggy://collection/%d" % rng.randint(1, 99999),
+                           "type": "DEEPLINK", "text": rng.choice(CUISINES)},
+                "entityType": "BANNER", "accessibility": {"altText": "restaurants curated for"}}
+               for _ in range(20)]
+    facets = {name: [{"label": f"{name} {i}", "id": f"{name}-{i}", "selected": False,
+                      "operator": "OR", "openFilter": False}
+                      for i in range(12)]
+              for name in ("explore", "deliveryTime", "isVeg", "restaurantOfferMultiTd",
+                           "catalog_cuisines", "rating", "costForTwo")}
+    cards = [
+        {"card": {"card": {"@type": "type.googleapis.com/swiggy.gandalf.widgets.v2.GridWidget",
+                           "header": {"title": "What's on your mind?"},
+                           "imageGridCards": {"info": banners}, "id": "whats_on_your_mind"}}},
+        {"card": {"card": {"@type": "type.googleapis.com/swiggy.gandalf.widgets.v2.InlineViewFilterSortWidget",
+                           "facetList": facets, "sortConfigs": [
+                               {"key": k, "title": k} for k in ("relevance", "deliveryTimeAsc",
+                                                                "modelBasedRatingDesc", "costForTwoAsc")]}}},
+    ]
+    per_grid = max(1, restaurants // grids)
+    index = seed * 1000
+    for g in range(grids):
+        batch = [_restaurant_card(rng, index + i) for i in range(per_grid)]
+        index += per_grid
+        cards.append(_grid_card(batch, f"restaurant_grid_listing_{g}"))
+    cards.append({"card": {"card": {"@type": "type.googleapis.com/swiggy.seo.widgets.v1.FooterContent",
+                                    "cities": [{"text": area, "link": area.lower()} for area in AREAS * 20]}}})
+    payload = {
+        "statusCode": 0,
+        "data": {"statusMessage": "done successfully",
+                 "pageOffset": {"nextOffset": "CJhlELQ4KIDIqfL2kcnQQzCnEzgD", "widgetOffset": {}},
+                 "cards": cards,
+                 "firstOffsetRequest": True, "isQCLink": False},
+        "tid": "%032x" % rng.getrandbits(128),
+        "sid": "%032x" % rng.getrandbits(128),
+        "deviceId": "%032x" % rng.getrandbits(128),
+        "csrfToken": "%032x" % rng.getrandbits(128),
+    }
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+def synthesize_menu(seed=0, items=60):
+    """Generate one menu/pl response body (flat items list) as bytes"""
+    rng = random.Random(seed)
+    payload = {
+        "statusCode": 0,
+        "data": {"items": [
+            {"id": str(seed * 1000 + i),
+             "name": " ".join(rng.sample(WORDS, 2)),
+             "price": rng.choice([99, 149, 199, 249, 299, 349, 449]) * 100,
+             "description": " ".join(rng.choice(WORDS).lower() for _ in range(rng.randint(4, 16))),
+             "isVeg": rng.random() < 0.5}
+            for i in range(items)]},
+    }
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+def synthesize_nested_menu(seed=0, items=500, categories=20):
+    """
+    Generate one menu/pl response body in the live API's nested shape:
+    info and offer cards, then a groupedCard whose REGULAR cards are item
+    categories, every fifth one a NestedItemCategory with subcategories
+    """
+    rng = random.Random(seed)
+    type_base = "type.googleapis.com/swiggy.presentation.food.v2."
+
+    def item_card(i, category):
+        info = {"id": str(seed * 10000 + i), "name": " ".join(rng.sample(WORDS, 2)),
+                "category": category,
+                "description": " ".join(rng.choice(WORDS).lower() for _ in range(rng.randint(4, 16))),
+                "imageId": f"img{rng.randrange(10 ** 8)}", "inStock": 1,
+                "itemAttribute": {"vegClassifier": rng.choice(["VEG", "NONVEG"])},
+                "ribbon": {}, "showImage": True, "itemBadge": {}, "badgesV2": {},
+                "ratings": {"aggregatedRating": {"rating": f"{rng.uniform(3, 5):.1f}",
+                                                 "ratingCount": f"{rng.randint(5, 500)} ratings"}}}
+        if rng.random() < 0.2:
+            info["defaultPrice"] = rng.choice([99, 149, 199, 249, 299]) * 100
+        else:
+            info["price"] = rng.choice([99, 149, 199, 249, 299, 349, 449]) * 100
+        if info["itemAttribute"]["vegClassifier"] == "VEG":
+            info["isVeg"] = 1
+        return {"card": {"@type": type_base + "Dish", "info": info, "analytics": {}}, "hideRestaurantDetails": True}
+
+    per_category = max(1, items // categories)
+    regular = [{"card": {"card": {"@type": type_base + "MenuVegFilterAndBadge", "isPureVeg": False}}}]
+    n = 0
+    for c in range(categories):
+        title = f"{rng.choice(CUISINES)} {c + 1}"
+        if c % 5 == 4:
+            subs = []
+            for half in range(2):
+                sub_title = f"{title} {'Veg' if half == 0 else 'Non Veg'}"
+                subs.append({"title": sub_title, "categoryId": str(c * 10 + half),
+                             "itemCards": [item_card(n + i, sub_title) for i in range(per_category // 2)]})
+                n += per_category // 2
+            regular.append({"card": {"card": {"@type": type_base + "NestedItemCategory",
+                                              "title": title, "categories": subs}}})
+        else:
+            regular.append({"card": {"card": {"@type": type_base + "ItemCategory", "title": title,
+                                              "itemCards": [item_card(n + i, title) for i in range(per_category)]}}})
+            n += per_category
+    payload = {
+        "statusCode": 0,
+        "data": {"cards": [
+            {"card": {"card": {"@type": type_base + "Restaurant",
+                               "info": {"id": str(seed), "name": " ".join(rng.sample(WORDS, 2)),
+                                        "cuisines": rng.sample(CUISINES, 3)}}}},
+            {"card": {"card": {"@type": type_base + "Offers",
+                               "gridElements": {"infoWithStyle": {"offers": [
+                                   {"info": {"header": f"{rng.randint(10, 60)}% OFF"}} for _ in range(4)]}}}}},
+            {"groupedCard": {"cardGroupMap": {"REGULAR": {"cards": regular}}}},
+        ]},
+    }
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+def synthesize_order(seed=0, status="Preparing"):
+    """Generate one orders/{id} response body as bytes"""
+    rng = random.Random(seed)
+    payload = {
+        "statusCode": 0,
+        "data": {"orderId": str(900000 + seed), "status": status,
+                 "eta": f"{rng.randint(10, 45)} mins", "deliveryPartner": rng.choice(WORDS),
+                 "restaurantName": " ".join(rng.sample(WORDS, 2)),
+                 "total": rng.randint(200, 1500), "trackingUrl": "",
+                 "items": [{"name": rng.choice(WORDS), "quantity": rng.randint(1, 3)}
+                           for _ in range(rng.randint(1, 5))]},
+    }
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+def listing_payloads(count=10):
+    """Recorded listing bodies if any exist, otherwise `count` synthetic ones"""
+    bodies = load_recorded("restaurants_list")
+    if bodies:
+        return bodies
+    return [synthesize_listing(seed) for seed in range(count)]
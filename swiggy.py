@@ -4,87 +4,189 @@ Swiggy CLI Tool - Place and monitor orders via unofficial API
 """
 
 import argparse
-import json
-import requests
-import time
+import atexit
 import sys
-from datetime import datetime
+import threading
 from getpass import getpass
 import os
 
+import swiggy_commands
+from swiggy_cache import ResponseCache
+from swiggy_commands import (Colors, bbox_arg, compact_snapshot_file, finish_profile, plan_coverage,
+                             positive_int, prefetch, print_color, print_error, print_info,
+                             print_order_update, print_restaurants, print_success, print_warning,
+                             rank_order, ranking_requested, run_bench_load, run_daemon, save_snapshot,
+                             search_grid, sync_catalog, watch_search, weights_arg, write_output)
+from swiggy_output import FORMATS
+from swiggy_json import decode_restaurants, loads as json_loads
+from swiggy_menu import parse_menu
+from swiggy_parse import Restaurant
+from swiggy_profile import NULL_PROFILER, Profiler
+from swiggy_rank import SORT_KEYS
+from swiggy_ratelimit import DEFAULT_CONCURRENCY, SHARED_STATE_FILE, RateLimiter
+from swiggy_session import SessionStore
+from swiggy_singleflight import SingleFlight
+
+# requests, asyncio, sqlite3 and concurrent.futures are imported by the
+# commands that use them (swiggy_transport, swiggy_async, swiggy_monitor,
+# swiggy_index, swiggy_prefetch) so --help, login and logout start fast
+
 # Configuration
 CONFIG_DIR = os.path.expanduser("~/.swiggy-cli")
 CONFIG_FILE = os.path.join(CONFIG_DIR, "config.json")
 SESSION_FILE = os.path.join(CONFIG_DIR, "session.json")
+SOCKET_FILE = os.path.join(CONFIG_DIR, "daemon.sock")
 
 # Swiggy API endpoints (unofficial)
 BASE_URL = "https://www.swiggy.com"
 API_BASE = "https://www.swiggy.com/dapi"
 
-# Colors for terminal output
-class Colors:
-    GREEN = '\033[92m'
-    YELLOW = '\033[93m'
-    RED = '\033[91m'
-    BLUE = '\033[94m'
-    MAGENTA = '\033[95m'
-    CYAN = '\033[96m'
-    WHITE = '\033[97m'
-    RESET = '\033[0m'
-    BOLD = '\033[1m'
-
-def print_color(message, color=Colors.WHITE):
-    """Print colored message to terminal"""
-    print(f"{color}{message}{Colors.RESET}")
-
-def print_success(message):
-    print_color(f"✓ {message}", Colors.GREEN)
-
-def print_error(message):
-    print_color(f"✗ {message}", Colors.RED)
-
-def print_warning(message):
-    print_color(f"⚠ {message}", Colors.YELLOW)
-
-def print_info(message):
-    print_color(f"ℹ {message}", Colors.BLUE)
-
 class SwiggyClient:
-    def __init__(self):
-        self.session = requests.Session()
+    def __init__(self, cache=None, menu_index=None, profiler=None, rate_limiter=None,
+                 api_base=API_BASE, recorder=None):
+        self._lock = threading.Lock()
+        self._session_lock = threading.Lock()
+        self._transport = None
+        self.api_base = api_base
+        # FixtureRecorder set by --record
+        self.recorder = recorder
+        self.profiler = profiler if profiler is not None else NULL_PROFILER
+        self.rate_limiter = rate_limiter
+        # session.json is read on the first authenticated request, not here
+        self.sessions = SessionStore(SESSION_FILE)
         self.session_data = {}
-        self.load_session()
+        self._session_loaded = False
+        self.cache = cache if cache is not None else ResponseCache()
+        self._menu_index = menu_index
+        # Identical concurrent GETs share one request (threads, async executors, daemon)
+        self.flights = SingleFlight()
+        # DaemonConnection set by main() when `swiggy daemon` is running
+        self.daemon = None
+
+    @property
+    def transport(self):
+        """Shared HTTP transport, created (and requests imported) on first use"""
+        with self._lock:
+            if self._transport is None:
+                from swiggy_transport import SwiggyTransport
+                transport = SwiggyTransport(self.api_base)
+                # Outermost hook, so the profiler times requests without limiter waits
+                if self.rate_limiter is not None:
+                    transport.add_hook(self.rate_limiter.transport_hook)
+                if self.profiler is not NULL_PROFILER:
+                    transport.add_hook(self.profiler.transport_hook)
+                # Innermost, so fixtures hold exactly what the server sent
+                if self.recorder is not None:
+                    transport.add_hook(self.recorder.transport_hook)
+                if self._session_loaded:
+                    self._apply_session(transport.session)
+                self._transport = transport
+            return self._transport
+
+    @property
+    def session(self):
+        return self.transport.session
+
+    @property
+    def menu_index(self):
+        """Local menu index, opened on first use"""
+        with self._lock:
+            if self._menu_index is None:
+                from swiggy_index import MenuIndex
+                self._menu_index = MenuIndex()
+            return self._menu_index
+
+    def _forward(self, command, **params):
+        """
+        Run a command on the daemon if one is attached.
+        Returns (True, result), or (False, None) when it must run in-process.
+        """
+        if self.daemon is None:
+            return False, None
+        from swiggy_daemon import DaemonUnavailable
+        try:
+            return True, self.daemon.call(command, **params)
+        except DaemonUnavailable:
+            # Daemon stopped since startup; handle this and later calls locally
+            self.daemon = None
+            return False, None
 
     def ensure_config_dir(self):
         """Create config directory if it doesn't exist"""
         os.makedirs(CONFIG_DIR, exist_ok=True)
 
     def load_session(self):
-        """Load saved session from file"""
-        if os.path.exists(SESSION_FILE):
-            try:
-                with open(SESSION_FILE, 'r') as f:
-                    self.session_data = json.load(f)
-                    # Set session cookies
-                    if 'cookies' in self.session_data:
-                        for name, value in self.session_data['cookies'].items():
-                            self.session.cookies.set(name, value)
-                    # Set auth headers
-                    if 'headers' in self.session_data:
-                        self.session.headers.update(self.session_data['headers'])
-            except Exception as e:
-                print_error(f"Failed to load session: {e}")
-                self.session_data = {}
+        """Load the saved session and apply it to the transport"""
+        try:
+            self.session_data = self.sessions.load()
+        except (OSError, ValueError) as e:
+            print_error(f"Failed to load session: {e}")
+            self.session_data = {}
+        self._session_loaded = True
+        if self._transport is not None:
+            self._apply_session(self._transport.session)
+
+    def ensure_session(self):
+        """
+        Load the saved session before the first authenticated request.
+        Threads share the transport's cookie jar, so this runs once per
+        process (and again after reload_session).
+        """
+        if self._session_loaded:
+            return
+        with self._session_lock:
+            if not self._session_loaded:
+                self.load_session()
+
+    def reload_session(self):
+        """Drop the in-memory session if another process changed session.json"""
+        if not self._session_loaded or not self.sessions.changed():
+            return
+        with self._session_lock:
+            self.session_data = {}
+            self._session_loaded = False
+            if self._transport is not None:
+                self._transport.session.cookies.clear()
+
+    def _apply_session(self, session):
+        """Set saved cookies and auth headers on a requests session"""
+        for name, value in self.session_data.get('cookies', {}).items():
+            session.cookies.set(name, value)
+        session.headers.update(self.session_data.get('headers', {}))
 
     def save_session(self):
         """Save session to file"""
-        self.ensure_config_dir()
-        self.session_data['cookies'] = dict(self.session.cookies)
-        self.session_data['headers'] = dict(self.session.headers)
-        with open(SESSION_FILE, 'w') as f:
-            json.dump(self.session_data, f, indent=2)
+        self.session_data = self.sessions.update({
+            'cookies': self.session.cookies.get_dict(),
+            'headers': dict(self.session.headers),
+        })
+        self._session_loaded = True
         print_success("Session saved")
 
+    def _cached_get(self, endpoint, params, auth=False):
+        """
+        GET an API endpoint (e.g. 'menu/pl') through the response cache.
+        Returns (status_code, body); only 200 responses are cached. With
+        auth, the saved session is loaded before going to the network.
+        """
+        body = self.cache.get(endpoint, params)
+        if body is not None:
+            self.profiler.cache_hit(endpoint)
+            return 200, body
+
+        def fetch():
+            if auth:
+                self.ensure_session()
+            response = self.transport.get(endpoint, params=params)
+            if response.status_code == 200:
+                self.cache.put(endpoint, params, response.content)
+            return response.status_code, response.content
+
+        result, shared = self.flights.do(self.cache.key(endpoint, params), fetch)
+        if shared:
+            self.profiler.coalesced(endpoint)
+        return result
+
     def login(self):
         """Login using email/phone and OTP"""
         print_info("Swiggy Login")
@@ -129,6 +231,8 @@ class SwiggyClient:
 
             cookies = input("Paste Cookie header value: ").strip()
             if cookies:
+                # Keep saved cookies the new header doesn't replace
+                self.ensure_session()
                 # Parse cookies
                 cookie_dict = {}
                 for item in cookies.split(';'):
@@ -151,49 +255,53 @@ class SwiggyClient:
 
     def logout(self):
         """Clear session"""
-        if os.path.exists(SESSION_FILE):
-            os.remove(SESSION_FILE)
+        self.sessions.clear()
         self.session_data = {}
-        self.session.cookies.clear()
+        self._session_loaded = True
+        if self._transport is not None:
+            self._transport.session.cookies.clear()
         print_success("Logged out successfully")
 
     def search_restaurants(self, query, lat=None, lng=None):
         """Search for restaurants"""
+        print_info(f"Searching for '{query}'...")
+
+        try:
+            restaurants = self.fetch_restaurants(query, lat, lng)
+            print_success(f"Found {len(restaurants)} restaurant(s)")
+            return restaurants
+
+        except Exception as e:
+            print_error(f"Search failed: {e}")
+            return []
+
+    def fetch_restaurants(self, query, lat=None, lng=None):
+        """
+        Fetch and parse search results without printing anything.
+        Raises on HTTP errors; safe to call from worker threads.
+        """
+        forwarded, result = self._forward('search', query=query, lat=lat, lng=lng)
+        if forwarded:
+            return [Restaurant(*r) for r in result]
+
         if not lat or not lng:
             # Use default Bangalore coordinates
             lat = "12.9716"
             lng = "77.5946"
 
-        print_info(f"Searching for '{query}'...")
-
-        try:
-            url = f"{API_BASE}/restaurants/list/v5"
-            params = {
-                "lat": lat,
-                "lng": lng,
-                "search": query
-            }
-
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                "Accept": "application/json",
-                "Referer": "https://www.swiggy.com/"
-            }
+        params = {
+            "lat": lat,
+            "lng": lng,
+            "search": query
+        }
 
-            response = self.session.get(url, params=params, headers=headers)
+        status_code, body = self._cached_get("restaurants/list/v5", params)
 
-            if response.status_code == 200:
-                data = response.json()
-                restaurants = self._parse_restaurants(data)
-                print_success(f"Found {len(restaurants)} restaurant(s)")
-                return restaurants
-            else:
-                print_error(f"Search failed: HTTP {response.status_code}")
-                return []
+        if status_code != 200:
+            raise RuntimeError(f"HTTP {status_code}")
 
-        except Exception as e:
-            print_error(f"Search failed: {e}")
-            return []
+        with self.profiler.span("parse:restaurants"):
+            return decode_restaurants(body)
 
     def _parse_restaurants(self, data):
         """Parse restaurant data from API response"""
@@ -240,83 +348,75 @@ class SwiggyClient:
 
         return restaurants
 
-    def get_menu(self, restaurant_id, lat=None, lng=None):
+    def get_menu(self, restaurant_id, lat=None, lng=None, category=None, limit=None):
         """Get menu for a restaurant"""
-        if not lat or not lng:
-            lat = "12.9716"
-            lng = "77.5946"
-
         print_info(f"Fetching menu for restaurant ID: {restaurant_id}")
 
         try:
-            url = f"{API_BASE}/menu/pl"
-            params = {
-                "lat": lat,
-                "lng": lng,
-                "page-type": "REGULAR_MENU",
-                "complete-menu": "true",
-                "restaurant-menu-id": restaurant_id
-            }
-
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                "Accept": "application/json",
-                "Referer": "https://www.swiggy.com/"
-            }
-
-            response = self.session.get(url, params=params, headers=headers)
-
-            if response.status_code == 200:
-                data = response.json()
-                menu_items = self._parse_menu(data)
-                print_success(f"Found {len(menu_items)} menu item(s)")
-                return menu_items
-            else:
-                print_error(f"Failed to fetch menu: HTTP {response.status_code}")
-                print_warning("Note: Menu endpoint may require authentication (cookies)")
-                print_info("Run './swiggy login' to add cookies from your browser session")
-                return None
+            menu_items = self.fetch_menu(restaurant_id, lat, lng, category, limit)
+            print_success(f"Found {len(menu_items)} menu item(s)")
+            return menu_items
 
+        except RuntimeError as e:
+            print_error(f"Failed to fetch menu: {e}")
+            print_warning("Note: Menu endpoint may require authentication (cookies)")
+            print_info("Run './swiggy login' to add cookies from your browser session")
+            return None
         except Exception as e:
             print_error(f"Failed to fetch menu: {e}")
             return None
 
-    def _parse_menu(self, data):
-        """Parse menu items from API response"""
-        menu_items = []
+    def fetch_menu(self, restaurant_id, lat=None, lng=None, category=None, limit=None):
+        """
+        Fetch, parse and index a restaurant's menu without printing progress.
+        With category (a title substring) or limit, parsing stops once those
+        items are found and the partial menu is not indexed.
+        Raises RuntimeError on HTTP errors; safe to call from worker threads.
+        """
+        forwarded, result = self._forward('menu', restaurant_id=restaurant_id, lat=lat, lng=lng,
+                                          category=category, limit=limit)
+        if forwarded:
+            return result
 
-        if 'data' not in data:
-            return menu_items
+        if not lat or not lng:
+            lat = "12.9716"
+            lng = "77.5946"
 
-        # Try different response structures
-        menu_data = data['data']
-
-        # Structure 1: Direct items array
-        if 'items' in menu_data:
-            for item in menu_data['items']:
-                menu_items.append({
-                    'id': item.get('id', ''),
-                    'name': item.get('name', ''),
-                    'price': item.get('price', 0),
-                    'description': item.get('description', ''),
-                    'isVeg': item.get('isVeg', True)
-                })
+        params = {
+            "lat": lat,
+            "lng": lng,
+            "page-type": "REGULAR_MENU",
+            "complete-menu": "true",
+            "restaurant-menu-id": restaurant_id
+        }
+
+        status_code, body = self._cached_get("menu/pl", params, auth=True)
 
-        # Structure 2: Categories with items
-        elif 'menu' in menu_data:
-            menu_obj = menu_data['menu']
-            if 'items' in menu_obj:
-                for item in menu_obj['items']:
-                    menu_items.append({
-                        'id': item.get('id', ''),
-                        'name': item.get('name', ''),
-                        'price': item.get('price', 0),
-                        'description': item.get('description', ''),
-                        'isVeg': item.get('isVeg', True)
-                    })
+        if status_code != 200:
+            raise RuntimeError(f"HTTP {status_code}")
 
+        with self.profiler.span("decode:menu"):
+            data = json_loads(body)
+        with self.profiler.span("parse:menu"):
+            menu_items = parse_menu(data, category, limit)
+        if category is None and limit is None:
+            with self.profiler.span("index:menu"):
+                self._index_menu(restaurant_id, menu_items)
         return menu_items
 
+    def _index_menu(self, restaurant_id, menu_items):
+        """Add a fetched menu to the local index searched by find-item"""
+        import sqlite3
+
+        try:
+            self.menu_index.add_menu(restaurant_id, menu_items)
+        except sqlite3.Error as e:
+            print_warning(f"Could not update menu index: {e}")
+
+    def _parse_menu(self, data):
+        """Parse menu items from API response (flat or nested category cards)"""
+        return parse_menu(data)
+
     def place_order(self, items, restaurant_id, address_id=None, lat=None, lng=None):
         """
         Place an order
@@ -339,13 +439,8 @@ class SwiggyClient:
                 "paymentMode": "UPI"  # Can be changed
             }
 
-            url = f"{API_BASE}/checkout/place-order"
-            headers = {
-                "Content-Type": "application/json",
-                "User-Agent": "Mozilla/5.0"
-            }
-
-            response = self.session.post(url, json=payload, headers=headers)
+            self.ensure_session()
+            response = self.transport.post("checkout/place-order", json=payload)
 
             if response.status_code == 200:
                 data = response.json()
@@ -367,38 +462,45 @@ class SwiggyClient:
 
     def get_order_status(self, order_id, lat=None, lng=None):
         """Get status of an order"""
-        if not lat or not lng:
-            lat = "12.9716"
-            lng = "77.5946"
-
         print_info(f"Checking status for order {order_id}")
 
         try:
-            url = f"{API_BASE}/orders/{order_id}"
-            params = {"lat": lat, "lng": lng}
-
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                "Accept": "application/json",
-                "Referer": "https://www.swiggy.com/"
-            }
-
-            response = self.session.get(url, params=params, headers=headers)
-
-            if response.status_code == 200:
-                data = response.json()
-                status_info = self._parse_order_status(data)
-                return status_info
-            else:
-                print_error(f"Failed to get status: HTTP {response.status_code}")
-                print_warning("Note: Order status requires authentication (cookies)")
-                print_info("Run './swiggy login' to add cookies from your browser session")
-                return None
+            return self.fetch_order_status(order_id, lat, lng)
 
+        except RuntimeError as e:
+            print_error(f"Failed to get status: {e}")
+            print_warning("Note: Order status requires authentication (cookies)")
+            print_info("Run './swiggy login' to add cookies from your browser session")
+            return None
         except Exception as e:
             print_error(f"Failed to get order status: {e}")
             return None
 
+    def fetch_order_status(self, order_id, lat=None, lng=None):
+        """
+        Fetch and parse an order's status without printing anything.
+        Raises RuntimeError on HTTP errors.
+        """
+        forwarded, result = self._forward('status', order_id=order_id, lat=lat, lng=lng)
+        if forwarded:
+            return result
+
+        if not lat or not lng:
+            lat = "12.9716"
+            lng = "77.5946"
+
+        params = {"lat": lat, "lng": lng}
+
+        status_code, body = self._cached_get(f"orders/{order_id}", params, auth=True)
+
+        if status_code != 200:
+            raise RuntimeError(f"HTTP {status_code}")
+
+        with self.profiler.span("decode:order"):
+            data = json_loads(body)
+        with self.profiler.span("parse:order"):
+            return self._parse_order_status(data)
+
     def _parse_order_status(self, data):
         """Parse order status from API response"""
         if 'data' not in data:
@@ -426,20 +528,16 @@ class SwiggyClient:
         print_info("Fetching active orders...")
 
         try:
-            url = f"{API_BASE}/orders/list"
             params = {"lat": lat, "lng": lng}
 
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                "Accept": "application/json",
-                "Referer": "https://www.swiggy.com/"
-            }
-
-            response = self.session.get(url, params=params, headers=headers)
+            self.ensure_session()
+            response = self.transport.get("orders/list", params=params)
 
             if response.status_code == 200:
-                data = response.json()
-                orders = self._parse_orders(data)
+                with self.profiler.span("decode:orders"):
+                    data = json_loads(response.content)
+                with self.profiler.span("parse:orders"):
+                    orders = self._parse_orders(data)
                 print_success(f"Found {len(orders)} active order(s)")
                 return orders
             else:
@@ -452,6 +550,23 @@ class SwiggyClient:
             print_error(f"Failed to fetch orders: {e}")
             return []
 
+    def fetch_active_orders(self, lat=None, lng=None):
+        """Fetch active orders keyed by order ID, without printing anything"""
+        if not lat or not lng:
+            lat = "12.9716"
+            lng = "77.5946"
+
+        self.ensure_session()
+        response = self.transport.get("orders/list", params={"lat": lat, "lng": lng})
+
+        if response.status_code != 200:
+            raise RuntimeError(f"HTTP {response.status_code}")
+
+        with self.profiler.span("decode:orders"):
+            data = json_loads(response.content)
+        with self.profiler.span("parse:orders"):
+            return {order['orderId']: order for order in self._parse_orders(data)}
+
     def _parse_orders(self, data):
         """Parse orders list from API response"""
         orders = []
@@ -487,45 +602,31 @@ class SwiggyClient:
 
         return orders
 
-    def monitor_order(self, order_id, interval=30, lat=None, lng=None):
-        """Monitor order status continuously"""
-        if not lat or not lng:
-            lat = "12.9716"
-            lng = "77.5946"
-
-        print_info(f"Monitoring order {order_id} (Ctrl+C to stop)")
-        print("-" * 60)
-
-        last_status = None
-
-        try:
-            while True:
-                status_info = self.get_order_status(order_id, lat, lng)
-
-                if status_info:
-                    current_status = status_info.get('status', 'unknown')
-                    timestamp = datetime.now().strftime("%H:%M:%S")
-
-                    if current_status != last_status:
-                        print_color(f"[{timestamp}] ", Colors.CYAN, end="")
-                        print_color(f"Status: {current_status.upper()}", Colors.BOLD)
+    def monitor_order(self, order_ids, interval=30, lat=None, lng=None):
+        """
+        Monitor one or more orders until each reaches a final status.
+        Polling speeds up once an order is out for delivery.
+        """
+        if isinstance(order_ids, str):
+            order_ids = [order_ids]
 
-                        # Print additional details
-                        if status_info.get('eta'):
-                            print_info(f"ETA: {status_info['eta']}")
-                        if status_info.get('deliveryPartner'):
-                            print_info(f"Delivery Partner: {status_info['deliveryPartner']}")
+        from swiggy_monitor import OrderMonitor, iter_order_updates
 
-                        last_status = current_status
+        monitor = OrderMonitor(
+            lambda order_id: self.fetch_order_status(order_id, lat, lng),
+            fetch_many=lambda: self.fetch_active_orders(lat, lng),
+            interval=interval
+        )
 
-                        # Stop monitoring if order is completed
-                        if current_status.lower() in ['delivered', 'cancelled', 'failed']:
-                            print_color("\n" + "="*60, Colors.GREEN)
-                            print_success(f"Order {current_status}")
-                            print_color("="*60 + "\n", Colors.GREEN)
-                            break
+        if len(order_ids) == 1:
+            print_info(f"Monitoring order {order_ids[0]} (Ctrl+C to stop)")
+        else:
+            print_info(f"Monitoring {len(order_ids)} orders (Ctrl+C to stop)")
+        print("-" * 60)
 
-                time.sleep(interval)
+        try:
+            for update in iter_order_updates(monitor, order_ids):
+                print_order_update(update, show_id=len(order_ids) > 1)
 
         except KeyboardInterrupt:
             print("\n")
@@ -542,18 +643,52 @@ def main():
 Examples:
   swiggy.py login                          # Login to your account
   swiggy.py search "pizza"                 # Search for restaurants
+  swiggy.py search "pizza" --grid grid.csv # Search many locations at once
   swiggy.py menu <restaurant-id>           # Get restaurant menu
   swiggy.py status <order-id>              # Check order status
   swiggy.py monitor <order-id>             # Monitor order live
+  swiggy.py monitor <id1> <id2> ...        # Monitor several orders at once
   swiggy.py orders                         # List active orders
+  swiggy.py sync "pizza" --grid grid.csv   # Print catalog changes since last sync
+  swiggy.py plan "pizza" --bbox 12.85,77.5,13.1,77.75  # Pick points covering an area
+  swiggy.py snapshot compact pizza.snap    # Merge snapshot segments for faster reads
+  swiggy.py daemon &                       # Serve later commands from a warm client
+  swiggy.py --replay bench load --rps 200   # Capacity-test search offline
         """
     )
 
     parser.add_argument('--lat', help='Latitude for location', default="12.9716")
     parser.add_argument('--lng', help='Longitude for location', default="77.5946")
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Bypass the response cache (no reads or writes)')
+    parser.add_argument('--no-rate-limit', action='store_true',
+                        help='Disable the adaptive per-endpoint request throttle')
+    parser.add_argument('--shared-rate-limit', action='store_true',
+                        help='Share the request throttle with other swiggy processes')
+    parser.add_argument('--no-daemon', action='store_true',
+                        help='Run in-process even when a daemon is running')
+    parser.add_argument('--profile', action='store_true',
+                        help='Print request, parse and render timings to stderr at exit')
+    parser.add_argument('--profile-trace', metavar='FILE',
+                        help='With --profile, also write a Chrome trace JSON to FILE')
+    parser.add_argument('--record', nargs='?', const='', metavar='DIR',
+                        help='Save search/menu/order responses as fixtures (default: benchmarks/fixtures)')
+    parser.add_argument('--replay', nargs='?', const='', metavar='DIR',
+                        help='Serve API requests from recorded fixtures on a local server instead of swiggy.com')
+    parser.add_argument('--replay-latency', type=float, default=0.0, metavar='MS',
+                        help='With --replay, delay each response by MS milliseconds')
+    parser.add_argument('--replay-error-rate', type=float, default=0.0, metavar='P',
+                        help='With --replay, answer this fraction of requests with HTTP 503')
+    parser.add_argument('--refresh', action='store_true',
+                        help='Ignore cached responses but store fresh ones')
 
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
 
+    # Shared --format option for commands that return records
+    format_parser = argparse.ArgumentParser(add_help=False)
+    format_parser.add_argument('--format', choices=FORMATS, default='text',
+                               help='Output format (default: text); machine formats are never truncated')
+
     # Login command
     subparsers.add_parser('login', help='Login to Swiggy account')
 
@@ -561,33 +696,188 @@ Examples:
     subparsers.add_parser('logout', help='Logout and clear session')
 
     # Search command
-    search_parser = subparsers.add_parser('search', help='Search restaurants')
+    search_parser = subparsers.add_parser('search', help='Search restaurants', parents=[format_parser])
     search_parser.add_argument('query', help='Search query')
+    search_parser.add_argument('--grid', metavar='CSV',
+                               help='CSV file of lat,lng points to search concurrently')
+    search_parser.add_argument('--concurrency', type=positive_int, default=DEFAULT_CONCURRENCY,
+                               help='Max requests in flight with --grid (default: %(default)s)')
+    search_parser.add_argument('--rate', type=float, default=None,
+                               help='Max requests per second to the API host with --grid')
+    search_parser.add_argument('--snapshot', metavar='FILE',
+                               help='Append results to a columnar snapshot file (see swiggy_snapshot.py)')
+    search_parser.add_argument('--merge', action='store_true',
+                               help='With --grid, one record per restaurant with its delivery time at each location')
+    search_parser.add_argument('--sort', choices=SORT_KEYS,
+                               help='Order results by rating, delivery time, cost for two or weighted score')
+    search_parser.add_argument('--min-rating', type=float, metavar='R', help='Only restaurants rated at least R')
+    search_parser.add_argument('--max-eta', type=float, metavar='MIN',
+                               help='Only restaurants delivering within MIN minutes')
+    search_parser.add_argument('--open-only', action='store_true', help='Only restaurants that are open now')
+    search_parser.add_argument('--weights', type=weights_arg, metavar='SPEC',
+                               help='Score weights, e.g. rating=0.5,eta=0.3,cost=0.2 (implies --sort score)')
+    search_parser.add_argument('--watch', type=float, metavar='SECONDS',
+                               help='Re-run the search every SECONDS, updating changed rows in place')
 
     # Menu command
-    menu_parser = subparsers.add_parser('menu', help='Get restaurant menu')
-    menu_parser.add_argument('restaurant_id', help='Restaurant ID')
+    menu_parser = subparsers.add_parser('menu', help='Get restaurant menu', parents=[format_parser])
+    menu_parser.add_argument('restaurant_id', nargs='?', help='Restaurant ID')
+    menu_parser.add_argument('--ids-file', metavar='FILE',
+                             help='Fetch menus for every restaurant ID in FILE (one per line)')
+    menu_parser.add_argument('--workers', type=positive_int,
+                             help='Parallel fetches with --ids-file (default: 8)')
+    menu_parser.add_argument('--out', default='menus.jsonl',
+                             help='JSONL output for --ids-file; reruns resume from it (default: menus.jsonl)')
+    menu_parser.add_argument('--category', metavar='NAME',
+                             help='Only items in categories whose title contains NAME')
+    menu_parser.add_argument('--limit', type=int, metavar='N',
+                             help='Stop after N items (skips the menu index)')
 
     # Status command
-    status_parser = subparsers.add_parser('status', help='Get order status')
+    status_parser = subparsers.add_parser('status', help='Get order status', parents=[format_parser])
     status_parser.add_argument('order_id', help='Order ID')
 
     # Monitor command
     monitor_parser = subparsers.add_parser('monitor', help='Monitor order status live')
-    monitor_parser.add_argument('order_id', help='Order ID')
+    monitor_parser.add_argument('order_ids', nargs='+', metavar='order_id', help='Order ID(s)')
     monitor_parser.add_argument('--interval', type=int, default=30,
-                               help='Update interval in seconds (default: 30)')
+                               help='Poll interval in seconds before an order has a known phase (default: 30)')
 
     # Orders command
-    subparsers.add_parser('orders', help='List active orders')
+    subparsers.add_parser('orders', help='List active orders', parents=[format_parser])
+
+    # Find-item command
+    find_parser = subparsers.add_parser('find-item', help='Search menu items across cached restaurants')
+    find_parser.add_argument('query', help='Item name or description words')
+    find_parser.add_argument('--max-price', type=float, help='Maximum price in rupees')
+    find_parser.add_argument('--veg', action='store_true', help='Only vegetarian items')
+    find_parser.add_argument('--limit', type=int, default=20, help='Max results (default: 20)')
+
+    # Sync command
+    sync_parser = subparsers.add_parser('sync', help='Update the restaurant catalog and print changes as JSONL')
+    sync_parser.add_argument('query', help='Search query')
+    sync_parser.add_argument('--grid', metavar='CSV', help='CSV file of lat,lng points to sync')
+    sync_parser.add_argument('--concurrency', type=positive_int, default=DEFAULT_CONCURRENCY,
+                             help='Max requests in flight with --grid (default: %(default)s)')
+    sync_parser.add_argument('--rate', type=float, default=None,
+                             help='Max requests per second to the API host with --grid')
+    sync_parser.add_argument('--out', metavar='FILE', help='Append changes to FILE instead of stdout')
+
+    # Plan command
+    plan_parser = subparsers.add_parser('plan', help='Pick search points covering an area with few requests')
+    plan_parser.add_argument('query', help='Search query')
+    area = plan_parser.add_mutually_exclusive_group(required=True)
+    area.add_argument('--bbox', type=bbox_arg, metavar='S,W,N,E',
+                      help='Bounding box as south,west,north,east')
+    area.add_argument('--polygon', metavar='CSV', help='CSV file of lat,lng polygon vertices')
+    plan_parser.add_argument('--cell', type=float, default=4.0, metavar='KM',
+                             help='Starting cell size (default: 4)')
+    plan_parser.add_argument('--min-cell', type=float, default=0.5, metavar='KM',
+                             help='Cells are not split below this size (default: 0.5)')
+    plan_parser.add_argument('--similarity', type=float, default=0.9, metavar='F',
+                             help='A cell is uniform when every point returns this fraction of its restaurants '
+                                  '(default: 0.9)')
+    plan_parser.add_argument('--min-new', type=int, default=1, metavar='N',
+                             help='Only split cells whose new points found N unseen restaurants (default: 1)')
+    plan_parser.add_argument('--max-requests', type=int, metavar='N', help='Stop after about N searches')
+    plan_parser.add_argument('--concurrency', type=positive_int, default=DEFAULT_CONCURRENCY,
+                             help='Max requests in flight (default: %(default)s)')
+    plan_parser.add_argument('--rate', type=float, default=None, help='Max requests per second to the API host')
+    plan_parser.add_argument('--out', default='plan.csv',
+                             help='Grid CSV of the searched points (default: plan.csv)')
+
+    # Daemon command
+    daemon_parser = subparsers.add_parser('daemon', help='Keep a warm client running for faster commands')
+    daemon_parser.add_argument('--stop', action='store_true', help='Stop the running daemon')
+
+    # Snapshot command
+    snapshot_parser = subparsers.add_parser('snapshot', help='Maintain --snapshot files')
+    snapshot_commands = snapshot_parser.add_subparsers(dest='snapshot_command', required=True)
+    compact_parser = snapshot_commands.add_parser(
+        'compact', help='Rewrite a snapshot file as one segment so reads map it without copying')
+    compact_parser.add_argument('file', help='Snapshot file')
+
+    # Bench command
+    bench_parser = subparsers.add_parser('bench', help='Capacity-test the client against a mock API')
+    bench_commands = bench_parser.add_subparsers(dest='bench_command', required=True)
+    load_parser = bench_commands.add_parser(
+        'load', help='Search at a fixed rate against replayed fixtures and report capacity')
+    load_parser.add_argument('--query', default='pizza', help='Search query (default: pizza)')
+    load_parser.add_argument('--rps', type=float, default=50.0,
+                             help='Requests per second to offer; 0 = as fast as possible (default: 50)')
+    load_parser.add_argument('--concurrency', type=positive_int, default=8, help='Worker threads (default: 8)')
+    load_parser.add_argument('--duration', type=float, default=10.0, help='Seconds to run (default: 10)')
+    load_parser.add_argument('--grid', metavar='CSV', help='Cycle searches through these lat,lng points')
+    load_parser.add_argument('--parser', choices=('dicts', 'streaming', 'fast'), default='dicts',
+                             help='JSON decode + _parse_restaurants, the streaming parser, or the '
+                                  'fastest decode_restaurants backend (default: dicts)')
+    load_parser.add_argument('--target', metavar='URL',
+                             help='API base of a mock server (default: replay benchmarks/fixtures, or --replay)')
+    load_parser.add_argument('--json', action='store_true', help='Print the report as JSON')
 
     args = parser.parse_args()
 
+    if args.command == 'menu' and not (args.restaurant_id or args.ids_file):
+        menu_parser.error("a restaurant ID or --ids-file is required")
+    if args.command == 'menu' and args.limit is not None and args.limit < 1:
+        menu_parser.error("--limit must be at least 1")
+    if args.command == 'search' and args.watch is not None:
+        if args.watch <= 0:
+            search_parser.error("--watch must be greater than 0")
+        if args.grid or args.format != 'text':
+            search_parser.error("--watch works with single-location text output only")
+
+    if getattr(args, 'format', 'text') != 'text' or args.command == 'sync':
+        # Keep stdout clean for the records
+        swiggy_commands.STATUS_STREAM = sys.stderr
+
     if not args.command:
         parser.print_help()
         sys.exit(1)
 
-    client = SwiggyClient()
+    profiler = None
+    if args.profile or args.profile_trace:
+        profiler = Profiler()
+        atexit.register(finish_profile, profiler, args.profile_trace)
+
+    rate_limiter = None
+    if not args.no_rate_limit:
+        try:
+            rate_limiter = RateLimiter(shared_path=SHARED_STATE_FILE if args.shared_rate_limit else None)
+        except (OSError, RuntimeError) as e:
+            print_error(f"Rate limiter unavailable: {e}")
+            sys.exit(1)
+
+    api_base = API_BASE
+    if args.replay is not None:
+        from swiggy_fixtures import FIXTURES_DIR, ReplayServer
+        replay = ReplayServer(args.replay or FIXTURES_DIR, latency=args.replay_latency / 1000.0,
+                              error_rate=args.replay_error_rate).start()
+        atexit.register(replay.stop)
+        if not len(replay):
+            print_warning(f"No recorded exchanges in {args.replay or FIXTURES_DIR}")
+        api_base = replay.api_base
+
+    recorder = None
+    if args.record is not None:
+        from swiggy_fixtures import FIXTURES_DIR, FixtureRecorder
+        recorder = FixtureRecorder(args.record or FIXTURES_DIR)
+
+    # Replayed responses never enter the real cache; recording, --watch and
+    # sync always fetch (they exist to see changes) but still store what they get
+    client = SwiggyClient(cache=ResponseCache(enabled=not (args.no_cache or args.replay is not None),
+                                              refresh=args.refresh or recorder is not None
+                                              or getattr(args, 'watch', None) is not None
+                                              or args.command == 'sync'),
+                          profiler=profiler, rate_limiter=rate_limiter,
+                          api_base=api_base, recorder=recorder)
+
+    # Hand search/menu/status to a running daemon unless flags change how they run
+    if (args.command in ('search', 'menu', 'status') and not args.no_daemon
+            and not (args.no_cache or args.refresh or profiler or api_base != API_BASE or recorder
+                     or getattr(args, 'watch', None) is not None)):
+        from swiggy_daemon import connect
+        client.daemon = connect(SOCKET_FILE)
 
     # Execute commands
     if args.command == 'login':
@@ -597,81 +887,128 @@ Examples:
         client.logout()
 
     elif args.command == 'search':
-        restaurants = client.search_restaurants(args.query, args.lat, args.lng)
-        if restaurants:
-            print("\n" + "="*60)
-            for i, r in enumerate(restaurants[:10], 1):
-                name = r.get('name', 'Unknown')
-                cuisines = ', '.join(r.get('cuisines', []))
-                rating = r.get('avgRatingString', 'N/A')
-                total_ratings = r.get('totalRatingsString', '0')
-                delivery_time = r.get('deliveryTimeStr', 'N/A')
-                cost = r.get('costForTwo', 'N/A')
-                locality = r.get('locality', '')
-                area = r.get('areaName', '')
-                location = f"{locality}, {area}" if locality else area
-                is_open = "Open" if r.get('isOpen', False) else "Closed"
-
-                print_color(f"{i}. {name}", Colors.BOLD)
-                print(f"   Rating: {rating} ({total_ratings}) | Delivery: {delivery_time} | {is_open}")
-                print(f"   Cuisine: {cuisines}")
-                print(f"   Cost: {cost} | {location}")
-                print(f"   ID: {r.get('id', 'N/A')}")
-                print()
+        if args.watch is not None:
+            watch_search(client, args)
+        elif args.grid:
+            search_grid(client, args)
+        else:
+            restaurants = client.search_restaurants(args.query, args.lat, args.lng)
+            # The snapshot archives everything the API returned, unfiltered
+            if args.snapshot and restaurants:
+                save_snapshot(args, [(r, args.lat, args.lng) for r in restaurants])
+            if ranking_requested(args) and restaurants:
+                restaurants = [restaurants[i] for i in rank_order(client, args, restaurants)]
+                if not restaurants:
+                    print_warning("No restaurants match the filters")
+            with client.profiler.span("render"):
+                if args.format != 'text':
+                    write_output(args, restaurants, 'restaurant')
+                elif restaurants:
+                    print("\n" + "="*60)
+                    print_restaurants(restaurants[:10])
 
     elif args.command == 'menu':
-        menu_items = client.get_menu(args.restaurant_id, args.lat, args.lng)
-        if menu_items:
-            print("\n" + "="*60)
-            print_color("MENU", Colors.BOLD)
-            print("="*60)
-            for i, item in enumerate(menu_items[:20], 1):
-                name = item.get('name', 'Unknown')
-                price = item.get('price', 0)
-                veg_indicator = "🟢" if item.get('isVeg', True) else "🔴"
-                description = item.get('description', '')
-
-                print_color(f"{i}. {veg_indicator} {name}", Colors.WHITE)
-                print(f"   Price: ₹{price}")
-                if description:
-                    print(f"   {description[:80]}{'...' if len(description) > 80 else ''}")
-                print()
+        if args.ids_file:
+            prefetch(client, args)
+        else:
+            menu_items = client.get_menu(args.restaurant_id, args.lat, args.lng, args.category, args.limit)
+            with client.profiler.span("render"):
+                if args.format != 'text':
+                    write_output(args, menu_items or [], 'menu_item')
+                elif menu_items:
+                    print("\n" + "="*60)
+                    print_color("MENU", Colors.BOLD)
+                    print("="*60)
+                    category = None
+                    for i, item in enumerate(menu_items if args.limit else menu_items[:20], 1):
+                        if item.get('category') and item['category'] != category:
+                            category = item['category']
+                            print_color(category, Colors.BOLD)
+                        name = item.get('name', 'Unknown')
+                        price = (item.get('price') or 0) / 100  # Convert paise to rupees
+                        veg_indicator = "🟢" if item.get('isVeg', True) else "🔴"
+                        description = item.get('description', '')
+
+                        print_color(f"{i}. {veg_indicator} {name}", Colors.WHITE)
+                        print(f"   Price: ₹{price:g}")
+                        if description:
+                            print(f"   {description[:80]}{'...' if len(description) > 80 else ''}")
+                        print()
 
     elif args.command == 'status':
         status = client.get_order_status(args.order_id, args.lat, args.lng)
-        if status:
-            print("\n" + "="*60)
-            print_color(f"Order: {status.get('orderId', args.order_id)}", Colors.BOLD)
-            print("="*60)
-            print(f"Status: {status.get('status', 'Unknown')}")
-            if status.get('eta'):
-                print(f"ETA: {status.get('eta')}")
-            if status.get('restaurantName'):
-                print(f"Restaurant: {status.get('restaurantName')}")
-            if status.get('total'):
-                print(f"Total: ₹{status.get('total')}")
-            if status.get('deliveryPartner'):
-                print(f"Delivery Partner: {status.get('deliveryPartner')}")
-            print()
+        with client.profiler.span("render"):
+            if args.format != 'text':
+                write_output(args, [status] if status else [], 'order_status')
+            elif status:
+                print("\n" + "="*60)
+                print_color(f"Order: {status.get('orderId', args.order_id)}", Colors.BOLD)
+                print("="*60)
+                print(f"Status: {status.get('status', 'Unknown')}")
+                if status.get('eta'):
+                    print(f"ETA: {status.get('eta')}")
+                if status.get('restaurantName'):
+                    print(f"Restaurant: {status.get('restaurantName')}")
+                if status.get('total'):
+                    print(f"Total: ₹{status.get('total')}")
+                if status.get('deliveryPartner'):
+                    print(f"Delivery Partner: {status.get('deliveryPartner')}")
+                print()
 
     elif args.command == 'monitor':
-        client.monitor_order(args.order_id, args.interval)
+        client.monitor_order(args.order_ids, args.interval, args.lat, args.lng)
 
     elif args.command == 'orders':
         orders = client.list_active_orders(args.lat, args.lng)
-        if orders:
+        with client.profiler.span("render"):
+            if args.format != 'text':
+                write_output(args, orders, 'order')
+            elif orders:
+                print("\n" + "="*60)
+                print_color("ACTIVE ORDERS", Colors.BOLD)
+                print("="*60)
+                for order in orders:
+                    print_color(f"Order ID: {order.get('orderId', 'N/A')}", Colors.CYAN)
+                    print(f"Status: {order.get('status', 'Unknown')}")
+                    print(f"Restaurant: {order.get('restaurantName', 'N/A')}")
+                    print(f"Total: ₹{order.get('total', 'N/A')}")
+                    if order.get('eta'):
+                        print(f"ETA: {order.get('eta')}")
+                    if order.get('orderDate'):
+                        print(f"Date: {order.get('orderDate')}")
+                    print()
+
+    elif args.command == 'sync':
+        sync_catalog(client, args)
+
+    elif args.command == 'plan':
+        plan_coverage(client, args)
+
+    elif args.command == 'daemon':
+        run_daemon(client, args, SOCKET_FILE)
+
+    elif args.command == 'snapshot':
+        compact_snapshot_file(args)
+
+    elif args.command == 'bench':
+        run_bench_load(client, args)
+
+    elif args.command == 'find-item':
+        max_price = round(args.max_price * 100) if args.max_price is not None else None
+        matches = client.menu_index.search(args.query, max_price, True if args.veg else None, args.limit)
+        if not matches:
+            print_warning("No matching items in the menu index")
+            print_info("Menus are indexed as you fetch them with 'menu <restaurant-id>'")
+        else:
             print("\n" + "="*60)
-            print_color("ACTIVE ORDERS", Colors.BOLD)
+            print_color(f"ITEMS MATCHING '{args.query}'", Colors.BOLD)
             print("="*60)
-            for order in orders:
-                print_color(f"Order ID: {order.get('orderId', 'N/A')}", Colors.CYAN)
-                print(f"Status: {order.get('status', 'Unknown')}")
-                print(f"Restaurant: {order.get('restaurantName', 'N/A')}")
-                print(f"Total: ₹{order.get('total', 'N/A')}")
-                if order.get('eta'):
-                    print(f"ETA: {order.get('eta')}")
-                if order.get('orderDate'):
-                    print(f"Date: {order.get('orderDate')}")
+            for i, item in enumerate(matches, 1):
+                veg_indicator = "🟢" if item.is_veg else "🔴"
+                print_color(f"{i}. {veg_indicator} {item.name}", Colors.WHITE)
+                print(f"   Price: ₹{item.price / 100:g} | Restaurant ID: {item.restaurant_id}")
+                if item.description:
+                    print(f"   {item.description[:80]}{'...' if len(item.description) > 80 else ''}")
                 print()
 
 
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Async multi-location search for Swiggy CLI
+
+Runs SwiggyClient.fetch_restaurants for many lat/lng points at once with a
+bounded number of requests in flight, and yields each location's results as
+soon as its response arrives.
+"""
+
+import asyncio
+import csv
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+from swiggy_ratelimit import DEFAULT_CONCURRENCY
+
+# One finished location; exactly one of restaurants/error is set
+SearchResult = namedtuple('SearchResult', ['lat', 'lng', 'restaurants', 'error'])
+
+
+def load_grid(path):
+    """
+    Load lat/lng points from a CSV file.
+    Accepts an optional header row (lat,lng); blank lines and lines
+    starting with '#' are skipped.
+    """
+    locations = []
+    with open(path, newline='') as f:
+        for row in csv.reader(f):
+            if not row or not row[0].strip() or row[0].lstrip().startswith('#'):
+                continue
+            if len(row) < 2:
+                raise ValueError(f"{path}: expected 'lat,lng' but got {','.join(row)!r}")
+            lat, lng = row[0].strip(), row[1].strip()
+            try:
+                float(lat)
+                float(lng)
+            except ValueError:
+                # Header row
+                if not locations and lat.lower().startswith('lat'):
+                    continue
+                raise ValueError(f"{path}: invalid coordinates {lat!r}, {lng!r}")
+            locations.append((lat, lng))
+    return locations
+
+
+class HostRateLimiter:
+    """Space out request starts so each host sees at most `rate` requests/second"""
+
+    def __init__(self, rate=None):
+        self.interval = 1.0 / rate if rate else 0
+        self._next_slot = {}
+
+    async def wait(self, host):
+        if not self.interval:
+            return
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        slot = max(now, self._next_slot.get(host, now))
+        self._next_slot[host] = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+class AsyncSearchEngine:
+    """
+    Fan a search query out over many locations.
+    The blocking client call runs in a thread pool sized to the concurrency
+    limit, so up to `concurrency` requests are in flight at any time.
+    """
+
+    def __init__(self, client, concurrency=DEFAULT_CONCURRENCY, rate=None, api_base=None):
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self.client = client
+        self.concurrency = concurrency
+        self.limiter = HostRateLimiter(rate)
+        self.host = urlparse(api_base).netloc if api_base else ''
+        self._size_pool()
+
+    def _size_pool(self):
+        """Let the client's transport keep one pooled connection per worker"""
+        transport = getattr(self.client, 'transport', None)
+        if transport is not None:
+            transport.resize_pool(self.concurrency)
+
+    async def search(self, query, locations):
+        """Async generator yielding a SearchResult per location in completion order"""
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(self.concurrency)
+        executor = ThreadPoolExecutor(max_workers=self.concurrency)
+
+        async def fetch(lat, lng):
+            async with semaphore:
+                await self.limiter.wait(self.host)
+                try:
+                    restaurants = await loop.run_in_executor(
+                        executor, self.client.fetch_restaurants, query, lat, lng)
+                except Exception as e:
+                    return SearchResult(lat, lng, None, e)
+                return SearchResult(lat, lng, restaurants, None)
+
+        tasks = [asyncio.ensure_future(fetch(lat, lng)) for lat, lng in locations]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            executor.shutdown(wait=False)
+
+
+def iter_async(agen):
+    """
+    Drive an async generator from synchronous code on a private event loop.
+    Work already handed to executor threads keeps running while the caller
+    handles each item.
+
+    An exception raised while a step is running (Ctrl+C lands inside
+    run_until_complete) cancels every pending task and waits for them to
+    unwind, then propagates unchanged.
+    """
+    loop = asyncio.new_event_loop()
+    try:
+        while True:
+            step = asyncio.ensure_future(agen.__anext__(), loop=loop)
+            try:
+                item = loop.run_until_complete(step)
+            except StopAsyncIteration:
+                break
+            except BaseException:
+                # The generator is still suspended inside this step, so it
+                # can't be closed until the cancellation has run through it
+                _cancel_pending(loop)
+                raise
+            yield item
+    finally:
+        try:
+            loop.run_until_complete(agen.aclose())
+        finally:
+            loop.close()
+
+
+def _cancel_pending(loop):
+    tasks = [task for task in asyncio.all_tasks(loop) if not task.done()]
+    for task in tasks:
+        task.cancel()
+    if tasks:
+        loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+
+
+def iter_grid_search(client, query, locations, concurrency=DEFAULT_CONCURRENCY,
+                     rate=None, api_base=None):
+    """Synchronous wrapper around AsyncSearchEngine.search"""
+    engine = AsyncSearchEngine(client, concurrency, rate, api_base)
+    return iter_async(engine.search(query, locations))
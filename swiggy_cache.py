@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+On-disk response cache for Swiggy CLI
+
+Raw response bodies from the /dapi endpoints are stored under
+~/.swiggy-cli/cache, keyed on endpoint plus normalized query params.
+Each endpoint family has its own TTL, and the directory is capped in size
+with least-recently-used eviction (a cache hit refreshes the file's mtime).
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from urllib.parse import urlencode
+
+CACHE_DIR = os.path.expanduser("~/.swiggy-cli/cache")
+
+# Seconds a response stays fresh, by endpoint prefix (longest match wins).
+# A TTL of 0 disables caching for that endpoint.
+DEFAULT_TTLS = {
+    "restaurants/list": 5 * 60,
+    "menu/pl": 24 * 60 * 60,
+    "orders": 0,
+}
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Evict down to this fraction of max_bytes so every write doesn't trigger a scan
+EVICT_TARGET = 0.9
+
+
+def _normalize_param(name, value):
+    value = str(value).strip()
+    if name in ("lat", "lng"):
+        try:
+            return f"{float(value):.6f}"
+        except ValueError:
+            return value
+    if name == "search":
+        return " ".join(value.lower().split())
+    return value
+
+
+class ResponseCache:
+    """
+    Persistent TTL + LRU cache of raw response bodies.
+    enabled=False bypasses the cache entirely (--no-cache); refresh=True
+    skips lookups but still stores fresh responses (--refresh).
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR, ttls=None, max_bytes=DEFAULT_MAX_BYTES,
+                 enabled=True, refresh=False):
+        self.cache_dir = cache_dir
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self.refresh = refresh
+        self._size = None
+
+    def ttl_for(self, endpoint):
+        """TTL in seconds for an endpoint path such as 'menu/pl' or 'orders/123'"""
+        best = None
+        for prefix in self.ttls:
+            if endpoint == prefix or endpoint.startswith(prefix + "/"):
+                if best is None or len(prefix) > len(best):
+                    best = prefix
+        return self.ttls[best] if best is not None else 0
+
+    def key(self, endpoint, params=None):
+        items = sorted((name, _normalize_param(name, value))
+                       for name, value in (params or {}).items())
+        raw = f"{endpoint}?{urlencode(items)}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key)
+
+    def get(self, endpoint, params=None):
+        """Return the cached body as bytes, or None on a miss"""
+        if not self.enabled or self.refresh or self.ttl_for(endpoint) <= 0:
+            return None
+
+        path = self._path(self.key(endpoint, params))
+        try:
+            with open(path, "rb") as f:
+                meta = json.loads(f.readline())
+                if meta.get("expires", 0) < time.time():
+                    return None
+                body = f.read()
+        except (OSError, ValueError):
+            return None
+
+        try:
+            # Mark as recently used for LRU eviction
+            os.utime(path)
+        except OSError:
+            pass
+        return body
+
+    def put(self, endpoint, params, body):
+        """Store a response body if the endpoint is cacheable"""
+        ttl = self.ttl_for(endpoint)
+        if not self.enabled or ttl <= 0:
+            return
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        meta = json.dumps({"endpoint": endpoint, "expires": time.time() + ttl})
+        path = self._path(self.key(endpoint, params))
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(meta.encode("utf-8") + b"\n")
+                f.write(body)
+            os.replace(tmp_path, path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return
+
+        if self._size is None:
+            self._size = self._scan_size()
+        else:
+            self._size += len(body) + len(meta) + 1
+        if self._size > self.max_bytes:
+            self.evict()
+
+    def _entries(self):
+        entries = []
+        try:
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    if entry.is_file() and not entry.name.startswith("."):
+                        stat = entry.stat()
+                        entries.append((stat.st_mtime, stat.st_size, entry.path))
+        except OSError:
+            pass
+        return entries
+
+    def _scan_size(self):
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self):
+        """Delete least recently used entries until under the size cap"""
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        target = self.max_bytes * EVICT_TARGET
+        for _, size, path in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+        self._size = total
+
+    def clear(self):
+        """Remove every cached response"""
+        for _, _, path in self._entries():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        self._size = 0
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Incremental restaurant catalog for Swiggy CLI
+
+`swiggy sync` stores the restaurants a search returns in a SQLite catalog,
+keyed by restaurant id within a sync scope (the query plus the set of
+locations searched), together with a content hash of the normalized
+record. Each later sync of the same scope compares hashes and reports only
+what changed: new restaurants, removed ones and per-field changes.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+CATALOG_FILE = os.path.expanduser("~/.swiggy-cli/catalog.db")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS restaurants (
+    scope TEXT NOT NULL,
+    id TEXT NOT NULL,
+    hash TEXT NOT NULL,
+    record TEXT NOT NULL,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL,
+    PRIMARY KEY (scope, id)
+);
+CREATE TABLE IF NOT EXISTS syncs (
+    scope TEXT PRIMARY KEY,
+    query TEXT NOT NULL,
+    locations INTEGER NOT NULL,
+    synced_at REAL NOT NULL
+);
+"""
+
+
+def _canonical(record):
+    return json.dumps(record, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+
+
+def content_hash(record):
+    """Stable hash of a restaurant record (dict of normalized fields)"""
+    return hashlib.blake2b(_canonical(record).encode('utf-8'), digest_size=16).hexdigest()
+
+
+def scope_key(query, locations):
+    """Sync scope for a query over a list of (lat, lng) points"""
+    query = " ".join(query.lower().split())
+    points = sorted(f"{float(lat):.6f},{float(lng):.6f}" for lat, lng in locations)
+    return f"{query}@" + hashlib.blake2b("|".join(points).encode('ascii'), digest_size=8).hexdigest()
+
+
+def _as_dict(restaurant):
+    if hasattr(restaurant, '_asdict'):
+        return restaurant._asdict()
+    return dict(restaurant)
+
+
+class Catalog:
+    """
+    SQLite-backed restaurant store that diffs each sync against the last one.
+    One connection is shared by all threads and serialized with a lock.
+    """
+
+    def __init__(self, path=CATALOG_FILE):
+        self.path = path
+        self._conn = None
+        self._lock = threading.RLock()
+
+    @property
+    def conn(self):
+        with self._lock:
+            if self._conn is None:
+                if self.path != ':memory:':
+                    os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                conn = sqlite3.connect(self.path, check_same_thread=False)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.executescript(SCHEMA)
+                self._conn = conn
+            return self._conn
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def sync(self, scope, query, restaurants, locations=1, complete=True):
+        """
+        Record the restaurants seen by one sync of `scope` and return the
+        differences from the previous sync as a list of dicts:
+
+          {'op': 'new', 'id', 'name', 'record'}
+          {'op': 'changed', 'id', 'name', 'changes': {field: {'old', 'new'}}}
+          {'op': 'removed', 'id', 'name', 'record'}
+
+        With complete=False (some locations failed) nothing is reported or
+        deleted as removed, since a missing restaurant may just be unfetched.
+        """
+        now = time.time()
+        seen = {}
+        for restaurant in restaurants:
+            record = _as_dict(restaurant)
+            seen.setdefault(str(record['id']), record)
+
+        conn = self.conn
+        with self._lock, conn:
+            stored = {row[0]: (row[1], row[2]) for row in conn.execute(
+                "SELECT id, hash, record FROM restaurants WHERE scope = ?", (scope,))}
+
+            diffs, upserts, touched = [], [], []
+            for restaurant_id, record in seen.items():
+                digest = content_hash(record)
+                previous = stored.get(restaurant_id)
+                if previous is None:
+                    diffs.append({'op': 'new', 'id': restaurant_id, 'name': record.get('name'),
+                                  'record': record})
+                    upserts.append((scope, restaurant_id, digest, _canonical(record), now, now))
+                elif previous[0] != digest:
+                    # Only records whose hash moved are decoded and compared
+                    old = json.loads(previous[1])
+                    changes = {field: {'old': old.get(field), 'new': value}
+                               for field, value in record.items() if old.get(field) != value}
+                    changes.update({field: {'old': value, 'new': None}
+                                    for field, value in old.items() if field not in record})
+                    diffs.append({'op': 'changed', 'id': restaurant_id, 'name': record.get('name'),
+                                  'changes': changes})
+                    upserts.append((scope, restaurant_id, digest, _canonical(record), now, now))
+                else:
+                    touched.append((now, scope, restaurant_id))
+
+            removed = [restaurant_id for restaurant_id in stored if restaurant_id not in seen] if complete else []
+            for restaurant_id in removed:
+                old = json.loads(stored[restaurant_id][1])
+                diffs.append({'op': 'removed', 'id': restaurant_id, 'name': old.get('name'),
+                              'record': old})
+
+            # first_seen is kept for rows that already exist
+            conn.executemany(
+                "INSERT INTO restaurants (scope, id, hash, record, first_seen, last_seen) "
+                "VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (scope, id) DO UPDATE SET hash = excluded.hash, "
+                "record = excluded.record, last_seen = excluded.last_seen", upserts)
+            conn.executemany("UPDATE restaurants SET last_seen = ? WHERE scope = ? AND id = ?", touched)
+            conn.executemany("DELETE FROM restaurants WHERE scope = ? AND id = ?",
+                             [(scope, restaurant_id) for restaurant_id in removed])
+            conn.execute("INSERT OR REPLACE INTO syncs (scope, query, locations, synced_at) VALUES (?, ?, ?, ?)",
+                         (scope, query, locations, now))
+        return diffs
+
+    def last_sync(self, scope):
+        """Timestamp of the previous sync of `scope`, or None"""
+        with self._lock:
+            row = self.conn.execute("SELECT synced_at FROM syncs WHERE scope = ?", (scope,)).fetchone()
+        return row[0] if row else None
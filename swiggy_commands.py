@@ -0,0 +1,654 @@
+"""
+Terminal output and the commands shared by swiggy.py and swiggy_v2.py
+
+Both CLIs build their own SwiggyClient and argument parser, then hand the
+grid, watch, plan, sync, prefetch, bench and daemon commands to the
+functions here. Anything heavier than the standard library is imported
+inside the command that needs it, keeping CLI startup fast.
+"""
+
+import argparse
+import json
+import os
+import sys
+from datetime import datetime
+
+from swiggy_json import decode_restaurants, loads as json_loads
+from swiggy_output import open_writer
+from swiggy_parse import iter_restaurants
+from swiggy_rank import parse_weights
+
+# Colors for terminal output
+class Colors:
+    GREEN = '\033[92m'
+    YELLOW = '\033[93m'
+    RED = '\033[91m'
+    BLUE = '\033[94m'
+    MAGENTA = '\033[95m'
+    CYAN = '\033[96m'
+    WHITE = '\033[97m'
+    RESET = '\033[0m'
+    BOLD = '\033[1m'
+
+# Plain text when output is piped/redirected or NO_COLOR is set
+if not sys.stdout.isatty() or os.environ.get('NO_COLOR'):
+    for _name in ('GREEN', 'YELLOW', 'RED', 'BLUE', 'MAGENTA', 'CYAN', 'WHITE', 'RESET', 'BOLD'):
+        setattr(Colors, _name, '')
+
+# Progress messages go here; each CLI's main() points it at stderr for --format output
+STATUS_STREAM = None
+
+def print_color(message, color=Colors.WHITE, end="\n", file=None):
+    """Print colored message to terminal"""
+    print(f"{color}{message}{Colors.RESET}", end=end, file=file)
+
+def print_success(message):
+    print_color(f"✓ {message}", Colors.GREEN, file=STATUS_STREAM)
+
+def print_error(message):
+    print_color(f"✗ {message}", Colors.RED, file=STATUS_STREAM)
+
+def print_warning(message):
+    print_color(f"⚠ {message}", Colors.YELLOW, file=STATUS_STREAM)
+
+def print_info(message):
+    print_color(f"ℹ {message}", Colors.BLUE, file=STATUS_STREAM)
+
+
+def print_order_update(update, show_id=False):
+    """Print a status change reported by OrderMonitor"""
+    timestamp = datetime.now().strftime("%H:%M:%S")
+    prefix = f"Order {update.order_id} - " if show_id else ""
+
+    if update.error is not None:
+        print_warning(f"[{timestamp}] {prefix}Status check failed: {update.error}")
+        return
+
+    print_color(f"[{timestamp}] ", Colors.CYAN, end="")
+    print_color(f"{prefix}Status: {update.status.upper()}", Colors.BOLD)
+
+    # Print additional details
+    if update.info.get('eta'):
+        print_info(f"ETA: {update.info['eta']}")
+    if update.info.get('deliveryPartner'):
+        print_info(f"Delivery Partner: {update.info['deliveryPartner']}")
+
+    if update.phase == 'terminal':
+        print_color("\n" + "="*60, Colors.GREEN)
+        print_success(f"{prefix}Order {update.status}")
+        print_color("="*60 + "\n", Colors.GREEN)
+
+
+def print_restaurants(restaurants, start=1):
+    """Print restaurant search results"""
+    for i, r in enumerate(restaurants, start):
+        name = r.get('name', 'Unknown')
+        cuisines = ', '.join(r.get('cuisines', []))
+        rating = r.get('avgRatingString', 'N/A')
+        total_ratings = r.get('totalRatingsString', '0')
+        delivery_time = r.get('deliveryTimeStr', 'N/A')
+        cost = r.get('costForTwo', 'N/A')
+        locality = r.get('locality', '')
+        area = r.get('areaName', '')
+        location = f"{locality}, {area}" if locality else area
+        is_open = "Open" if r.get('isOpen', False) else "Closed"
+
+        print_color(f"{i}. {name}", Colors.BOLD)
+        print(f"   Rating: {rating} ({total_ratings}) | Delivery: {delivery_time} | {is_open}")
+        print(f"   Cuisine: {cuisines}")
+        print(f"   Cost: {cost} | {location}")
+        print(f"   ID: {r.get('id', 'N/A')}")
+        print()
+
+
+def open_output(args, kind=None):
+    """Record writer for args.format, or None for text output"""
+    if args.format == 'text':
+        return None
+    try:
+        return open_writer(args.format, kind=kind)
+    except RuntimeError as e:
+        print_error(str(e))
+        sys.exit(1)
+
+
+def write_output(args, records, kind=None):
+    """Stream records to stdout in args.format"""
+    writer = open_output(args, kind)
+    for record in records:
+        writer.write(record)
+    writer.close()
+
+
+def save_snapshot(args, rows):
+    """Append search results, as (restaurant, lat, lng) rows, to the --snapshot file"""
+    from swiggy_snapshot import append_snapshot
+
+    try:
+        total = append_snapshot(args.snapshot, rows)
+    except (OSError, ValueError) as e:
+        print_error(f"Failed to write snapshot: {e}")
+        return
+    print_success(f"Added {len(rows)} row(s) to {args.snapshot} ({total} total)")
+
+
+def positive_int(text):
+    """argparse type for --concurrency and other counts"""
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {text!r}")
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return value
+
+
+def weights_arg(text):
+    """argparse type for --weights"""
+    try:
+        return parse_weights(text)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def bbox_arg(text):
+    """argparse type for --bbox"""
+    from swiggy_plan import parse_bbox
+
+    try:
+        return parse_bbox(text)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def ranking_requested(args):
+    """True if any search sort/filter flag was given"""
+    return bool(args.sort or args.weights or args.min_rating is not None
+                or args.max_eta is not None or args.open_only)
+
+
+def rank_order(client, args, restaurants):
+    """Indices of the restaurants that pass the search filters, in --sort order"""
+    from swiggy_rank import rank_indices
+
+    # --weights on its own means rank by the weighted score
+    sort = args.sort or ('score' if args.weights else None)
+    with client.profiler.span("rank"):
+        return rank_indices(restaurants, sort, args.min_rating, args.max_eta,
+                            args.open_only, args.weights)
+
+
+def watch_search(client, args):
+    """Re-run a search every --watch seconds, redrawing only the rows that changed"""
+    from swiggy_watch import LiveTable, describe_change, diff_results, format_row, terminal_size, watch_schedule
+
+    live = sys.stdout.isatty()
+    table = LiveTable(sys.stdout, Colors.RESET) if live else None
+    print_info(f"Watching '{args.query}' every {args.watch:g}s (Ctrl+C to stop)")
+    previous = None
+    try:
+        for _ in watch_schedule(args.watch):
+            stamp = datetime.now().strftime("%H:%M:%S")
+            columns, lines = terminal_size()
+            try:
+                restaurants = client.fetch_restaurants(args.query, args.lat, args.lng)
+            except Exception as e:
+                if live:
+                    table.update(table.rows, f"[{stamp}] Search failed: {e}"[:columns - 1])
+                else:
+                    print_warning(f"[{stamp}] Search failed: {e}")
+                continue
+            if args.snapshot and restaurants:
+                from swiggy_snapshot import append_snapshot
+                try:
+                    append_snapshot(args.snapshot, [(r, args.lat, args.lng) for r in restaurants])
+                except (OSError, ValueError) as e:
+                    print_error(f"Failed to write snapshot: {e}")
+            if ranking_requested(args):
+                restaurants = [restaurants[i] for i in rank_order(client, args, restaurants)]
+            diff = diff_results(previous, restaurants) if previous is not None else None
+
+            with client.profiler.span("render"):
+                if live:
+                    rows = []
+                    # Rows above the top of the screen can't be reached by cursor movement
+                    for i, r in enumerate(restaurants[:max(1, lines - 3)], 1):
+                        color = ''
+                        if diff is not None and r.get('id') in diff.added:
+                            color = Colors.GREEN
+                        elif diff is not None and r.get('id') in diff.changed:
+                            color = Colors.YELLOW
+                        rows.append((format_row(r, columns - 1, i), color))
+                    status = f"[{stamp}] {len(restaurants)} restaurant(s)"
+                    if diff is not None:
+                        status += f" | {len(diff.added)} new, {len(diff.changed)} changed, {len(diff.removed)} gone"
+                    table.update(rows, status[:columns - 1])
+                elif diff is None:
+                    for i, r in enumerate(restaurants, 1):
+                        print(format_row(r, columns, i))
+                else:
+                    before = {r.get('id'): r for r in previous}
+                    for r in restaurants:
+                        if r.get('id') in diff.added:
+                            print(f"[{stamp}] + {format_row(r, columns - 13)}")
+                        elif r.get('id') in diff.changed:
+                            print(f"[{stamp}] ~ {describe_change(r, before[r.get('id')])}")
+                    for r in previous:
+                        if r.get('id') in diff.removed:
+                            print(f"[{stamp}] - {r.get('name')}")
+                    sys.stdout.flush()
+            previous = restaurants
+    except KeyboardInterrupt:
+        if live:
+            table.close()
+        print_info("Watch stopped by user")
+
+
+def fit_rate_limit(client, args, concurrency):
+    """Size the restaurants/list bucket for a grid fan-out (see RateLimiter.fit_fanout)"""
+    limiter = client.rate_limiter
+    if limiter is None:
+        return
+    if limiter.shared_path:
+        # Other processes share this budget, so leave it alone
+        rate, burst = limiter.rates['restaurants/list']
+        if concurrency > burst:
+            print_warning(f"--shared-rate-limit allows {burst} searches at once and {rate:g}/s after that, "
+                          f"below --concurrency {concurrency}")
+        return
+    limiter.fit_fanout('restaurants/list', concurrency, args.rate)
+
+
+def search_grid(client, args):
+    """Run a search across every location in --grid, printing results as they arrive"""
+    from swiggy_async import iter_grid_search, load_grid
+
+    concurrency = args.concurrency
+    try:
+        locations = load_grid(args.grid)
+    except (OSError, ValueError) as e:
+        print_error(f"Failed to load grid: {e}")
+        sys.exit(1)
+
+    print_info(f"Searching for '{args.query}' at {len(locations)} location(s) "
+               f"(concurrency {concurrency})...")
+    fit_rate_limit(client, args, concurrency)
+
+    writer = open_output(args, 'merged_restaurant' if args.merge else 'grid_restaurant')
+    failed = 0
+    snapshot_rows = []
+    merge = None
+    if args.merge:
+        from swiggy_merge import GridMerge
+        merge = GridMerge(locations)
+    # Sorting and filtering need every location's results before printing
+    ranked = ranking_requested(args)
+    ranked_rows = []
+    searched = 0
+    interrupted = False
+    try:
+        for result in iter_grid_search(client, args.query, locations,
+                                       concurrency, args.rate, client.api_base):
+            searched += 1
+            if result.error is not None:
+                failed += 1
+                print_error(f"[{result.lat}, {result.lng}] Search failed: {result.error}")
+                continue
+            if args.snapshot:
+                snapshot_rows.extend((r, result.lat, result.lng) for r in result.restaurants)
+            if merge is not None:
+                merge.add(result.lat, result.lng, result.restaurants)
+                continue
+            if ranked:
+                ranked_rows.extend((r, result.lat, result.lng) for r in result.restaurants)
+                continue
+            with client.profiler.span("render"):
+                if writer is not None:
+                    for r in result.restaurants:
+                        writer.write(dict(r._asdict(), lat=result.lat, lng=result.lng))
+                else:
+                    print_color(f"[{result.lat}, {result.lng}] {len(result.restaurants)} restaurant(s)", Colors.CYAN)
+                    print_restaurants(result.restaurants[:10])
+    except KeyboardInterrupt:
+        # Show what arrived before Ctrl+C
+        interrupted = True
+    if merge is not None:
+        records = list(merge.records())
+        print_info(f"{merge.rows} listing(s) merged into {len(records)} restaurant(s)")
+        if ranked:
+            records = [records[i] for i in rank_order(client, args, records)]
+        with client.profiler.span("render"):
+            if writer is not None:
+                for record in records:
+                    writer.write(record)
+            elif records:
+                print_restaurants(records[:10])
+            elif ranked:
+                print_warning("No restaurants match the filters")
+    elif ranked:
+        order = rank_order(client, args, [r for r, _, _ in ranked_rows])
+        ranked_rows = [ranked_rows[i] for i in order]
+        with client.profiler.span("render"):
+            if writer is not None:
+                for r, lat, lng in ranked_rows:
+                    writer.write(dict(r._asdict(), lat=lat, lng=lng))
+            elif ranked_rows:
+                print_color(f"{len(ranked_rows)} matching restaurant(s) across all locations", Colors.CYAN)
+                print_restaurants([r for r, _, _ in ranked_rows[:10]])
+            else:
+                print_warning("No restaurants match the filters")
+    if writer is not None:
+        writer.close()
+
+    if interrupted:
+        print_warning(f"Stopped by user after {searched} of {len(locations)} location(s)")
+    elif failed:
+        print_warning(f"{failed} of {len(locations)} location(s) failed")
+    else:
+        print_success(f"Searched {len(locations)} location(s)")
+    if snapshot_rows:
+        save_snapshot(args, snapshot_rows)
+
+
+def plan_coverage(client, args):
+    """Sample --bbox/--polygon adaptively and write the searched points as a --grid CSV"""
+    import csv
+    from swiggy_async import iter_grid_search
+    from swiggy_plan import CoveragePlanner, load_polygon, uniform_grid_size
+
+    polygon = None
+    if args.polygon:
+        try:
+            polygon = load_polygon(args.polygon)
+        except (OSError, ValueError) as e:
+            print_error(f"Failed to load polygon: {e}")
+            sys.exit(1)
+
+    concurrency = args.concurrency
+    fit_rate_limit(client, args, concurrency)
+
+    def search(locations):
+        for result in iter_grid_search(client, args.query, locations,
+                                       concurrency, args.rate, client.api_base):
+            if result.error is not None:
+                print_error(f"[{result.lat}, {result.lng}] Search failed: {result.error}")
+            yield result.lat, result.lng, result.restaurants
+
+    try:
+        planner = CoveragePlanner(search, args.bbox, polygon, args.cell, args.min_cell,
+                                  args.similarity, args.max_requests, args.min_new)
+    except ValueError as e:
+        print_error(str(e))
+        sys.exit(1)
+
+    print_info(f"Planning coverage for '{args.query}' (cells {args.cell:g} km down to {args.min_cell:g} km)...")
+    depth = None
+    count = 0
+    for sample in planner.run():
+        if sample.depth != depth:
+            if depth is not None:
+                print_info(f"Round {depth + 1}: {count} search(es), {len(planner.seen)} restaurant(s) so far")
+            depth, count = sample.depth, 0
+        count += 1
+    if depth is not None:
+        print_info(f"Round {depth + 1}: {count} search(es), {len(planner.seen)} restaurant(s)")
+
+    points = [key for key in planner.points() if planner.samples[key] is not None]
+    failed = planner.requests - len(points)
+    if failed and not points:
+        print_error(f"Every search failed; {args.out} not written")
+        sys.exit(1)
+    try:
+        with open(args.out, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['lat', 'lng'])
+            writer.writerows(points)
+    except OSError as e:
+        print_error(f"Failed to write {args.out}: {e}")
+        sys.exit(1)
+
+    if planner.truncated:
+        print_warning(f"Stopped at --max-requests {args.max_requests}; some areas were not refined")
+    if failed:
+        print_warning(f"{failed} search(es) failed and were left out")
+    uniform = uniform_grid_size(planner.bbox, args.min_cell, polygon)
+    print_success(f"{len(planner.seen)} restaurant(s) from {planner.requests} search(es) "
+                  f"(a uniform {args.min_cell:g} km grid needs {uniform})")
+    print_info(f"Wrote {len(points)} point(s) to {args.out}; reuse them with "
+               f"search \"{args.query}\" --grid {args.out} --merge")
+
+
+def prefetch(client, args):
+    """Fetch menus for every ID in --ids-file in parallel, appending to --out"""
+    from swiggy_prefetch import DEFAULT_WORKERS, prefetch_menus, read_ids
+
+    workers = args.workers or DEFAULT_WORKERS
+    try:
+        ids = read_ids(args.ids_file)
+    except OSError as e:
+        print_error(f"Failed to read IDs: {e}")
+        sys.exit(1)
+
+    print_info(f"Fetching {len(ids)} menu(s) with {workers} worker(s) into {args.out}")
+    client.transport.resize_pool(workers)
+
+    def report(record, done, total):
+        if record['status'] == 'ok':
+            print_color(f"[{done}/{total}] {record['restaurant_id']}: {len(record['items'])} item(s)", Colors.GREEN)
+        else:
+            print_color(f"[{done}/{total}] {record['restaurant_id']}: {record['error']}", Colors.RED)
+
+    menu_filter = None
+    if args.category or args.limit:
+        menu_filter = {'category': args.category, 'limit': args.limit}
+    fetched, failed, skipped = prefetch_menus(
+        lambda restaurant_id: client.fetch_menu(restaurant_id, args.lat, args.lng, args.category, args.limit),
+        ids, args.out, workers, report, menu_filter
+    )
+
+    if skipped:
+        print_info(f"Skipped {skipped} menu(s) already in {args.out}")
+    if failed:
+        print_warning(f"Fetched {fetched} menu(s), {failed} failed (rerun to retry them)")
+    else:
+        print_success(f"Fetched {fetched} menu(s)")
+
+
+def sync_catalog(client, args):
+    """
+    Search args.query (at --lat/--lng or every --grid point), update the
+    local catalog and write what changed since the last sync as JSONL
+    """
+    import sqlite3
+    from swiggy_async import iter_grid_search, load_grid
+    from swiggy_catalog import Catalog, scope_key
+
+    if args.grid:
+        try:
+            locations = load_grid(args.grid)
+        except (OSError, ValueError) as e:
+            print_error(f"Failed to load grid: {e}")
+            sys.exit(1)
+    else:
+        locations = [(args.lat, args.lng)]
+
+    concurrency = args.concurrency
+    fit_rate_limit(client, args, concurrency)
+    print_info(f"Syncing '{args.query}' at {len(locations)} location(s)...")
+    results = {}
+    for result in iter_grid_search(client, args.query, locations,
+                                   concurrency, args.rate, client.api_base):
+        if result.error is not None:
+            print_error(f"[{result.lat}, {result.lng}] Search failed: {result.error}")
+        else:
+            results[(result.lat, result.lng)] = result.restaurants
+    failed = len(locations) - len(results)
+    if failed == len(locations):
+        print_error("Every location failed; catalog not updated")
+        sys.exit(1)
+    if failed:
+        print_warning(f"{failed} location(s) failed; removals are not reported this run")
+
+    # Grid order, not completion order, decides which copy of a restaurant is kept
+    restaurants = [r for location in locations for r in results.get(location, [])]
+    catalog = Catalog()
+    try:
+        diffs = catalog.sync(scope_key(args.query, locations), args.query, restaurants,
+                             len(locations), complete=not failed)
+    except sqlite3.Error as e:
+        print_error(f"Catalog update failed: {e}")
+        sys.exit(1)
+    finally:
+        catalog.close()
+
+    synced_at = datetime.now().isoformat(timespec='seconds')
+    out = open(args.out, 'a') if args.out else sys.stdout
+    try:
+        for diff in diffs:
+            out.write(json.dumps(dict(diff, query=args.query, synced_at=synced_at), ensure_ascii=False) + '\n')
+    finally:
+        if args.out:
+            out.close()
+        else:
+            out.flush()
+
+    counts = {op: sum(1 for diff in diffs if diff['op'] == op) for op in ('new', 'changed', 'removed')}
+    print_success(f"{len(restaurants)} listing(s): {counts['new']} new, "
+                  f"{counts['changed']} changed, {counts['removed']} removed")
+
+
+def compact_snapshot_file(args):
+    """Rewrite a --snapshot file as one segment, so to_numpy() maps it without copying"""
+    from swiggy_snapshot import compact_snapshot
+
+    try:
+        rows = compact_snapshot(args.file)
+    except (OSError, ValueError) as e:
+        print_error(f"Failed to compact snapshot: {e}")
+        sys.exit(1)
+    print_success(f"Compacted {args.file} into one segment ({rows} row(s))")
+
+
+def run_bench_load(client, args, headers=None):
+    """Capacity-test search against a mock API (never swiggy.com), sending headers with each search"""
+    from urllib.parse import urlparse
+
+    from swiggy_async import load_grid
+    from swiggy_fixtures import FIXTURES_DIR, ReplayServer
+    from swiggy_loadgen import LoadGenerator
+    from swiggy_transport import SwiggyTransport
+
+    if args.rps < 0 or args.duration <= 0:
+        print_error("--rps must be >= 0 and --duration > 0")
+        sys.exit(1)
+    if args.grid:
+        try:
+            locations = load_grid(args.grid)
+        except (OSError, ValueError) as e:
+            print_error(f"Failed to load grid: {e}")
+            sys.exit(1)
+    else:
+        locations = [(args.lat, args.lng)]
+
+    server = None
+    if args.target:
+        api_base = args.target
+    elif args.replay is not None:
+        # --replay already started a mock server
+        api_base = client.api_base
+    else:
+        server = ReplayServer(FIXTURES_DIR).start()
+        if not len(server):
+            server.stop()
+            print_error(f"No recorded exchanges in {FIXTURES_DIR}")
+            print_info("Record some with '--record search <query>', or pass --target URL")
+            sys.exit(1)
+        api_base = server.api_base
+    if urlparse(api_base).hostname in ('swiggy.com', 'www.swiggy.com'):
+        print_error("bench load only runs against a mock API")
+        sys.exit(1)
+
+    # No retries, so every injected or real failure is counted
+    transport = SwiggyTransport(api_base, pool_size=args.concurrency, retries=0)
+    if args.parser == 'fast':
+        generator = LoadGenerator(transport, decode_restaurants, args.query, locations,
+                                  decode=False, headers=headers)
+    elif args.parser == 'streaming':
+        generator = LoadGenerator(transport, lambda body: list(iter_restaurants(body)), args.query,
+                                  locations, decode=False, headers=headers)
+    else:
+        generator = LoadGenerator(transport, client._parse_restaurants, args.query, locations,
+                                  headers=headers, loads=json_loads)
+    offered = f"{args.rps:g} req/s" if args.rps else "as fast as possible"
+    print_info(f"Load testing {api_base} at {offered}, concurrency {args.concurrency}, "
+               f"for {args.duration:g} s...")
+    try:
+        report = generator.run(args.rps, args.concurrency, args.duration)
+    except KeyboardInterrupt:
+        print("\n")
+        print_info("Load test stopped by user")
+        return
+    finally:
+        transport.close()
+        if server is not None:
+            server.stop()
+
+    if args.json:
+        print(json.dumps(report.to_dict(), indent=2))
+    else:
+        report.write(sys.stdout)
+
+
+def run_daemon(client, args, socket_file):
+    """Serve search, menu and status on socket_file for other CLI invocations until stopped"""
+    from swiggy_daemon import DaemonServer, DaemonUnavailable, connect
+
+    if args.stop:
+        daemon = connect(socket_file)
+        try:
+            if daemon is None:
+                raise DaemonUnavailable(socket_file)
+            daemon.call('shutdown')
+            print_success("Daemon stopped")
+        except DaemonUnavailable:
+            print_warning("No daemon is running")
+        return
+
+    def handler(fetch):
+        def run(**params):
+            # Pick up a login or logout done by another process
+            client.reload_session()
+            return fetch(**params)
+        return run
+
+    try:
+        server = DaemonServer(socket_file, {
+            'search': handler(client.fetch_restaurants),
+            'menu': handler(client.fetch_menu),
+            'status': handler(client.fetch_order_status),
+        })
+    except (OSError, RuntimeError) as e:
+        print_error(f"Failed to start daemon: {e}")
+        sys.exit(1)
+
+    # Build the transport now so the first forwarded call is already warm
+    client.transport
+    print_success(f"Daemon listening on {socket_file} (Ctrl+C or 'daemon --stop' to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n")
+        print_info("Daemon stopped by user")
+    finally:
+        server.server_close()
+
+
+def finish_profile(profiler, trace_path=None):
+    """Print the --profile report and optionally write the Chrome trace"""
+    profiler.report(sys.stderr)
+    if trace_path:
+        try:
+            profiler.write_chrome_trace(trace_path)
+            print_info(f"Chrome trace written to {trace_path}")
+        except OSError as e:
+            print_error(f"Failed to write trace: {e}")
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Client daemon for Swiggy CLI
+
+`swiggy daemon` keeps one SwiggyClient alive (loaded session, warm
+connection pool, open menu index) and serves search, menu and status
+requests over a Unix domain socket. CLI commands forward to the socket
+when it exists and run in-process when no daemon answers.
+
+Each connection carries one JSON request line,
+{"command": ..., "params": {...}}, and one JSON reply line,
+{"result": ...} or {"error": "..."}.
+"""
+
+import json
+import os
+import socket
+import socketserver
+import threading
+
+# Seconds to wait for the daemon to accept a connection
+CONNECT_TIMEOUT = 0.5
+
+# Seconds to wait for a reply; covers transport retries on the daemon side
+REPLY_TIMEOUT = 120
+
+
+class DaemonUnavailable(Exception):
+    """Nothing is listening on the socket, or the daemon went away mid-request"""
+
+
+class DaemonConnection:
+    """Sends commands to a running daemon, one connection per call"""
+
+    def __init__(self, path, timeout=REPLY_TIMEOUT):
+        self.path = path
+        self.timeout = timeout
+
+    def call(self, command, **params):
+        """
+        Run `command` on the daemon and return its result.
+        Raises RuntimeError with the daemon's message if the command failed.
+        """
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.settimeout(CONNECT_TIMEOUT)
+            sock.connect(self.path)
+            sock.settimeout(self.timeout)
+            sock.sendall(json.dumps({'command': command, 'params': params}).encode('utf-8') + b'\n')
+            with sock.makefile('rb') as f:
+                line = f.readline()
+        except OSError as e:
+            raise DaemonUnavailable(str(e))
+        finally:
+            sock.close()
+
+        if not line:
+            raise DaemonUnavailable("Daemon closed the connection")
+        reply = json.loads(line)
+        if 'error' in reply:
+            raise RuntimeError(reply['error'])
+        return reply.get('result')
+
+
+def connect(path):
+    """
+    DaemonConnection for `path` if a daemon socket exists, else None.
+    The socket isn't probed here; a dead daemon surfaces as DaemonUnavailable
+    on the first call.
+    """
+    if not os.path.exists(path):
+        return None
+    return DaemonConnection(path)
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        line = self.rfile.readline()
+        if not line:
+            return
+        command = None
+        try:
+            request = json.loads(line)
+            command = request.get('command')
+            handler = self.server.handlers.get(command)
+            if handler is None:
+                raise ValueError(f"Unknown command: {command}")
+            reply = {'result': handler(**(request.get('params') or {}))}
+        except Exception as e:
+            reply = {'error': str(e) or e.__class__.__name__}
+        self.wfile.write(json.dumps(reply, ensure_ascii=False).encode('utf-8') + b'\n')
+        if command == 'shutdown':
+            # After replying: shutdown() blocks until serve_forever returns
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+
+
+class DaemonServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """
+    Threaded Unix socket server dispatching commands to `handlers`
+    ({command: callable(**params)}). 'ping' and 'shutdown' are built in.
+    The socket is created owner-only and removed on close.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, path, handlers):
+        self.path = path
+        self.handlers = dict(handlers, ping=lambda: 'pong', shutdown=lambda: 'stopping')
+        os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+        _remove_stale_socket(path)
+        # bind() creates the socket file with umask permissions; a chmod
+        # afterwards would leave a window where other users can connect
+        umask = os.umask(0o177)
+        try:
+            super().__init__(path, _Handler)
+        finally:
+            os.umask(umask)
+
+    def server_close(self):
+        super().server_close()
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+
+def _remove_stale_socket(path):
+    """Delete a socket left by a daemon that died; refuse if one is still listening"""
+    if not os.path.exists(path):
+        return
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(CONNECT_TIMEOUT)
+        sock.connect(path)
+    except OSError:
+        os.unlink(path)
+        return
+    finally:
+        sock.close()
+    raise RuntimeError(f"A daemon is already listening on {path}")
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Record and replay Swiggy API exchanges for Swiggy CLI
+
+`--record DIR` saves every restaurants/list/v5, menu/pl and orders exchange
+the client makes under DIR/<endpoint>/: the response body as its own file
+(<hash>.json for 200s, so benchmarks/payloads.py can load them directly)
+and one line per exchange in DIR/<endpoint>/exchanges.jsonl with the
+method, path, query params and status. Only bodies are stored; request
+headers and cookies are never written.
+
+ReplayServer serves those exchanges from a local HTTP server, matched on
+method, path and params (falling back to any recording of the same
+endpoint), with optional added latency and injected errors. Point a
+client's api_base at ReplayServer.api_base to run it offline.
+"""
+
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlparse
+
+from swiggy_profile import endpoint_name
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmarks", "fixtures")
+
+EXCHANGES_FILE = "exchanges.jsonl"
+
+# Endpoint label (swiggy_profile.endpoint_name) -> fixture directory
+RECORDED_ENDPOINTS = {
+    "restaurants/list/v5": "restaurants_list",
+    "menu/pl": "menu_pl",
+    "orders/{id}": "orders",
+    "orders/list": "orders_list",
+}
+
+
+def _api_path(path):
+    """'/dapi/menu/pl' -> 'menu/pl'"""
+    if '/dapi/' in path:
+        path = path.split('/dapi/', 1)[1]
+    return path.strip('/')
+
+
+def _params_key(params):
+    return tuple(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+
+
+class FixtureRecorder:
+    """SwiggyTransport hook that writes recorded endpoints' exchanges to disk"""
+
+    def __init__(self, directory=FIXTURES_DIR):
+        self.directory = directory
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def transport_hook(self, send, method, url, **kwargs):
+        response = send(method, url, **kwargs)
+        name = RECORDED_ENDPOINTS.get(endpoint_name(url))
+        if name is not None:
+            try:
+                self.save(name, method, url, kwargs.get('params'), response)
+            except OSError:
+                # A full disk shouldn't fail the command being recorded
+                pass
+        return response
+
+    def save(self, name, method, url, params, response):
+        body = response.content
+        extension = "json" if response.status_code == 200 else "body"
+        filename = f"{hashlib.blake2b(body, digest_size=12).hexdigest()}.{extension}"
+        directory = os.path.join(self.directory, name)
+        entry = {
+            'method': method,
+            'path': _api_path(urlparse(url).path),
+            'params': {str(k): str(v) for k, v in (params or {}).items()},
+            'status': response.status_code,
+            'content_type': response.headers.get('Content-Type', 'application/json'),
+            'body': filename,
+            'recorded_at': time.time(),
+        }
+        with self._lock:
+            os.makedirs(directory, exist_ok=True)
+            path = os.path.join(directory, filename)
+            # Bodies are content-addressed, so a repeated response is stored once
+            if not os.path.exists(path):
+                tmp_path = f"{path}.tmp"
+                with open(tmp_path, 'wb') as f:
+                    f.write(body)
+                os.replace(tmp_path, path)
+            with open(os.path.join(directory, EXCHANGES_FILE), 'a') as f:
+                f.write(json.dumps(entry) + '\n')
+            self.count += 1
+
+
+def load_exchanges(directory=FIXTURES_DIR):
+    """All recorded exchanges under directory, each with its body loaded"""
+    exchanges = []
+    for name in sorted(os.listdir(directory)) if os.path.isdir(directory) else ():
+        index = os.path.join(directory, name, EXCHANGES_FILE)
+        if not os.path.exists(index):
+            continue
+        bodies = {}
+        with open(index) as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                if entry['body'] not in bodies:
+                    with open(os.path.join(directory, name, entry['body']), 'rb') as body:
+                        bodies[entry['body']] = body.read()
+                entry['content'] = bodies[entry['body']]
+                exchanges.append(entry)
+    return exchanges
+
+
+class ReplayServer:
+    """
+    Local stand-in for the Swiggy API serving recorded exchanges.
+
+    latency and jitter (seconds) delay every response by latency plus a
+    uniform 0..jitter; error_rate is the fraction of requests answered with
+    error_status instead. Unknown requests get a 404. Use as a context
+    manager, or call start() and stop().
+    """
+
+    def __init__(self, directory=FIXTURES_DIR, latency=0.0, jitter=0.0, error_rate=0.0,
+                 error_status=503, seed=None, host='127.0.0.1', port=0):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.host = host
+        self.port = port
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._exact = {}
+        self._by_endpoint = {}
+        self._turn = {}
+        for exchange in load_exchanges(directory):
+            key = (exchange['method'], exchange['path'], _params_key(exchange['params']))
+            # The latest recording of an identical request wins
+            self._exact[key] = exchange
+            self._by_endpoint.setdefault((exchange['method'], endpoint_name(exchange['path'])), []).append(exchange)
+        self.requests = 0
+        self.errors = 0
+        self.misses = 0
+        self._server = None
+        self._thread = None
+
+    def __len__(self):
+        return len(self._exact)
+
+    @property
+    def api_base(self):
+        return f"http://{self.host}:{self.port}/dapi"
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def start(self):
+        self._server = ThreadingHTTPServer((self.host, self.port), _handler_for(self))
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def lookup(self, method, path, params):
+        """Recorded exchange for a request, or None"""
+        path = _api_path(path)
+        exchange = self._exact.get((method, path, _params_key(params)))
+        if exchange is not None:
+            return exchange
+        # Same endpoint, different ids or params: rotate through its recordings
+        candidates = self._by_endpoint.get((method, endpoint_name(path)))
+        if not candidates:
+            return None
+        with self._lock:
+            turn = self._turn.get((method, path), 0)
+            self._turn[(method, path)] = turn + 1
+        return candidates[turn % len(candidates)]
+
+    def respond(self, method, path, params):
+        """(status, content_type, body) for a request, after latency and error injection"""
+        with self._lock:
+            self.requests += 1
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0)
+            fail = self.error_rate > 0 and self._random.random() < self.error_rate
+            if fail:
+                self.errors += 1
+        if delay > 0:
+            time.sleep(delay)
+        if fail:
+            return self.error_status, 'application/json', b'{"statusCode": 1, "statusMessage": "injected error"}'
+        exchange = self.lookup(method, path, params)
+        if exchange is None:
+            with self._lock:
+                self.misses += 1
+            return 404, 'application/json', b'{"statusCode": 1, "statusMessage": "no recording"}'
+        return exchange['status'], exchange['content_type'], exchange['content']
+
+
+def _handler_for(server):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        # Headers and body go out in one write; separate small writes hit
+        # Nagle + delayed ACK and add ~40 ms to every keep-alive response
+        wbufsize = -1
+        disable_nagle_algorithm = True
+
+        def _serve(self):
+            length = int(self.headers.get('Content-Length') or 0)
+            if length:
+                self.rfile.read(length)
+            url = urlparse(self.path)
+            status, content_type, body = server.respond(self.command, url.path, dict(parse_qsl(url.query)))
+            self.send_response(status)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        do_GET = _serve
+        do_POST = _serve
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
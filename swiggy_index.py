@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Local menu index for Swiggy CLI
+
+Every menu fetched with get_menu is stored in a SQLite database with an
+FTS5 full-text index over item names and descriptions, so items can be
+searched across all cached restaurants without calling menu/pl again.
+Prices are stored as the API returns them (paise).
+"""
+
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import Counter, namedtuple
+
+INDEX_FILE = os.path.expanduser("~/.swiggy-cli/menu_index.db")
+
+MenuMatch = namedtuple('MenuMatch', ['restaurant_id', 'item_id', 'name', 'description', 'price', 'is_veg'])
+
+_TOKEN = re.compile(r'\w+', re.UNICODE)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS menu_items (
+    restaurant_id TEXT NOT NULL,
+    item_id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    description TEXT NOT NULL DEFAULT '',
+    price INTEGER NOT NULL DEFAULT 0,
+    is_veg INTEGER NOT NULL DEFAULT 1,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (restaurant_id, item_id)
+);
+CREATE INDEX IF NOT EXISTS menu_items_price ON menu_items (price);
+"""
+
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS menu_fts USING fts5(
+    name, description,
+    content='menu_items', content_rowid='rowid',
+    tokenize='unicode61 remove_diacritics 2'
+)
+"""
+
+
+def _item_keys(items):
+    """
+    item_id for each item's primary key. Id-less items get a stable key from
+    their name, category and price, numbered when a menu repeats all three.
+    """
+    repeats = Counter()
+    for item in items:
+        item_id = item.get('id')
+        if item_id not in (None, ''):
+            yield str(item_id)
+            continue
+        ident = '\0'.join((item['name'], str(item.get('category') or ''), str(_price(item.get('price')))))
+        key = 'name:' + hashlib.sha1(ident.encode('utf-8')).hexdigest()[:16]
+        repeats[key] += 1
+        yield key if repeats[key] == 1 else f"{key}:{repeats[key]}"
+
+
+def _price(value):
+    try:
+        return int(round(float(value or 0)))
+    except (TypeError, ValueError):
+        return 0
+
+
+class MenuIndex:
+    """
+    SQLite-backed menu store with full-text item search.
+    Falls back to LIKE matching when SQLite was built without FTS5.
+    One connection is shared by all threads and serialized with a lock.
+    """
+
+    def __init__(self, path=INDEX_FILE):
+        self.path = path
+        self._conn = None
+        self._lock = threading.RLock()
+        self.fts = True
+
+    @property
+    def conn(self):
+        with self._lock:
+            if self._conn is None:
+                self._conn = self._connect()
+            return self._conn
+
+    def _connect(self):
+        if self.path != ':memory:':
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(SCHEMA)
+        try:
+            conn.execute(FTS_SCHEMA)
+        except sqlite3.OperationalError:
+            self.fts = False
+        return conn
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def add_menu(self, restaurant_id, items):
+        """Replace the indexed menu for a restaurant with `items` (dicts from _parse_menu)"""
+        restaurant_id = str(restaurant_id)
+        named = [item for item in items if item.get('name')]
+        now = time.time()
+        conn = self.conn
+        with self._lock, conn:
+            if self.fts:
+                # External-content FTS rows must be deleted with their old values
+                conn.execute(
+                    "INSERT INTO menu_fts (menu_fts, rowid, name, description) "
+                    "SELECT 'delete', rowid, name, description FROM menu_items WHERE restaurant_id = ?",
+                    (restaurant_id,))
+            conn.execute("DELETE FROM menu_items WHERE restaurant_id = ?", (restaurant_id,))
+            conn.executemany(
+                "INSERT OR REPLACE INTO menu_items "
+                "(restaurant_id, item_id, name, description, price, is_veg, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(restaurant_id, key, item['name'],
+                  item.get('description') or '', _price(item.get('price')),
+                  1 if item.get('isVeg', True) else 0, now)
+                 for key, item in zip(_item_keys(named), named)])
+            if self.fts:
+                conn.execute(
+                    "INSERT INTO menu_fts (rowid, name, description) "
+                    "SELECT rowid, name, description FROM menu_items WHERE restaurant_id = ?",
+                    (restaurant_id,))
+
+    def search(self, query, max_price=None, veg=None, limit=20):
+        """
+        Find items matching every word in `query`.
+        max_price is in paise; veg=True/False filters on the veg flag.
+        """
+        tokens = _TOKEN.findall(query.lower())
+        if not tokens:
+            return []
+
+        conn = self.conn
+        filters, params = [], []
+        if max_price is not None:
+            filters.append("m.price <= ?")
+            params.append(int(max_price))
+        if veg is not None:
+            filters.append("m.is_veg = ?")
+            params.append(1 if veg else 0)
+
+        if self.fts:
+            match = " ".join(f'"{token}"*' for token in tokens)
+            where = " AND ".join(["menu_fts MATCH ?"] + filters)
+            sql = ("SELECT m.restaurant_id, m.item_id, m.name, m.description, m.price, m.is_veg "
+                   "FROM menu_fts JOIN menu_items m ON m.rowid = menu_fts.rowid "
+                   f"WHERE {where} ORDER BY bm25(menu_fts), m.price LIMIT ?")
+            params = [match] + params
+        else:
+            likes = ["(m.name LIKE ? OR m.description LIKE ?)" for _ in tokens]
+            where = " AND ".join(likes + filters)
+            sql = ("SELECT m.restaurant_id, m.item_id, m.name, m.description, m.price, m.is_veg "
+                   f"FROM menu_items m WHERE {where} ORDER BY m.price LIMIT ?")
+            like_params = []
+            for token in tokens:
+                like_params += [f"%{token}%", f"%{token}%"]
+            params = like_params + params
+
+        with self._lock:
+            rows = conn.execute(sql, params + [limit]).fetchall()
+        return [MenuMatch(r[0], r[1], r[2], r[3], r[4], bool(r[5])) for r in rows]
+
+    def stats(self):
+        """Return (restaurant count, item count)"""
+        conn = self.conn
+        with self._lock:
+            return conn.execute(
+                "SELECT COUNT(DISTINCT restaurant_id), COUNT(*) FROM menu_items").fetchone()
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Pluggable JSON decoding for Swiggy CLI
+
+loads() decodes API bodies with the first available backend: msgspec,
+then orjson, then the standard library. msgspec comes first because its
+typed listing decode is much faster than a full decode plus dict walk
+(benchmarks/bench_json.py); for plain loads() the two are close.
+decode_restaurants() turns a restaurants/list body straight into
+Restaurant records:
+
+  msgspec  a typed schema covering only the card path to the restaurant
+           infos; every other card field is skipped during decoding
+  orjson   orjson.loads, then a dict walk over the cards
+  json     swiggy_parse.iter_restaurants, which follows the same card
+           path through the raw text one restaurant at a time
+
+Every backend skips a malformed restaurant card rather than failing the
+listing; msgspec falls back to the dict walk when a card doesn't match its
+schema. The backend is picked on first use; set SWIGGY_JSON=json|orjson|msgspec
+to force one. Neither optional package is required.
+"""
+
+import json
+import os
+import threading
+
+from swiggy_parse import iter_restaurants, listing_restaurant, restaurants_from_data
+
+BACKENDS = ('msgspec', 'orjson', 'json')
+
+ENV_VAR = 'SWIGGY_JSON'
+
+
+class _Backend:
+    def __init__(self, name, loads, decode_restaurants):
+        self.name = name
+        self.loads = loads
+        self.decode_restaurants = decode_restaurants
+
+
+def _json_backend():
+    def decode_restaurants(body):
+        return list(iter_restaurants(body))
+    return _Backend('json', json.loads, decode_restaurants)
+
+
+def _orjson_backend():
+    import orjson
+
+    def decode_restaurants(body):
+        try:
+            return restaurants_from_data(orjson.loads(body))
+        except orjson.JSONDecodeError:
+            return []
+    return _Backend('orjson', orjson.loads, decode_restaurants)
+
+
+def _msgspec_listing_type(msgspec):
+    """Structs for data.cards[].card[.card].gridElements.infoWithStyle.restaurants[].info"""
+    from typing import Any, List, Optional
+
+    class Sla(msgspec.Struct):
+        deliveryTime: Any = 0
+        slaString: Any = 'N/A'
+
+    class Info(msgspec.Struct):
+        id: Any = None
+        name: Any = None
+        locality: Any = ''
+        areaName: Any = ''
+        costForTwo: Any = ''
+        cuisines: Any = msgspec.field(default_factory=list)
+        avgRating: Any = 0
+        avgRatingString: Any = 'N/A'
+        totalRatingsString: Any = '0'
+        sla: Optional[Sla] = None
+        isOpen: Any = False
+
+    class Entry(msgspec.Struct):
+        info: Optional[Info] = None
+
+    class InfoWithStyle(msgspec.Struct):
+        restaurants: Optional[List[Entry]] = None
+
+    class GridElements(msgspec.Struct):
+        infoWithStyle: Optional[InfoWithStyle] = None
+
+    class Widget(msgspec.Struct):
+        gridElements: Optional[GridElements] = None
+
+    class Wrapper(msgspec.Struct):
+        card: Optional[Widget] = None
+        gridElements: Optional[GridElements] = None
+
+    class Card(msgspec.Struct):
+        card: Optional[Wrapper] = None
+
+    class Data(msgspec.Struct):
+        cards: Optional[List[Card]] = None
+
+    class Listing(msgspec.Struct):
+        data: Optional[Data] = None
+
+    return Listing
+
+
+def _msgspec_backend():
+    import msgspec
+
+    decoder = msgspec.json.Decoder()
+    listing = msgspec.json.Decoder(_msgspec_listing_type(msgspec))
+
+    def grid_of(card):
+        wrapper = card.card
+        if wrapper is None:
+            return None
+        # Same precedence as the dict walk: card.card.card when present
+        return wrapper.card.gridElements if wrapper.card is not None else wrapper.gridElements
+
+    def decode_restaurants(body):
+        try:
+            decoded = listing.decode(body)
+        except msgspec.ValidationError:
+            # Fields shaped differently than the schema expects
+            try:
+                return restaurants_from_data(decoder.decode(body))
+            except msgspec.DecodeError:
+                return []
+        except msgspec.DecodeError:
+            return []
+        restaurants = []
+        for card in (decoded.data.cards if decoded.data is not None else None) or ():
+            grid = grid_of(card)
+            style = grid.infoWithStyle if grid is not None else None
+            for entry in (style.restaurants if style is not None else None) or ():
+                info = entry.info
+                if info is None or info.id is None or info.name is None:
+                    continue
+                sla = info.sla
+                restaurant = listing_restaurant({
+                    'id': info.id, 'name': info.name, 'locality': info.locality,
+                    'areaName': info.areaName, 'costForTwo': info.costForTwo,
+                    'cuisines': info.cuisines, 'avgRating': info.avgRating,
+                    'avgRatingString': info.avgRatingString,
+                    'totalRatingsString': info.totalRatingsString, 'isOpen': info.isOpen,
+                    'sla': {'deliveryTime': sla.deliveryTime, 'slaString': sla.slaString} if sla else {},
+                })
+                if restaurant is not None:
+                    restaurants.append(restaurant)
+        return restaurants
+
+    def loads(data):
+        try:
+            return decoder.decode(data)
+        except msgspec.DecodeError as e:
+            # Callers catch ValueError, as they do for json.JSONDecodeError
+            raise ValueError(str(e))
+    return _Backend('msgspec', loads, decode_restaurants)
+
+
+_FACTORIES = {
+    'msgspec': _msgspec_backend,
+    'orjson': _orjson_backend,
+    'json': _json_backend,
+}
+
+_selected = None
+_lock = threading.Lock()
+
+
+def get_backend(name):
+    """Build a backend by name; raises ImportError if its package is missing"""
+    if name not in _FACTORIES:
+        raise ValueError(f"unknown JSON backend {name!r} (expected {', '.join(BACKENDS)})")
+    return _FACTORIES[name]()
+
+
+def available_backends():
+    """Names of the backends that can be used here, in preference order"""
+    names = []
+    for name in BACKENDS:
+        try:
+            get_backend(name)
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def _select():
+    global _selected
+    if _selected is None:
+        with _lock:
+            if _selected is None:
+                forced = os.environ.get(ENV_VAR)
+                for name in ([forced] if forced else []) + list(BACKENDS):
+                    try:
+                        _selected = get_backend(name)
+                        break
+                    except (ImportError, ValueError):
+                        continue
+    return _selected
+
+
+def backend_name():
+    return _select().name
+
+
+def loads(data):
+    """Decode a JSON document (bytes or str)"""
+    return _select().loads(data)
+
+
+def decode_restaurants(body):
+    """Restaurant records from a restaurants/list response body ([] if it isn't JSON)"""
+    return _select().decode_restaurants(body)
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Load generation for Swiggy CLI (`swiggy bench load`)
+
+Drives restaurant searches at a target rate against a mock API (a
+swiggy_fixtures.ReplayServer, or any api_base) and measures how many the
+client can sustain. Requests are scheduled open-loop: request i is due at
+start + i / rps whether or not earlier ones have finished, and its latency
+is counted from that due time, so queueing inside the client shows up in
+the latency instead of silently lowering the offered rate. When the
+offered rate is more than the client can take, requests still queued at
+the deadline are dropped (counted, never sent), so a run ends on time.
+rps=0 runs closed-loop, each worker sending its next request as soon as
+the last one finishes.
+
+Every request is split into network (the HTTP call, including reading
+the body), JSON decode and parse, with wall and thread CPU time recorded
+for each phase.
+"""
+
+import json
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from swiggy_profile import percentile
+
+PHASES = ('network', 'decode', 'parse')
+
+# Upper bounds (ms) of the latency histogram buckets; the last is open-ended
+HISTOGRAM_BOUNDS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+HISTOGRAM_WIDTH = 40
+
+
+class LoadReport:
+    """Thread-safe accumulator for one load run"""
+
+    def __init__(self, rps, concurrency):
+        self.rps = rps
+        self.concurrency = concurrency
+        self.latencies = []
+        self.errors = Counter()
+        self.wall = dict.fromkeys(PHASES, 0.0)
+        self.cpu = dict.fromkeys(PHASES, 0.0)
+        self.restaurants = 0
+        self.sent = 0
+        self.elapsed = 0.0
+        self.process_cpu = 0.0
+        self.late = 0
+        self.dropped = 0
+        self._lock = threading.Lock()
+
+    def record(self, latency, wall, cpu, restaurants):
+        with self._lock:
+            self.latencies.append(latency)
+            for phase in PHASES:
+                self.wall[phase] += wall[phase]
+                self.cpu[phase] += cpu[phase]
+            self.restaurants += restaurants
+
+    def error(self, kind):
+        with self._lock:
+            self.errors[kind] += 1
+
+    @property
+    def completed(self):
+        return len(self.latencies)
+
+    def histogram(self):
+        """[(upper bound ms or None, count)] over successful requests"""
+        counts = [0] * (len(HISTOGRAM_BOUNDS) + 1)
+        for latency in self.latencies:
+            ms = latency * 1000
+            for i, bound in enumerate(HISTOGRAM_BOUNDS):
+                if ms <= bound:
+                    counts[i] += 1
+                    break
+            else:
+                counts[-1] += 1
+        return list(zip(HISTOGRAM_BOUNDS + (None,), counts))
+
+    def to_dict(self):
+        latencies_ms = [latency * 1000 for latency in self.latencies]
+        completed = self.completed
+        failed = sum(self.errors.values())
+        return {
+            'offered_rps': self.rps,
+            'concurrency': self.concurrency,
+            'sent': self.sent,
+            'completed': completed,
+            'failed': failed,
+            'error_rate': failed / self.sent if self.sent else 0.0,
+            'errors': dict(self.errors),
+            'late_dispatches': self.late,
+            'dropped': self.dropped,
+            'elapsed_s': self.elapsed,
+            'throughput_rps': completed / self.elapsed if self.elapsed else 0.0,
+            'restaurants_per_s': self.restaurants / self.elapsed if self.elapsed else 0.0,
+            'latency_ms': {
+                'p50': percentile(latencies_ms, 50),
+                'p90': percentile(latencies_ms, 90),
+                'p99': percentile(latencies_ms, 99),
+                'max': max(latencies_ms or [0.0]),
+            },
+            'histogram': [{'le_ms': bound, 'count': count} for bound, count in self.histogram()],
+            'per_request_ms': {
+                phase: {'wall': self.wall[phase] / completed * 1000 if completed else 0.0,
+                        'cpu': self.cpu[phase] / completed * 1000 if completed else 0.0}
+                for phase in PHASES},
+            'process_cpu_per_request_ms': self.process_cpu / self.sent * 1000 if self.sent else 0.0,
+        }
+
+    def write(self, stream):
+        """Write a plain-text summary"""
+        data = self.to_dict()
+        write = stream.write
+        offered = f"{self.rps:g} req/s" if self.rps else "unlimited"
+        write(f"\nLoad test: {offered} offered, concurrency {self.concurrency}, {data['elapsed_s']:.1f} s\n")
+        write("=" * 60 + "\n")
+        write(f"{'sent':<22} {data['sent']:>10}\n")
+        write(f"{'completed':<22} {data['completed']:>10}\n")
+        write(f"{'failed':<22} {data['failed']:>10}  ({data['error_rate'] * 100:.1f}%)\n")
+        for kind, count in sorted(self.errors.items(), key=lambda item: -item[1]):
+            write(f"  {kind:<20} {count:>10}\n")
+        if self.late:
+            write(f"{'late dispatches':<22} {self.late:>10}  (generator fell behind schedule)\n")
+        if self.dropped:
+            write(f"{'dropped':<22} {self.dropped:>10}  (still queued at the deadline, not sent)\n")
+        write(f"{'throughput':<22} {data['throughput_rps']:>10.1f} req/s\n")
+        write(f"{'restaurants parsed':<22} {data['restaurants_per_s']:>10.0f} /s\n")
+
+        latency = data['latency_ms']
+        write(f"\nlatency ms   p50 {latency['p50']:.1f}   p90 {latency['p90']:.1f}   "
+              f"p99 {latency['p99']:.1f}   max {latency['max']:.1f}\n")
+        histogram = self.histogram()
+        peak = max([count for _, count in histogram] + [1])
+        previous = 0
+        for bound, count in histogram:
+            label = f"{previous}-{bound}" if bound is not None else f">{previous}"
+            previous = bound
+            bar = "#" * int(round(count / peak * HISTOGRAM_WIDTH))
+            write(f"  {label:>10} ms {count:>7} {bar}\n")
+
+        write(f"\n{'per request':<12} {'wall ms':>9} {'cpu ms':>9}\n")
+        for phase in PHASES:
+            timing = data['per_request_ms'][phase]
+            write(f"{phase:<12} {timing['wall']:>9.3f} {timing['cpu']:>9.3f}\n")
+        write(f"{'process cpu':<12} {'':>9} {data['process_cpu_per_request_ms']:>9.3f}\n\n")
+
+
+class LoadGenerator:
+    """
+    Send searches for `query`, cycling through `locations`, to a transport.
+    parse(body) turns a response body into restaurants; it is given the
+    JSON decoded by loads() when decode is True and the raw bytes otherwise
+    (for parsers that decode as they go).
+    """
+
+    def __init__(self, transport, parse, query, locations, decode=True, headers=None, loads=json.loads):
+        self.transport = transport
+        self.loads = loads
+        self.parse = parse
+        self.query = query
+        self.locations = list(locations)
+        self.decode = decode
+        self.headers = headers
+
+    def _request(self, i, due, report):
+        lat, lng = self.locations[i % len(self.locations)]
+        params = {"lat": lat, "lng": lng, "search": self.query}
+        wall, cpu = {}, {}
+        start, cpu_start = time.perf_counter(), time.thread_time()
+        try:
+            response = self.transport.get("restaurants/list/v5", params=params, headers=self.headers)
+            body = response.content
+        except Exception as e:
+            report.error(type(e).__name__)
+            return
+        mark, cpu_mark = time.perf_counter(), time.thread_time()
+        wall['network'], cpu['network'] = mark - start, cpu_mark - cpu_start
+        if response.status_code != 200:
+            report.error(f"HTTP {response.status_code}")
+            return
+
+        try:
+            if self.decode:
+                body = self.loads(body)
+            now, cpu_now = time.perf_counter(), time.thread_time()
+            wall['decode'], cpu['decode'] = now - mark, cpu_now - cpu_mark
+            mark, cpu_mark = now, cpu_now
+            restaurants = self.parse(body)
+        except ValueError:
+            report.error("invalid JSON")
+            return
+        except Exception as e:
+            # A parser tripping over an odd body is a failed request too
+            report.error(f"parse {type(e).__name__}")
+            return
+        end, cpu_end = time.perf_counter(), time.thread_time()
+        wall['parse'], cpu['parse'] = end - mark, cpu_end - cpu_mark
+        report.record(end - due, wall, cpu, len(restaurants))
+
+    def run(self, rps, concurrency, duration):
+        """Generate load for `duration` seconds and return a LoadReport"""
+        report = LoadReport(rps, concurrency)
+        cpu_start = time.process_time()
+        start = time.perf_counter()
+        deadline = start + duration
+
+        if rps > 0:
+            executor = ThreadPoolExecutor(max_workers=concurrency)
+            interval = 1.0 / rps
+            futures = []
+            try:
+                i = 0
+                while True:
+                    due = start + i * interval
+                    if due >= deadline:
+                        break
+                    delay = due - time.perf_counter()
+                    if delay > 0:
+                        time.sleep(delay)
+                    elif delay < -interval:
+                        report.late += 1
+                    futures.append(executor.submit(self._request, i, due, report))
+                    i += 1
+                # Queued requests finish; their latency includes the wait
+                while futures and not futures[-1].done():
+                    remaining = deadline - time.perf_counter()
+                    if remaining <= 0:
+                        break
+                    time.sleep(min(remaining, 0.05))
+            finally:
+                # Past the deadline, drop what never started; in-flight requests finish
+                report.dropped = sum(1 for future in futures if future.cancel())
+                report.sent = len(futures) - report.dropped
+                executor.shutdown(wait=True)
+        else:
+            counter = iter(range(1 << 62))
+            lock = threading.Lock()
+
+            def worker():
+                while True:
+                    with lock:
+                        i = next(counter)
+                    now = time.perf_counter()
+                    if now >= deadline:
+                        return i
+                    self._request(i, now, report)
+
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                futures = [executor.submit(worker) for _ in range(concurrency)]
+                # Each worker drew one index it did not send
+                report.sent = max(future.result() for future in futures) + 1 - concurrency
+
+        report.elapsed = time.perf_counter() - start
+        report.process_cpu = time.process_time() - cpu_start
+        return report
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Menu parsing for Swiggy CLI
+
+menu/pl responses come in two shapes. Older payloads carry a flat list
+(data.items or data.menu.items); the live API nests items in category
+cards. Prices are in paise in both shapes:
+
+  data.cards[].groupedCard.cardGroupMap.REGULAR.cards[].card.card
+      .itemCards[].card.info                    (ItemCategory)
+      .categories[].itemCards[].card.info       (NestedItemCategory)
+
+Everything here is a generator, so a caller that wants the first N items
+or one category stops walking the tree as soon as it has them instead of
+building dicts for a 500-item menu.
+"""
+
+from itertools import islice
+
+
+def _flat_item(item, category):
+    # Flat menus are in paise too, like the card shape
+    return {
+        'id': item.get('id', ''),
+        'name': item.get('name', ''),
+        'price': item.get('price', 0),
+        'description': item.get('description', ''),
+        'isVeg': item.get('isVeg', True),
+        'category': item.get('category') or category,
+    }
+
+
+def _card_item(info, category):
+    # Prices are in paise; items with variants only have defaultPrice
+    veg = info.get('isVeg')
+    if veg is None:
+        veg = (info.get('itemAttribute') or {}).get('vegClassifier') == 'VEG'
+    return {
+        'id': info.get('id', ''),
+        'name': info.get('name', ''),
+        'price': info.get('price') or info.get('defaultPrice') or 0,
+        'description': info.get('description') or '',
+        'isVeg': bool(veg),
+        'category': category,
+    }
+
+
+def _iter_flat(items, category=''):
+    for item in items or ():
+        if isinstance(item, dict):
+            yield _flat_item(item, category)
+
+
+def _iter_item_cards(item_cards, category):
+    for entry in item_cards or ():
+        card = entry.get('card') if isinstance(entry, dict) else None
+        info = card.get('info') if isinstance(card, dict) else None
+        if isinstance(info, dict):
+            yield _card_item(info, category)
+
+
+def _iter_regular_cards(menu_data):
+    """The category cards under each groupedCard's REGULAR group"""
+    for card in menu_data.get('cards') or ():
+        grouped = card.get('groupedCard') if isinstance(card, dict) else None
+        if not isinstance(grouped, dict):
+            continue
+        regular = (grouped.get('cardGroupMap') or {}).get('REGULAR') or {}
+        for entry in regular.get('cards') or ():
+            card_data = entry.get('card') if isinstance(entry, dict) else None
+            if isinstance(card_data, dict) and 'card' in card_data:
+                card_data = card_data['card']
+            if isinstance(card_data, dict):
+                yield card_data
+
+
+def iter_categories(data):
+    """
+    Yield (title, items) for each menu category, where items is a
+    generator of item dicts. Flat menus are one untitled category.
+    """
+    menu_data = data.get('data') if isinstance(data, dict) else None
+    if not isinstance(menu_data, dict):
+        return
+    if 'items' in menu_data:
+        yield '', _iter_flat(menu_data['items'])
+        return
+    if isinstance(menu_data.get('menu'), dict):
+        yield '', _iter_flat(menu_data['menu'].get('items'))
+        return
+    for card in _iter_regular_cards(menu_data):
+        title = card.get('title') or ''
+        if card.get('itemCards'):
+            yield title, _iter_item_cards(card['itemCards'], title)
+        for sub in card.get('categories') or ():
+            if not isinstance(sub, dict):
+                continue
+            sub_title = f"{title} / {sub.get('title') or ''}" if title else sub.get('title') or ''
+            yield sub_title, _iter_item_cards(sub.get('itemCards'), sub_title)
+
+
+def category_matches(title, wanted):
+    """Case-insensitive substring match of a category title"""
+    return wanted.lower() in (title or '').lower()
+
+
+def iter_menu_items(data, category=None):
+    """
+    Yield item dicts (id, name, price in paise, description, isVeg,
+    category) from a decoded menu/pl response, optionally only those in
+    categories whose title contains `category`.
+    """
+    for title, items in iter_categories(data):
+        # Untitled (flat) menus can still carry a category per item
+        if category is not None and title and not category_matches(title, category):
+            continue
+        for item in items:
+            if category is None or category_matches(item['category'], category):
+                yield item
+
+
+def parse_menu(data, category=None, limit=None):
+    """List of up to `limit` items (all when None) from iter_menu_items"""
+    items = iter_menu_items(data, category)
+    return list(islice(items, limit) if limit is not None else items)
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Cross-location merge of grid search results for Swiggy CLI
+
+Overlapping grid points return the same restaurant many times, each with
+the delivery time from that point. GridMerge indexes results by restaurant
+id as they stream in, keeping one entry per restaurant: the listing from
+its fastest location and the delivery time seen at each location. Memory
+grows with the number of unique restaurants (and the points each one was
+seen from), not with the number of responses.
+"""
+
+
+class _Entry:
+    __slots__ = ('restaurant', 'slot', 'rank', 'etas')
+
+    def __init__(self, restaurant, slot, rank):
+        self.restaurant = restaurant
+        self.slot = slot
+        # Position in its best location's listing
+        self.rank = rank
+        self.etas = {}
+
+
+def _eta(restaurant):
+    """Delivery time in minutes, or None when the listing has none (0)"""
+    try:
+        eta = int(restaurant.get('deliveryTime') or 0)
+    except (TypeError, ValueError):
+        return None
+    return eta if eta > 0 else None
+
+
+class GridMerge:
+    """
+    Deduplicate grid search results by restaurant id.
+    locations is the grid, in order; add() takes each location's results in
+    any order, and records() yields one merged dict per restaurant.
+    """
+
+    def __init__(self, locations):
+        self.locations = list(locations)
+        self._slots = {}
+        for slot, location in enumerate(self.locations):
+            self._slots.setdefault(location, slot)
+        self._index = {}
+        self.rows = 0
+
+    def __len__(self):
+        return len(self._index)
+
+    def add(self, lat, lng, restaurants):
+        """Merge one location's results"""
+        slot = self._slots[(lat, lng)]
+        for rank, restaurant in enumerate(restaurants):
+            self.rows += 1
+            restaurant_id = restaurant.get('id')
+            entry = self._index.get(restaurant_id)
+            eta = _eta(restaurant)
+            if entry is None:
+                entry = self._index[restaurant_id] = _Entry(restaurant, slot, rank)
+            elif self._better(eta, slot, entry):
+                entry.restaurant, entry.slot, entry.rank = restaurant, slot, rank
+            entry.etas[slot] = eta
+
+    @staticmethod
+    def _better(eta, slot, entry):
+        # Fastest location wins; ties go to the earlier grid point, so the
+        # result does not depend on the order responses arrived in
+        best = entry.etas.get(entry.slot)
+        if eta is None or best is None:
+            return best is None and (eta is not None or slot < entry.slot)
+        return (eta, slot) < (best, entry.slot)
+
+    def records(self):
+        """
+        One dict per restaurant, ordered by the grid position of its fastest
+        location and then by its place in that location's listing (so the
+        order does not depend on which responses arrived first): the
+        listing fields from its fastest location, plus
+          deliveryTimes  delivery time per grid location (None where not listed)
+          locationsSeen  number of locations that listed it
+          bestLat/bestLng  the location the listing fields came from
+        """
+        for entry in sorted(self._index.values(), key=lambda entry: (entry.slot, entry.rank)):
+            record = dict(entry.restaurant._asdict() if hasattr(entry.restaurant, '_asdict')
+                          else entry.restaurant)
+            times = [None] * len(self.locations)
+            for slot, eta in entry.etas.items():
+                times[slot] = eta
+            record['deliveryTimes'] = times
+            record['locationsSeen'] = len(entry.etas)
+            record['bestLat'], record['bestLng'] = self.locations[entry.slot]
+            yield record
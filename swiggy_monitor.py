@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Multi-order monitor for Swiggy CLI
+
+Tracks any number of orders from one event loop. Each order is polled at a
+rate that follows its delivery phase (slow while the restaurant prepares
+it, fast once it is out for delivery) and dropped as soon as it reaches a
+terminal status. Orders that fall due close together are polled in the
+same wake-up, through one orders/list call when the client supports it.
+"""
+
+import asyncio
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from swiggy_async import iter_async
+
+TERMINAL_STATUSES = ('delivered', 'cancelled', 'canceled', 'failed', 'rejected')
+
+# Checked in order; the first phase with a matching keyword wins
+PHASE_KEYWORDS = (
+    ('delivering', ('out for delivery', 'picked', 'on the way', 'arriving', 'dispatched',
+                    'en route', 'reached', 'nearby')),
+    ('preparing', ('placed', 'confirmed', 'accepted', 'preparing', 'prepared', 'cooking',
+                   'ready', 'assigned')),
+)
+
+# Seconds between polls per phase; 'unknown' falls back to the base interval
+DEFAULT_INTERVALS = {
+    'preparing': 60,
+    'delivering': 10,
+}
+
+# Orders due within this many seconds of each other share one wake-up
+DEFAULT_COALESCE_WINDOW = 3.0
+
+MAX_ERROR_BACKOFF = 300
+
+# One observed change; error is set (and info is None) when a poll failed
+OrderUpdate = namedtuple('OrderUpdate', ['order_id', 'status', 'phase', 'info', 'error'])
+
+
+def classify_status(status):
+    """Map a free-form order status onto 'terminal', 'delivering', 'preparing' or 'unknown'"""
+    status = (status or '').lower().replace('_', ' ')
+    if any(word in status for word in TERMINAL_STATUSES):
+        return 'terminal'
+    for phase, keywords in PHASE_KEYWORDS:
+        if any(word in status for word in keywords):
+            return phase
+    return 'unknown'
+
+
+class _TrackedOrder:
+    __slots__ = ('order_id', 'status', 'phase', 'due', 'errors')
+
+    def __init__(self, order_id, due):
+        self.order_id = order_id
+        self.status = None
+        self.phase = 'unknown'
+        self.due = due
+        self.errors = 0
+
+
+class OrderMonitor:
+    """
+    Poll many orders with phase-adaptive intervals.
+
+    fetch_status(order_id) returns a status dict (with a 'status' key) or
+    raises. fetch_many(), if given, returns {order_id: status dict} for all
+    active orders in one request; orders it doesn't mention fall back to
+    fetch_status.
+    """
+
+    def __init__(self, fetch_status, fetch_many=None, interval=30, intervals=None,
+                 coalesce_window=DEFAULT_COALESCE_WINDOW, concurrency=8):
+        self.fetch_status = fetch_status
+        self.fetch_many = fetch_many
+        self.interval = interval
+        self.intervals = dict(DEFAULT_INTERVALS if intervals is None else intervals)
+        self.coalesce_window = coalesce_window
+        self.concurrency = concurrency
+
+    def interval_for(self, phase):
+        return self.intervals.get(phase, self.interval)
+
+    async def watch(self, order_ids):
+        """
+        Async generator yielding an OrderUpdate whenever an order's status
+        changes or a poll fails. Ends once every order is terminal.
+        """
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(max_workers=self.concurrency)
+        now = time.monotonic()
+        # dict.fromkeys de-duplicates while keeping the caller's order
+        orders = {order_id: _TrackedOrder(order_id, now) for order_id in dict.fromkeys(order_ids)}
+
+        try:
+            while orders:
+                next_due = min(order.due for order in orders.values())
+                delay = next_due - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+                cutoff = time.monotonic() + self.coalesce_window
+                batch = [order for order in orders.values() if order.due <= cutoff]
+                results = await self._poll(loop, executor, [order.order_id for order in batch])
+
+                polled_at = time.monotonic()
+                for order in batch:
+                    info, error = results[order.order_id]
+                    if error is not None:
+                        order.errors += 1
+                        order.due = polled_at + min(self.interval_for(order.phase) * 2 ** order.errors,
+                                                    MAX_ERROR_BACKOFF)
+                        yield OrderUpdate(order.order_id, order.status, order.phase, None, error)
+                        continue
+
+                    order.errors = 0
+                    status = info.get('status', 'Unknown')
+                    phase = classify_status(status)
+                    changed = status != order.status
+                    order.status, order.phase = status, phase
+                    if phase == 'terminal':
+                        del orders[order.order_id]
+                    else:
+                        order.due = polled_at + self.interval_for(phase)
+                    if changed:
+                        yield OrderUpdate(order.order_id, status, phase, info, None)
+        finally:
+            executor.shutdown(wait=False)
+
+    async def _poll(self, loop, executor, order_ids):
+        """Fetch statuses for a batch; returns {order_id: (info, error)}"""
+        results = {}
+        remaining = list(order_ids)
+
+        if self.fetch_many is not None and len(remaining) > 1:
+            try:
+                active = await loop.run_in_executor(executor, self.fetch_many)
+            except Exception:
+                active = {}
+            for order_id in order_ids:
+                if order_id in active:
+                    results[order_id] = (active[order_id], None)
+            remaining = [order_id for order_id in remaining if order_id not in results]
+
+        async def fetch_one(order_id):
+            try:
+                info = await loop.run_in_executor(executor, self.fetch_status, order_id)
+            except Exception as e:
+                return order_id, (None, e)
+            if not info:
+                return order_id, (None, RuntimeError("Empty status response"))
+            return order_id, (info, None)
+
+        for order_id, outcome in await asyncio.gather(*(fetch_one(o) for o in remaining)):
+            results[order_id] = outcome
+        return results
+
+
+def iter_order_updates(monitor, order_ids):
+    """Synchronous wrapper around OrderMonitor.watch"""
+    return iter_async(monitor.watch(order_ids))
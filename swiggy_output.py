@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Machine-readable output for Swiggy CLI
+
+Record writers for --format json, jsonl, csv and arrow. Records are written
+one at a time as they are produced, so output is never truncated or held
+back until a command finishes.
+"""
+
+import csv
+import json
+import sys
+
+FORMATS = ('text', 'json', 'jsonl', 'csv', 'arrow')
+
+# Rows per Arrow record batch
+ARROW_BATCH_SIZE = 1024
+
+_RESTAURANT_COLUMNS = (
+    ('id', 'string'), ('name', 'string'), ('locality', 'string'), ('areaName', 'string'),
+    ('costForTwo', 'string'), ('cuisines', 'list<string>'), ('avgRating', 'float64'),
+    ('avgRatingString', 'string'), ('totalRatingsString', 'string'), ('deliveryTime', 'int64'),
+    ('deliveryTimeStr', 'string'), ('isOpen', 'bool'),
+)
+
+# Arrow column types per record kind. Declaring them up front means every
+# batch shares one schema (a column that is null for the first thousand
+# rows still has a type) and an empty result is still a valid IPC stream.
+RECORD_COLUMNS = {
+    'restaurant': _RESTAURANT_COLUMNS,
+    'grid_restaurant': _RESTAURANT_COLUMNS + (('lat', 'string'), ('lng', 'string')),
+    'merged_restaurant': _RESTAURANT_COLUMNS + (
+        ('deliveryTimes', 'list<int64>'), ('locationsSeen', 'int64'),
+        ('bestLat', 'string'), ('bestLng', 'string')),
+    'menu_item': (
+        ('id', 'string'), ('name', 'string'), ('price', 'int64'), ('description', 'string'),
+        ('isVeg', 'bool'), ('category', 'string')),
+    'order_status': (
+        ('orderId', 'string'), ('status', 'string'), ('eta', 'string'), ('deliveryPartner', 'string'),
+        ('restaurantName', 'string'), ('total', 'float64'), ('trackingUrl', 'string'), ('items', 'string')),
+    'order': (
+        ('orderId', 'string'), ('status', 'string'), ('restaurantName', 'string'), ('total', 'float64'),
+        ('eta', 'string'), ('orderDate', 'string')),
+}
+
+
+def to_record(obj):
+    """Turn a result (dict or namedtuple such as Restaurant) into a plain dict"""
+    if hasattr(obj, '_asdict'):
+        return obj._asdict()
+    return dict(obj)
+
+
+class JsonWriter:
+    """A single JSON array, streamed element by element"""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.count = 0
+
+    def write(self, record):
+        self.stream.write('[\n' if self.count == 0 else ',\n')
+        self.stream.write(json.dumps(to_record(record), ensure_ascii=False))
+        self.count += 1
+
+    def close(self):
+        self.stream.write('[]\n' if self.count == 0 else '\n]\n')
+        self.stream.flush()
+
+
+class JsonlWriter:
+    """One JSON object per line"""
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def write(self, record):
+        self.stream.write(json.dumps(to_record(record), ensure_ascii=False) + '\n')
+
+    def close(self):
+        self.stream.flush()
+
+
+class CsvWriter:
+    """
+    CSV with a header taken from the first record.
+    Lists of strings are joined with '|'; other nested values are JSON-encoded.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.writer = None
+
+    @staticmethod
+    def _cell(value):
+        if isinstance(value, (list, tuple)):
+            if all(isinstance(v, str) for v in value):
+                return '|'.join(value)
+            return json.dumps(value, ensure_ascii=False)
+        if isinstance(value, dict):
+            return json.dumps(value, ensure_ascii=False)
+        return value
+
+    def write(self, record):
+        record = to_record(record)
+        if self.writer is None:
+            self.writer = csv.DictWriter(self.stream, fieldnames=list(record),
+                                         extrasaction='ignore', lineterminator='\n')
+            self.writer.writeheader()
+        self.writer.writerow({key: self._cell(value) for key, value in record.items()})
+
+    def close(self):
+        self.stream.flush()
+
+
+def _coerce(value, kind):
+    """value as the Python type pyarrow expects for an Arrow column type, or None"""
+    if value is None:
+        return None
+    try:
+        if kind == 'string':
+            if isinstance(value, (list, tuple, dict)):
+                return json.dumps(value, ensure_ascii=False)
+            return str(value)
+        if kind == 'int64':
+            return int(float(value))
+        if kind == 'float64':
+            return float(value)
+        if kind == 'bool':
+            return bool(value)
+        if not isinstance(value, (list, tuple)):
+            return None
+        if kind == 'list<string>':
+            return [None if v is None else str(v) for v in value]
+        if kind == 'list<int64>':
+            return [None if v is None else int(v) for v in value]
+    except (TypeError, ValueError, OverflowError):
+        return None
+    raise ValueError(f"unknown column type {kind!r}")
+
+
+class ArrowWriter:
+    """
+    Arrow IPC stream (requires pyarrow), written in record batches.
+    The schema comes from RECORD_COLUMNS[kind]; values are coerced to the
+    declared types (null where they don't fit) and other fields are dropped.
+    Without a kind, the schema is inferred from the first batch.
+    """
+
+    def __init__(self, stream, kind=None):
+        try:
+            import pyarrow
+        except ImportError:
+            raise RuntimeError("--format arrow requires pyarrow (pip install pyarrow)")
+        self.pa = pyarrow
+        self.sink = getattr(stream, 'buffer', stream)
+        self.batch = []
+        self.columns = RECORD_COLUMNS[kind] if kind is not None else None
+        self.schema = None
+        self.writer = None
+        if self.columns is not None:
+            self.schema = pyarrow.schema([(name, self._arrow_type(column_type))
+                                         for name, column_type in self.columns])
+            self.writer = pyarrow.ipc.new_stream(self.sink, self.schema)
+
+    def _arrow_type(self, kind):
+        pa = self.pa
+        if kind.startswith('list<'):
+            return pa.list_(self._arrow_type(kind[5:-1]))
+        return {'string': pa.string(), 'int64': pa.int64(), 'float64': pa.float64(), 'bool': pa.bool_()}[kind]
+
+    def write(self, record):
+        record = to_record(record)
+        if self.columns is not None:
+            record = {name: _coerce(record.get(name), column_type) for name, column_type in self.columns}
+        self.batch.append(record)
+        if len(self.batch) >= ARROW_BATCH_SIZE:
+            self._flush()
+
+    def _flush(self):
+        if not self.batch:
+            return
+        table = self.pa.Table.from_pylist(self.batch, schema=self.schema)
+        if self.writer is None:
+            self.schema = table.schema
+            self.writer = self.pa.ipc.new_stream(self.sink, self.schema)
+        self.writer.write_table(table)
+        self.batch = []
+
+    def close(self):
+        self._flush()
+        if self.writer is None:
+            # Nothing to infer a schema from; an empty schema still makes a valid stream
+            self.writer = self.pa.ipc.new_stream(self.sink, self.pa.schema([]))
+        self.writer.close()
+        self.sink.flush()
+
+
+WRITERS = {
+    'json': JsonWriter,
+    'jsonl': JsonlWriter,
+    'csv': CsvWriter,
+    'arrow': ArrowWriter,
+}
+
+
+def open_writer(fmt, stream=None, kind=None):
+    """
+    Return a record writer for a machine-readable format. kind (a
+    RECORD_COLUMNS key) fixes the Arrow schema; other formats ignore it.
+    """
+    stream = stream if stream is not None else sys.stdout
+    if fmt == 'arrow':
+        return ArrowWriter(stream, kind)
+    return WRITERS[fmt](stream)
+
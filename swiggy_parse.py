@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Streaming parser for Swiggy restaurant listing responses
+
+Listing payloads are mostly banners, filters and layout cards; the
+restaurants live under data.cards[].card[.card].gridElements.infoWithStyle
+.restaurants[*].info. iter_restaurants follows that path through the raw
+body, the same one restaurants_from_data walks, and decodes one restaurant
+at a time. Everything off the path is decoded a member at a time and
+dropped, so the whole payload is never held as Python objects at once.
+"""
+
+import json
+import re
+from collections import namedtuple
+from json.decoder import scanstring
+
+RESTAURANT_FIELDS = (
+    'id', 'name', 'locality', 'areaName', 'costForTwo', 'cuisines',
+    'avgRating', 'avgRatingString', 'totalRatingsString',
+    'deliveryTime', 'deliveryTimeStr', 'isOpen',
+)
+
+
+class Restaurant(namedtuple('Restaurant', RESTAURANT_FIELDS)):
+    """
+    Compact restaurant record.
+    Supports .get() and r['field'] so code written against the old dict
+    results keeps working; membership stays the tuple's (values, not field names).
+    """
+    __slots__ = ()
+
+    def get(self, key, default=None):
+        if key in self._fields:
+            return getattr(self, key)
+        return default
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return getattr(self, key)
+        return super().__getitem__(key)
+
+
+def restaurant_from_info(info):
+    """Build a Restaurant from a listing card's `info` dict"""
+    sla = info.get('sla') or {}
+    return Restaurant(
+        info['id'],
+        info['name'],
+        info.get('locality', ''),
+        info.get('areaName', ''),
+        info.get('costForTwo', ''),
+        info.get('cuisines', []),
+        info.get('avgRating', 0),
+        info.get('avgRatingString', 'N/A'),
+        info.get('totalRatingsString', '0'),
+        sla.get('deliveryTime', 0),
+        sla.get('slaString', 'N/A'),
+        info.get('isOpen', False),
+    )
+
+
+def listing_restaurant(info):
+    """
+    restaurant_from_info for one listing card, or None when the card lacks
+    an id or name or has a nested field of the wrong type (e.g. a string sla)
+    """
+    if 'id' not in info or 'name' not in info:
+        return None
+    try:
+        return restaurant_from_info(info)
+    except (AttributeError, TypeError, KeyError):
+        # Skip the malformed card rather than lose the whole search
+        return None
+
+
+def restaurants_from_data(data):
+    """
+    Restaurants from an already-decoded listing response (the dict walk of
+    SwiggyClient._parse_restaurants, building Restaurant records)
+    """
+    restaurants = []
+    if not isinstance(data, dict) or not isinstance(data.get('data'), dict):
+        return restaurants
+    cards = data['data'].get('cards')
+    if not isinstance(cards, list):
+        return restaurants
+    for card in cards:
+        card_data = card.get('card') if isinstance(card, dict) else None
+        if isinstance(card_data, dict) and 'card' in card_data:
+            card_data = card_data['card']
+        if not isinstance(card_data, dict):
+            continue
+        try:
+            info_with_style = (card_data.get('gridElements') or {}).get('infoWithStyle') or {}
+            entries = list(info_with_style.get('restaurants') or ())
+        except (AttributeError, TypeError):
+            # A widget shaped differently than a listing; skip it
+            continue
+        for restaurant in entries:
+            info = restaurant.get('info') if isinstance(restaurant, dict) else None
+            if isinstance(info, dict):
+                record = listing_restaurant(info)
+                if record is not None:
+                    restaurants.append(record)
+    return restaurants
+
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+# Path steps besides member names: EACH is every element of an array,
+# WIDGET is a card's inner card when it has one and the card itself otherwise
+_EACH = object()
+_WIDGET = object()
+
+# Where restaurants_from_data looks: data.cards[].card[.card].gridElements...
+_LISTING_PATH = ('data', 'cards', _EACH, 'card', _WIDGET,
+                 'gridElements', 'infoWithStyle', 'restaurants')
+
+
+def _skip_ws(text, pos):
+    if text[pos] not in ' \t\n\r':
+        return pos
+    return _WHITESPACE.match(text, pos).end()
+
+
+def _walk(text, pos, path):
+    """
+    Yield the start of each value at `path` below the value starting at
+    text[pos]; the consumer reads that value and sends back the position
+    just past it. Returns the position just past text[pos]'s value. Values
+    off the path are skipped one member or element at a time.
+    """
+    if not path:
+        end = yield pos
+        return end
+    step, rest = path[0], path[1:]
+    char = text[pos]
+
+    if step is _EACH and char == '[':
+        pos = _skip_ws(text, pos + 1)
+        if text[pos] == ']':
+            return pos + 1
+        while True:
+            pos = yield from _walk(text, pos, rest)
+            pos = _skip_ws(text, pos)
+            if text[pos] == ']':
+                return pos + 1
+            if text[pos] != ',':
+                raise ValueError(f"Expected ',' or ']' at {pos}")
+            pos = _skip_ws(text, pos + 1)
+
+    if step is _EACH or char != '{':
+        _, end = _decoder.raw_decode(text, pos)
+        return end
+
+    # Object: follow the member named by this step (WIDGET follows 'card',
+    # falling back to the object's own rest[0] member if there is no 'card')
+    wanted = 'card' if step is _WIDGET else step
+    inner, fallback = False, -1
+    pos = _skip_ws(text, pos + 1)
+    if text[pos] == '}':
+        return pos + 1
+    while True:
+        if text[pos] != '"':
+            raise ValueError(f"Expected member name at {pos}")
+        key, pos = scanstring(text, pos + 1)
+        pos = _skip_ws(text, pos)
+        if text[pos] != ':':
+            raise ValueError(f"Expected ':' at {pos}")
+        pos = _skip_ws(text, pos + 1)
+        if key == wanted:
+            inner = True
+            pos = yield from _walk(text, pos, rest)
+        else:
+            if step is _WIDGET and key == rest[0]:
+                fallback = pos
+            _, pos = _decoder.raw_decode(text, pos)
+        pos = _skip_ws(text, pos)
+        if text[pos] == '}':
+            break
+        if text[pos] != ',':
+            raise ValueError(f"Expected ',' or '}}' at {pos}")
+        pos = _skip_ws(text, pos + 1)
+    if step is _WIDGET and not inner and fallback >= 0:
+        yield from _walk(text, fallback, rest[1:])
+    return pos + 1
+
+
+def _iter_infos(text, pos):
+    """
+    Decode the restaurants array at text[pos] == '[' one entry at a time,
+    yielding each entry's info; returns the position just past the array
+    """
+    pos = _skip_ws(text, pos + 1)
+    if text[pos] == ']':
+        return pos + 1
+    while True:
+        restaurant, pos = _decoder.raw_decode(text, pos)
+        info = restaurant.get('info') if isinstance(restaurant, dict) else None
+        if isinstance(info, dict):
+            yield info
+        pos = _skip_ws(text, pos)
+        if text[pos] == ']':
+            return pos + 1
+        if text[pos] != ',':
+            raise ValueError(f"Expected ',' or ']' at {pos}")
+        pos = _skip_ws(text, pos + 1)
+
+
+def _iter_restaurant_infos(text):
+    pos = _skip_ws(text, 0)
+    try:
+        if text[pos] != '{':
+            return
+        walker = _walk(text, pos, _LISTING_PATH)
+        list_pos = next(walker)
+        while True:
+            if text[list_pos] == '[':
+                end = yield from _iter_infos(text, list_pos)
+            else:
+                _, end = _decoder.raw_decode(text, list_pos)
+            list_pos = walker.send(end)
+    except StopIteration:
+        return
+    except (ValueError, IndexError):
+        # Malformed body; keep what was decoded before the error
+        return
+
+
+def iter_restaurants(raw):
+    """
+    Yield a Restaurant for each listing in a restaurants/list response body.
+    `raw` may be bytes or str.
+    """
+    text = raw.decode('utf-8') if isinstance(raw, (bytes, bytearray)) else raw
+    for info in _iter_restaurant_infos(text):
+        restaurant = listing_restaurant(info)
+        if restaurant is not None:
+            yield restaurant
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+Adaptive coverage planning for Swiggy CLI (`swiggy plan`)
+
+Covers a bounding box or polygon with as few searches as possible. The
+area starts as a coarse grid of cells; each cell is sampled at its four
+corners and its center (neighbouring cells share corners, so each point
+is searched once). A cell of a polygon that none of those points falls
+inside is seeded with the polygon's vertices in it instead.
+
+A cell is split into four, and its children sampled in the next round,
+only while its new points still find at least min_new restaurants not
+seen before and it looks under-sampled:
+
+  - some response was a full page (as long as the longest one so far), so
+    restaurants near that point may have been cut off, and the points
+    don't all return nearly the same restaurants. Only the children
+    around a point that added at least min_yield of a page of new
+    restaurants are sampled; or
+  - no response was full, but some point shares no restaurant with the
+    cell's other points, so there may be a gap between them.
+
+A cell whose responses all fit on a page and overlap has returned every
+restaurant its points can reach. Splitting stops at a minimum cell size.
+Dense areas end up finely sampled while sparse and uniform ones stay
+coarse, and the sampled points form a grid CSV that `search --grid` and
+`sync --grid` can reuse.
+"""
+
+import math
+from collections import namedtuple
+
+KM_PER_DEG_LAT = 110.574
+
+# Sampled points are rounded to ~11 m so shared corners get identical keys
+COORD_FORMAT = "{:.4f}"
+
+DEFAULT_CELL_KM = 4.0
+DEFAULT_MIN_CELL_KM = 0.5
+DEFAULT_SIMILARITY = 0.9
+DEFAULT_MIN_NEW = 1
+DEFAULT_MIN_YIELD = 0.5
+
+# One search the planner asked for; ids is None when it failed
+PlanSample = namedtuple('PlanSample', ['lat', 'lng', 'ids', 'depth'])
+
+
+def km_per_deg_lng(lat):
+    return 111.320 * math.cos(math.radians(lat))
+
+
+def parse_bbox(text):
+    """'south,west,north,east' -> floats, validated"""
+    try:
+        south, west, north, east = (float(part) for part in text.split(','))
+    except ValueError:
+        raise ValueError(f"expected 'south,west,north,east' but got {text!r}")
+    if not (-90 <= south < north <= 90 and -180 <= west < east <= 180):
+        raise ValueError(f"empty or out-of-range bounding box {text!r}")
+    return south, west, north, east
+
+
+def load_polygon(path):
+    """Polygon vertices [(lat, lng)] from a CSV in the --grid format"""
+    from swiggy_async import load_grid
+
+    vertices = [(float(lat), float(lng)) for lat, lng in load_grid(path)]
+    if len(vertices) < 3:
+        raise ValueError(f"{path}: a polygon needs at least 3 points")
+    return vertices
+
+
+def polygon_bbox(polygon):
+    lats = [lat for lat, _ in polygon]
+    lngs = [lng for _, lng in polygon]
+    return min(lats), min(lngs), max(lats), max(lngs)
+
+
+def point_in_polygon(lat, lng, polygon):
+    """Even-odd ray casting; points on an edge may land either side"""
+    inside = False
+    j = len(polygon) - 1
+    for i in range(len(polygon)):
+        lat_i, lng_i = polygon[i]
+        lat_j, lng_j = polygon[j]
+        if (lat_i > lat) != (lat_j > lat):
+            crossing = lng_i + (lat - lat_i) / (lat_j - lat_i) * (lng_j - lng_i)
+            if lng < crossing:
+                inside = not inside
+        j = i
+    return inside
+
+
+def uniform_grid_size(bbox, spacing_km, polygon=None):
+    """Points a uniform grid at spacing_km would need to cover the area"""
+    south, west, north, east = bbox
+    rows = int(math.ceil((north - south) * KM_PER_DEG_LAT / spacing_km)) + 1
+    cols = int(math.ceil((east - west) * km_per_deg_lng((south + north) / 2) / spacing_km)) + 1
+    if polygon is None:
+        return rows * cols
+    count = 0
+    for r in range(rows):
+        lat = south + (north - south) * r / max(1, rows - 1)
+        for c in range(cols):
+            if point_in_polygon(lat, west + (east - west) * c / max(1, cols - 1), polygon):
+                count += 1
+    return count
+
+
+class _Cell:
+    __slots__ = ('south', 'west', 'north', 'east', 'depth')
+
+    def __init__(self, south, west, north, east, depth):
+        self.south = south
+        self.west = west
+        self.north = north
+        self.east = east
+        self.depth = depth
+
+    def points(self):
+        mid_lat, mid_lng = (self.south + self.north) / 2, (self.west + self.east) / 2
+        return [(self.south, self.west), (self.south, self.east), (self.north, self.west),
+                (self.north, self.east), (mid_lat, mid_lng)]
+
+    def contains(self, lat, lng):
+        return self.south <= lat <= self.north and self.west <= lng <= self.east
+
+    def size_km(self):
+        height = (self.north - self.south) * KM_PER_DEG_LAT
+        width = (self.east - self.west) * km_per_deg_lng((self.south + self.north) / 2)
+        return max(height, width)
+
+    def split(self):
+        mid_lat, mid_lng = (self.south + self.north) / 2, (self.west + self.east) / 2
+        depth = self.depth + 1
+        return [_Cell(self.south, self.west, mid_lat, mid_lng, depth),
+                _Cell(self.south, mid_lng, mid_lat, self.east, depth),
+                _Cell(mid_lat, self.west, self.north, mid_lng, depth),
+                _Cell(mid_lat, mid_lng, self.north, self.east, depth)]
+
+
+def _key(lat, lng):
+    return COORD_FORMAT.format(lat), COORD_FORMAT.format(lng)
+
+
+class CoveragePlanner:
+    """
+    Adaptive sampling of an area. search(locations) runs one round of
+    searches and yields (lat, lng, restaurants or None on error) for each
+    (lat, lng) string pair, in any order; swiggy_async.iter_grid_search
+    fits directly.
+
+    similarity is the fraction of a cell's restaurants every one of its
+    points must return for the cell to count as uniform; a cell is only
+    split when its new points found at least min_new unseen restaurants;
+    max_requests caps the total number of searches. A response with
+    page_size or more restaurants counts as a full page; by default that
+    is the longest response seen so far. A cell split over full pages only
+    keeps the children around a point that added min_yield (a fraction of
+    a page) new restaurants.
+    """
+
+    def __init__(self, search, bbox=None, polygon=None, cell_km=DEFAULT_CELL_KM,
+                 min_cell_km=DEFAULT_MIN_CELL_KM, similarity=DEFAULT_SIMILARITY, max_requests=None,
+                 min_new=DEFAULT_MIN_NEW, page_size=None, min_yield=DEFAULT_MIN_YIELD):
+        if bbox is None and polygon is None:
+            raise ValueError("a bounding box or polygon is required")
+        if not 0 < min_cell_km <= cell_km:
+            raise ValueError("cell sizes must satisfy 0 < min_cell_km <= cell_km")
+        self.search = search
+        self.polygon = polygon
+        self.bbox = bbox if bbox is not None else polygon_bbox(polygon)
+        self.cell_km = cell_km
+        self.min_cell_km = min_cell_km
+        self.similarity = similarity
+        self.max_requests = max_requests
+        self.min_new = min_new
+        self.page_size = page_size
+        self.min_yield = min_yield
+        self.longest = 0
+        # key -> restaurants the search added to seen (in grid order)
+        self.yields = {}
+        # (lat, lng) key -> set of restaurant ids, or None for a failed search
+        self.samples = {}
+        self.order = []
+        self.seen = set()
+        self.rounds = 0
+        self.truncated = False
+
+    @property
+    def requests(self):
+        return len(self.samples)
+
+    def _inside(self, lat, lng):
+        return self.polygon is None or point_in_polygon(lat, lng, self.polygon)
+
+    def _initial_cells(self):
+        south, west, north, east = self.bbox
+        rows = max(1, int(math.ceil((north - south) * KM_PER_DEG_LAT / self.cell_km)))
+        cols = max(1, int(math.ceil((east - west) * km_per_deg_lng((south + north) / 2) / self.cell_km)))
+        step_lat, step_lng = (north - south) / rows, (east - west) / cols
+        return [_Cell(south + r * step_lat, west + c * step_lng,
+                      south + (r + 1) * step_lat, west + (c + 1) * step_lng, 0)
+                for r in range(rows) for c in range(cols)]
+
+    def _cell_keys(self, cell):
+        keys = [_key(lat, lng) for lat, lng in cell.points() if self._inside(lat, lng)]
+        if not keys and self.polygon is not None:
+            # A sliver or small polygon can miss every corner and the center
+            keys = [_key(lat, lng) for lat, lng in self.polygon if cell.contains(lat, lng)]
+            keys = list(dict.fromkeys(keys))
+        return keys
+
+    def _page(self):
+        return self.page_size if self.page_size is not None else self.longest
+
+    def _full(self, ids):
+        page = self._page()
+        return page > 0 and len(ids) >= page
+
+    def _overlapping(self, sets):
+        """Every point that found restaurants shares one with another point"""
+        for i, ids in enumerate(sets):
+            if ids and not any(ids & other for j, other in enumerate(sets) if j != i):
+                return False
+        return True
+
+    def _uniform(self, sets):
+        union = set().union(*sets)
+        if not union:
+            return True
+        return all(len(ids) >= self.similarity * len(union) for ids in sets)
+
+    def run(self):
+        """Sample the area round by round, yielding a PlanSample per search"""
+        cells = [cell for cell in self._initial_cells() if self._cell_keys(cell)]
+        while cells:
+            self.rounds += 1
+            wanted = []
+            queued = set()
+            kept = []
+            for cell in cells:
+                new = [key for key in self._cell_keys(cell) if key not in self.samples and key not in queued]
+                if self.max_requests is not None and self.requests + len(wanted) + len(new) > self.max_requests:
+                    self.truncated = True
+                    break
+                wanted.extend(new)
+                queued.update(new)
+                kept.append(cell)
+
+            known = set(self.seen)
+            depth = cells[0].depth
+            found = {}
+            for lat, lng, restaurants in self.search(wanted):
+                ids = None if restaurants is None else {r.get('id') for r in restaurants}
+                found[(lat, lng)] = ids
+                yield PlanSample(lat, lng, ids, depth)
+            # Merge in grid order, so the plan doesn't depend on response order
+            for key in wanted:
+                ids = found.get(key)
+                self.samples[key] = ids
+                self.order.append(key)
+                if ids:
+                    self.yields[key] = len(ids - self.seen)
+                    self.seen.update(ids)
+                    self.longest = max(self.longest, len(ids))
+
+            cells = []
+            for cell in kept:
+                keys = self._cell_keys(cell)
+                sets = [self.samples[key] for key in keys if self.samples.get(key) is not None]
+                if len(sets) < 2 or cell.size_km() / 2 < self.min_cell_km:
+                    continue
+                new_ids = set()
+                for key in keys:
+                    if key in queued and self.samples[key]:
+                        new_ids |= self.samples[key] - known
+                if len(new_ids) < self.min_new:
+                    continue
+                if any(self._full(ids) for ids in sets):
+                    if self._uniform(sets):
+                        continue
+                    # Only refine around points that still added a good share of a page
+                    wanted_yield = self.min_yield * self._page()
+                    children = [child for child in cell.split()
+                                if any(self.yields.get(key, 0) >= wanted_yield for key in self._cell_keys(child))]
+                elif not self._overlapping(sets):
+                    children = [child for child in cell.split() if self._cell_keys(child)]
+                else:
+                    continue
+                cells.extend(children)
+            if self.truncated:
+                break
+
+    def points(self):
+        """Sampled (lat, lng) strings in the order they were planned, failures included"""
+        return list(self.order)
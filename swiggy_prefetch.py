@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Bulk menu prefetch for Swiggy CLI
+
+Fetches menus for many restaurant IDs through one client (one session and
+connection pool) with a fixed worker pool. Results are appended to a JSONL
+file as each fetch completes, so an interrupted run loses nothing and a
+rerun skips every ID that already has a successful record fetched with the
+same --category/--limit filter.
+"""
+
+import json
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+DEFAULT_WORKERS = 8
+
+# Fetches queued per worker before we wait for results (backpressure)
+QUEUE_FACTOR = 2
+
+
+def read_ids(path):
+    """
+    Read restaurant IDs, one per line (first comma/whitespace-separated field).
+    Blank lines and '#' comments are skipped; duplicates are dropped.
+    """
+    ids = []
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            ids.append(line.replace(',', ' ').split()[0])
+    return list(dict.fromkeys(ids))
+
+
+def completed_ids(out_path, menu_filter=None):
+    """
+    IDs that already have an 'ok' record in out_path fetched with menu_filter
+    (None for full menus). A partial last line left by a crash is truncated away.
+    """
+    done = set()
+    if not os.path.exists(out_path):
+        return done
+
+    with open(out_path, 'rb+') as f:
+        data = f.read()
+        end = data.rfind(b'\n') + 1
+        if end < len(data):
+            f.truncate(end)
+        for line in data[:end].splitlines():
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            # Records written before filters were stored hold full menus
+            if record.get('status') == 'ok' and record.get('filter') == menu_filter:
+                done.add(str(record.get('restaurant_id')))
+    return done
+
+
+def prefetch_menus(fetch_menu, ids, out_path, workers=DEFAULT_WORKERS, on_result=None, menu_filter=None):
+    """
+    Fetch menus for `ids` with `workers` threads, appending one JSONL record
+    per ID to out_path as soon as it completes.
+
+    fetch_menu(restaurant_id) returns a list of items or raises.
+    menu_filter describes what fetch_menu leaves out (e.g. {'category': ...,
+    'limit': ...}) and is stored in each record, so a rerun only skips IDs
+    fetched with the same filter.
+    on_result(record, done, total) is called after each record is written.
+    Returns (fetched, failed, skipped) counts.
+    """
+    done = completed_ids(out_path, menu_filter)
+    pending = [restaurant_id for restaurant_id in ids if str(restaurant_id) not in done]
+    skipped = len(ids) - len(pending)
+    total = len(pending)
+    fetched = failed = 0
+
+    out_dir = os.path.dirname(out_path)
+    if out_dir:
+        os.makedirs(out_dir, exist_ok=True)
+
+    with open(out_path, 'a') as out, ThreadPoolExecutor(max_workers=workers) as executor:
+        queue = iter(pending)
+        in_flight = {}
+
+        def submit(limit):
+            for restaurant_id in queue:
+                in_flight[executor.submit(fetch_menu, restaurant_id)] = restaurant_id
+                if len(in_flight) >= limit:
+                    return
+
+        submit(workers * QUEUE_FACTOR)
+        while in_flight:
+            finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in finished:
+                restaurant_id = in_flight.pop(future)
+                record = {'restaurant_id': restaurant_id, 'fetched_at': time.time()}
+                if menu_filter is not None:
+                    record['filter'] = menu_filter
+                try:
+                    items = future.result()
+                    if items is None:
+                        raise RuntimeError("No menu returned")
+                    record.update(status='ok', items=list(items))
+                    fetched += 1
+                except Exception as e:
+                    record.update(status='error', error=str(e))
+                    failed += 1
+
+                out.write(json.dumps(record, ensure_ascii=False) + '\n')
+                out.flush()
+                if on_result:
+                    on_result(record, fetched + failed, total)
+
+            submit(workers * QUEUE_FACTOR)
+
+    return fetched, failed, skipped
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Request and parse instrumentation for Swiggy CLI (--profile)
+
+Profiler.transport_hook times every HTTP call made through SwiggyTransport;
+Profiler.span times decode, parse and render steps. At exit the CLI prints
+per-endpoint latency percentiles, bytes received, cache hits and step
+timings, and can write a Chrome trace (chrome://tracing, Perfetto).
+"""
+
+import json
+import os
+import re
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+# Path segments that look like IDs are collapsed so orders/123 and
+# orders/456 report as one endpoint ('v5'-style version segments are kept)
+_ID_SEGMENT = re.compile(r'^(?!v\d+$).*\d')
+
+
+def endpoint_name(url):
+    """Short endpoint label for a URL, e.g. 'restaurants/list/v5' or 'orders/{id}'"""
+    path = urlparse(url).path
+    if '/dapi/' in path:
+        path = path.split('/dapi/', 1)[1]
+    segments = [('{id}' if _ID_SEGMENT.match(s) else s) for s in path.strip('/').split('/')]
+    return '/'.join(segments) or '/'
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of an unsorted list"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, int(round(pct / 100.0 * len(ordered))))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+class _NullProfiler:
+    """Stand-in used when profiling is off; every hook is a no-op"""
+
+    @contextmanager
+    def span(self, name, **args):
+        yield
+
+    def cache_hit(self, endpoint):
+        pass
+
+    def coalesced(self, endpoint):
+        pass
+
+
+NULL_PROFILER = _NullProfiler()
+
+
+class Profiler:
+    """Collects request and step timings from any number of threads"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+        # endpoint -> list of (total, wait, bytes, status)
+        self.requests = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.cache_hits = defaultdict(int)
+        # Calls that shared another caller's in-flight request
+        self.shared = defaultdict(int)
+        # step name -> list of durations
+        self.spans = defaultdict(list)
+        self.events = []
+
+    def _event(self, name, category, start, duration, args=None):
+        self.events.append({
+            'name': name,
+            'cat': category,
+            'ph': 'X',
+            'ts': (start - self._origin) * 1e6,
+            'dur': duration * 1e6,
+            'pid': os.getpid(),
+            'tid': threading.get_ident(),
+            'args': args or {},
+        })
+
+    def transport_hook(self, send, method, url, **kwargs):
+        """SwiggyTransport hook timing the full request, including body download"""
+        endpoint = endpoint_name(url)
+        start = time.perf_counter()
+        try:
+            response = send(method, url, **kwargs)
+            size = len(response.content)
+        except Exception as e:
+            duration = time.perf_counter() - start
+            with self._lock:
+                self.errors[endpoint] += 1
+                self._event(f"{method} {endpoint}", 'http', start, duration, {'error': str(e)})
+            raise
+        duration = time.perf_counter() - start
+        # requests' elapsed covers connect + TLS + server time up to the headers
+        wait = response.elapsed.total_seconds()
+        with self._lock:
+            self.requests[endpoint].append((duration, wait, size, response.status_code))
+            self._event(f"{method} {endpoint}", 'http', start, duration,
+                        {'status': response.status_code, 'bytes': size, 'wait_ms': wait * 1000})
+        return response
+
+    @contextmanager
+    def span(self, name, **args):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            with self._lock:
+                self.spans[name].append(duration)
+                self._event(name, name.split(':', 1)[0], start, duration, args)
+
+    def cache_hit(self, endpoint):
+        with self._lock:
+            self.cache_hits[endpoint_name(endpoint)] += 1
+
+    def coalesced(self, endpoint):
+        with self._lock:
+            self.shared[endpoint_name(endpoint)] += 1
+
+    def report(self, stream):
+        """Write a plain-text timing summary"""
+        write = stream.write
+        write("\nProfile\n" + "=" * 78 + "\n")
+
+        endpoints = sorted(set(self.requests) | set(self.errors) | set(self.cache_hits) | set(self.shared))
+        if endpoints:
+            write(f"{'endpoint':<24} {'calls':>5} {'hits':>5} {'shared':>6} {'err':>4} "
+                  f"{'p50 ms':>8} {'p95 ms':>8} {'max ms':>8} {'wait p50':>9} {'KB':>8}\n")
+        for endpoint in endpoints:
+            samples = self.requests.get(endpoint, [])
+            totals = [s[0] * 1000 for s in samples]
+            waits = [s[1] * 1000 for s in samples]
+            kb = sum(s[2] for s in samples) / 1024
+            write(f"{endpoint:<24} {len(samples):>5} {self.cache_hits.get(endpoint, 0):>5} "
+                  f"{self.shared.get(endpoint, 0):>6} {self.errors.get(endpoint, 0):>4} {percentile(totals, 50):>8.1f} "
+                  f"{percentile(totals, 95):>8.1f} {max(totals or [0]):>8.1f} "
+                  f"{percentile(waits, 50):>9.1f} {kb:>8.1f}\n")
+
+        if self.spans:
+            write(f"\n{'step':<24} {'calls':>5} {'total ms':>9} {'p50 ms':>8} {'max ms':>8}\n")
+            for name in sorted(self.spans):
+                durations = [d * 1000 for d in self.spans[name]]
+                write(f"{name:<24} {len(durations):>5} {sum(durations):>9.1f} "
+                      f"{percentile(durations, 50):>8.2f} {max(durations):>8.2f}\n")
+        write("\n")
+
+    def write_chrome_trace(self, path):
+        """Write collected events in Chrome trace-event JSON format"""
+        with self._lock:
+            events = list(self.events)
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
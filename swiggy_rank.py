@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Ranking and filtering of search results for Swiggy CLI
+
+With NumPy installed, rank() pulls rating, delivery time, cost for two and
+the open flag out of the results once, into parallel arrays, then filters
+and orders with whole-array operations. Without it, the filters run one at
+a time on plain lists and only the surviving rows have their sort field
+parsed. costForTwo strings ("₹600 for two") are parsed to integers through
+a cache, so repeated values across a grid sweep are parsed once.
+
+The composite score is a weighted sum of min-max normalized columns over
+the filtered results: higher rating, shorter ETA and lower cost score
+better, and a missing value scores as the worst.
+"""
+
+import math
+import re
+from functools import lru_cache
+
+SORT_KEYS = ('rating', 'eta', 'cost', 'score')
+
+DEFAULT_WEIGHTS = {'rating': 0.5, 'eta': 0.3, 'cost': 0.2}
+
+_NUMBER = re.compile(r'\d[\d,]*')
+
+
+@lru_cache(maxsize=4096)
+def parse_cost(value):
+    """'₹600 for two' -> 600; None if the value has no number"""
+    if isinstance(value, (int, float)):
+        return int(value)
+    match = _NUMBER.search(value or '')
+    return int(match.group().replace(',', '')) if match else None
+
+
+def parse_weights(text):
+    """Parse 'rating=0.5,eta=0.3,cost=0.2' (omitted keys weigh 0)"""
+    weights = dict.fromkeys(DEFAULT_WEIGHTS, 0.0)
+    for part in text.split(','):
+        name, _, value = part.partition('=')
+        name = name.strip()
+        if name not in weights:
+            raise ValueError(f"unknown weight {name!r} (expected {', '.join(DEFAULT_WEIGHTS)})")
+        try:
+            weights[name] = float(value)
+        except ValueError:
+            raise ValueError(f"weight {name!r} needs a number")
+    return weights
+
+
+def _positive(value):
+    """Float value, or NaN when missing/zero (the API uses 0 for 'unknown')"""
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return math.nan
+    return value if value > 0 else math.nan
+
+
+def _columns(restaurants):
+    """One pass over the results: (rating, eta, cost, is_open) lists"""
+    rating, eta, cost, is_open = [], [], [], []
+    for r in restaurants:
+        rating.append(_positive(r.get('avgRating')))
+        eta.append(_positive(r.get('deliveryTime')))
+        cost.append(_positive(parse_cost(r.get('costForTwo'))))
+        is_open.append(bool(r.get('isOpen')))
+    return rating, eta, cost, is_open
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def rank_indices(restaurants, sort=None, min_rating=None, max_eta=None, open_only=False, weights=None):
+    """
+    Indices of the results that pass every filter, ordered by `sort`
+    ('rating' and 'score' descending, 'eta' and 'cost' ascending; missing
+    values last; ties keep API order), or in API order if sort is None.
+    """
+    if not restaurants:
+        return []
+    weights = DEFAULT_WEIGHTS if weights is None else weights
+    np = _numpy()
+    if np is not None:
+        return _rank_numpy(np, _columns(restaurants), sort, min_rating, max_eta, open_only, weights)
+    return _rank_lists(restaurants, sort, min_rating, max_eta, open_only, weights)
+
+
+def rank(restaurants, sort=None, min_rating=None, max_eta=None, open_only=False, weights=None):
+    """Filtered and ordered copy of `restaurants` (see rank_indices)"""
+    return [restaurants[i] for i in rank_indices(restaurants, sort, min_rating, max_eta, open_only, weights)]
+
+
+def _rank_numpy(np, columns, sort, min_rating, max_eta, open_only, weights):
+    rating, eta, cost = (np.asarray(column, dtype=np.float64) for column in columns[:3])
+    is_open = np.asarray(columns[3], dtype=bool)
+
+    mask = np.ones(len(rating), dtype=bool)
+    # NaN comparisons are False, so unknown ratings/ETAs fail these filters
+    if min_rating is not None:
+        mask &= rating >= min_rating
+    if max_eta is not None:
+        mask &= eta <= max_eta
+    if open_only:
+        mask &= is_open
+    index = np.flatnonzero(mask)
+    if sort is None:
+        return index.tolist()
+
+    def normalized(values, higher_is_better):
+        known = ~np.isnan(values)
+        if not known.any():
+            return np.zeros(len(values))
+        low, high = values[known].min(), values[known].max()
+        scaled = (values - low) / (high - low) if high > low else np.ones(len(values))
+        if not higher_is_better:
+            scaled = 1 - scaled
+        return np.where(known, scaled, 0.0)
+
+    rating, eta, cost = rating[index], eta[index], cost[index]
+    if sort == 'rating':
+        key = -rating
+    elif sort == 'eta':
+        key = eta
+    elif sort == 'cost':
+        key = cost
+    else:
+        key = -(weights.get('rating', 0) * normalized(rating, True)
+                + weights.get('eta', 0) * normalized(eta, False)
+                + weights.get('cost', 0) * normalized(cost, False))
+    # argsort places NaN last; stable keeps API order for ties
+    return index[np.argsort(key, kind='stable')].tolist()
+
+
+def _rank_lists(restaurants, sort, min_rating, max_eta, open_only, weights):
+    # Without NumPy, filter first so fields are parsed only for rows still in play
+    index = range(len(restaurants))
+    if open_only:
+        index = [i for i in index if restaurants[i].get('isOpen')]
+    if min_rating is not None:
+        index = [i for i in index if _positive(restaurants[i].get('avgRating')) >= min_rating]
+    if max_eta is not None:
+        index = [i for i in index if _positive(restaurants[i].get('deliveryTime')) <= max_eta]
+    index = list(index)
+    if sort is None:
+        return index
+
+    def column(field):
+        if field == 'cost':
+            return [_positive(parse_cost(restaurants[i].get('costForTwo'))) for i in index]
+        return [_positive(restaurants[i].get(field)) for i in index]
+
+    def normalized(values, higher_is_better):
+        known = [v for v in values if v == v]
+        if not known:
+            return [0.0] * len(values)
+        low, high = min(known), max(known)
+        span = high - low
+        result = []
+        for v in values:
+            if v != v:
+                result.append(0.0)
+                continue
+            scaled = (v - low) / span if span else 1.0
+            result.append(scaled if higher_is_better else 1 - scaled)
+        return result
+
+    if sort == 'rating':
+        key = [-v for v in column('avgRating')]
+    elif sort == 'eta':
+        key = column('deliveryTime')
+    elif sort == 'cost':
+        key = column('cost')
+    else:
+        parts = (
+            [weights.get('rating', 0) * v for v in normalized(column('avgRating'), True)],
+            [weights.get('eta', 0) * v for v in normalized(column('deliveryTime'), False)],
+            [weights.get('cost', 0) * v for v in normalized(column('cost'), False)],
+        )
+        key = [-sum(values) for values in zip(*parts)]
+    # NaN (missing) never compares, so rank it as +inf to keep it last
+    key = [math.inf if v != v else v for v in key]
+    order = sorted(range(len(index)), key=key.__getitem__)
+    return [index[i] for i in order]
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Adaptive client-side rate limiting for Swiggy CLI
+
+Each endpoint family (restaurants/list, menu/pl, orders) has a token bucket.
+Every request takes a token, waiting if the bucket is empty. A 202 or 429
+response (Swiggy's anti-automation answers) halves that family's rate and
+drains its bucket; each success raises the rate again in small steps, up to
+a ceiling. Buckets are shared by all threads in the process, and
+optionally by every process through a lock file (shared_path).
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from swiggy_profile import endpoint_name
+
+SHARED_STATE_FILE = os.path.expanduser("~/.swiggy-cli/ratelimit.json")
+
+# Endpoint prefix -> (starting requests/second, burst size); longest prefix wins.
+# Endpoints without a family are not limited.
+DEFAULT_RATES = {
+    "restaurants/list": (4.0, 8),
+    "menu/pl": (2.0, 4),
+    "orders": (1.0, 2),
+}
+
+# Requests a grid fan-out (search --grid, sync, plan) keeps in flight unless
+# --concurrency says otherwise; fit_fanout sizes the restaurants/list burst to it
+DEFAULT_CONCURRENCY = 8
+
+THROTTLE_STATUSES = (202, 429)
+
+# Rate is multiplied by this on a throttled response...
+BACKOFF_FACTOR = 0.5
+# ...and grows by this fraction of the starting rate per success
+RECOVERY_STEP = 0.1
+# Bounds relative to the starting rate
+MIN_RATE_FACTOR = 1 / 16.0
+MAX_RATE_FACTOR = 4.0
+
+# Longest single sleep while waiting for a token, so shared state is re-read
+MAX_SLEEP = 1.0
+
+
+class TokenBucket:
+    """Token bucket whose refill rate adapts between min_rate and max_rate"""
+
+    def __init__(self, rate, burst, tokens=None, updated=None):
+        self.base_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst) if tokens is None else tokens
+        self.updated = time.monotonic() if updated is None else updated
+
+    def _refill(self, now):
+        # monotonic time restarts at boot; treat older shared state as stale
+        if now < self.updated:
+            self.updated = now
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def take(self, now):
+        """Take a token; returns 0 on success, else seconds until one is available"""
+        self._refill(now)
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def charge(self, now, count):
+        """Account for requests that were sent without waiting (transport retries)"""
+        self._refill(now)
+        self.tokens -= count
+
+    def throttled(self):
+        self.rate = max(self.base_rate * MIN_RATE_FACTOR, self.rate * BACKOFF_FACTOR)
+        self.tokens = min(self.tokens, 0.0)
+
+    def succeeded(self):
+        self.rate = min(self.base_rate * MAX_RATE_FACTOR, self.rate + self.base_rate * RECOVERY_STEP)
+
+    def to_dict(self):
+        return {'rate': self.rate, 'tokens': self.tokens, 'updated': self.updated}
+
+    def load(self, state):
+        self.rate = state.get('rate', self.rate)
+        self.tokens = state.get('tokens', self.tokens)
+        self.updated = state.get('updated', self.updated)
+
+
+class RateLimiter:
+    """
+    Per-endpoint-family adaptive limiter, installed as a SwiggyTransport hook.
+    rates maps endpoint prefixes to (requests/second, burst).
+    With shared_path set, bucket state lives in that file under an fcntl lock
+    so concurrent CLI processes share one budget.
+    """
+
+    def __init__(self, rates=None, shared_path=None):
+        self.rates = dict(DEFAULT_RATES if rates is None else rates)
+        self.shared_path = shared_path
+        self._lock = threading.Lock()
+        self._buckets = {family: TokenBucket(rate, burst) for family, (rate, burst) in self.rates.items()}
+        if shared_path:
+            try:
+                import fcntl
+            except ImportError:
+                raise RuntimeError("Shared rate limiting needs fcntl (not available on this platform)")
+            self._fcntl = fcntl
+            os.makedirs(os.path.dirname(shared_path), exist_ok=True)
+
+    def family_for(self, endpoint):
+        """Rate family for an endpoint path such as 'menu/pl' or 'orders/{id}', or None"""
+        best = None
+        for prefix in self.rates:
+            if endpoint == prefix or endpoint.startswith(prefix + "/"):
+                if best is None or len(prefix) > len(best):
+                    best = prefix
+        return best
+
+    @contextmanager
+    def _buckets_locked(self):
+        """Exclusive access to the buckets, synced with the shared file if any"""
+        with self._lock:
+            if not self.shared_path:
+                yield self._buckets
+                return
+
+            with open(self.shared_path, 'a+') as f:
+                self._fcntl.flock(f, self._fcntl.LOCK_EX)
+                try:
+                    f.seek(0)
+                    try:
+                        state = json.loads(f.read() or '{}')
+                    except ValueError:
+                        state = {}
+                    for family, bucket in self._buckets.items():
+                        if family in state:
+                            bucket.load(state[family])
+                    yield self._buckets
+                    f.seek(0)
+                    f.truncate()
+                    json.dump({family: bucket.to_dict() for family, bucket in self._buckets.items()}, f)
+                    f.flush()
+                finally:
+                    self._fcntl.flock(f, self._fcntl.LOCK_UN)
+
+    def acquire(self, family):
+        """Block until the family's bucket has a token"""
+        while True:
+            with self._buckets_locked() as buckets:
+                wait = buckets[family].take(time.monotonic())
+            if wait <= 0:
+                return
+            time.sleep(min(wait, MAX_SLEEP))
+
+    def record(self, family, status, retried=()):
+        """
+        Adapt to a finished request: its final status plus the statuses of
+        any attempts the transport retried internally.
+        """
+        with self._buckets_locked() as buckets:
+            bucket = buckets[family]
+            if retried:
+                bucket.charge(time.monotonic(), len(retried))
+            if status in THROTTLE_STATUSES or any(s in THROTTLE_STATUSES for s in retried):
+                bucket.throttled()
+            elif status < 400:
+                bucket.succeeded()
+
+    def fit_fanout(self, family, concurrency, rate=None):
+        """
+        Resize a family's bucket for a command that keeps `concurrency`
+        requests in flight (grid search, sync, plan): the bucket allows a
+        burst of one request per worker, then refills at `rate` or, without
+        one, the family's usual rate. Either way it still backs off on
+        throttled responses and recovers on successes.
+        """
+        with self._lock:
+            if not rate:
+                if family not in self.rates:
+                    return
+                rate = self.rates[family][0]
+            self.rates[family] = (rate, concurrency)
+            self._buckets[family] = TokenBucket(rate, concurrency)
+
+    def rate(self, family):
+        with self._buckets_locked() as buckets:
+            return buckets[family].rate
+
+    def transport_hook(self, send, method, url, **kwargs):
+        """SwiggyTransport hook: wait for a token, send, then adapt to the outcome"""
+        family = self.family_for(endpoint_name(url))
+        if family is None:
+            return send(method, url, **kwargs)
+
+        self.acquire(family)
+        response = send(method, url, **kwargs)
+        # urllib3 retries 202/429 inside send(); its history lists those attempts
+        retries = getattr(getattr(response, 'raw', None), 'retries', None)
+        history = getattr(retries, 'history', None) or ()
+        self.record(family, response.status_code,
+                    tuple(attempt.status for attempt in history if attempt.status))
+        return response
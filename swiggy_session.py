@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Session storage for Swiggy CLI
+
+SessionStore keeps session.json safe to share between processes. Writers
+take an exclusive fcntl lock on session.json.lock, write a temporary file
+in the same directory and rename it over session.json, so a reader always
+sees either the old session or the new one, never half of a write; reads
+need no lock. The parsed session is kept in memory and only re-read when
+the file's mtime, size or inode changes, so worker threads and repeated
+calls share one copy without touching the disk again.
+"""
+
+import json
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:
+    # No cross-process lock here; the atomic rename still keeps reads whole
+    fcntl = None
+
+
+class SessionStore:
+    """session.json with atomic writes and a cached, change-aware read"""
+
+    def __init__(self, path):
+        self.path = path
+        self.lock_path = f"{path}.lock"
+        self._lock = threading.Lock()
+        self._data = None
+        self._stamp = None
+
+    def _stat(self):
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    @contextmanager
+    def _exclusive(self):
+        """Serialise writers across threads and, where fcntl exists, processes"""
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(self.lock_path, 'a') as f:
+                fcntl.flock(f, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _read(self):
+        """(data, stamp) from disk; raises ValueError on a corrupt file"""
+        stamp = self._stat()
+        if stamp is None:
+            return {}, None
+        try:
+            with open(self.path, 'rb') as f:
+                data = json.loads(f.read() or b'{}')
+        except FileNotFoundError:
+            # Removed by a logout between stat and open
+            return {}, None
+        if not isinstance(data, dict):
+            raise ValueError(f"{self.path} does not hold a JSON object")
+        return data, stamp
+
+    def changed(self):
+        """True if the file differs from the copy last loaded or saved here"""
+        return self._data is None or self._stat() != self._stamp
+
+    def load(self):
+        """The saved session ({} if none); re-read only when the file changed"""
+        with self._lock:
+            stamp = self._stat()
+            if self._data is None or stamp != self._stamp:
+                self._data, self._stamp = self._read()
+            return dict(self._data)
+
+    def save(self, data):
+        """Atomically replace the saved session with data"""
+        with self._exclusive():
+            self._write(data)
+
+    def update(self, changes):
+        """
+        Merge changes into the saved session and return the result. The
+        read and write happen under one lock, so concurrent updates from
+        other processes are not lost.
+        """
+        with self._exclusive():
+            try:
+                data, _ = self._read()
+            except ValueError:
+                data = {}
+            data.update(changes)
+            self._write(data)
+            return dict(data)
+
+    def clear(self):
+        """Delete the saved session"""
+        with self._exclusive():
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+            self._data, self._stamp = {}, None
+
+    def _write(self, data):
+        directory = os.path.dirname(self.path) or "."
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix=".session-", suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f, separators=(',', ':'))
+                f.flush()
+                os.fsync(f.fileno())
+            # mkstemp creates the file 0600, which suits cookies
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+        self._data, self._stamp = dict(data), self._stat()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Request coalescing for Swiggy CLI
+
+When several threads ask for the same endpoint and params at the same
+moment, SingleFlight lets the first one make the request and hands its
+result (or exception) to the rest. The async paths run their fetches on
+executor threads, so they coalesce through the same object.
+"""
+
+import threading
+
+
+class _Call:
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Run at most one call per key at a time; concurrent callers share its outcome"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, fn):
+        """
+        Call fn() unless a call with the same key is already running, in
+        which case wait for it instead. Returns (result, shared); shared is
+        True when the result came from another caller's request.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
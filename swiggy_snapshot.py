@@ -0,0 +1,493 @@
+#!/usr/bin/env python3
+"""
+Columnar snapshot files for Swiggy CLI search results
+
+`search --snapshot FILE` appends the parsed restaurants (plus the search
+location and time) to FILE in a compact column-oriented layout. A file is
+a sequence of segments, one per append, each starting on an 8-byte
+boundary:
+
+  b"SWGSNAP1" | uint32 header length | JSON header | padding | buffers...
+
+A segment's JSON header lists every column and the offset (from the first
+8-byte boundary after the header), element count and little-endian dtype
+of each of its buffers. Buffers are 8-byte aligned, so each one can be
+mapped straight into a NumPy array.
+
+  string columns   'dictionary': uint32 codes + offsets/bytes of the distinct values
+  cuisines         'list_dictionary': uint32 row offsets + uint32 codes + dictionary
+  numbers          'plain': float64/int32/bool values
+  ts               'delta': int32 second deltas from the previous row (base in header)
+
+Appending writes one new segment at the end of the file and never reads
+or rewrites the existing ones, so it costs the same on a small file as on
+months of snapshots. compact_snapshot() rewrites a file as one segment
+with shared dictionaries, for archives read far more often than written.
+
+Values read back as they were written: strings exactly, avgRating as a
+float64, isOpen as a bool, lat/lng as floats and ts as whole epoch seconds.
+
+Snapshot reads through mmap; for a single-segment file, numeric and code
+buffers are memoryviews (or NumPy arrays via to_numpy / to_pandas) over
+the mapping, not copies. A file with several segments is copied into new
+arrays by to_numpy; `swiggy snapshot compact FILE` makes it one segment again.
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import time
+from array import array
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:
+    # Appends from concurrent processes are not serialised here
+    fcntl = None
+
+MAGIC = b"SWGSNAP1"
+VERSION = 2
+ALIGN = 8
+
+STRING_FIELDS = ('id', 'name', 'locality', 'areaName', 'costForTwo',
+                 'avgRatingString', 'totalRatingsString', 'deliveryTimeStr')
+LIST_FIELDS = ('cuisines',)
+NUMERIC_FIELDS = (
+    ('avgRating', '<f8'),
+    ('deliveryTime', '<i4'),
+    ('isOpen', '|b1'),
+    ('lat', '<f8'),
+    ('lng', '<f8'),
+)
+TIMESTAMP_FIELD = 'ts'
+
+# NumPy dtype string -> memoryview typecode for reading...
+_TYPECODES = {'<u4': 'I', '<i4': 'i', '<u1': 'B', '<f8': 'd', '|b1': '?'}
+# ...and array typecode for writing (array has no bool type)
+_ARRAY_TYPECODES = dict(_TYPECODES, **{'|b1': 'B'})
+
+_LITTLE_ENDIAN = sys.byteorder == 'little'
+
+_PREFIX = len(MAGIC) + 4
+
+
+def _number(value, default=0):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+class SnapshotBuilder:
+    """Collects rows column by column, then encodes them into one segment"""
+
+    def __init__(self):
+        self.columns = {name: [] for name in STRING_FIELDS + LIST_FIELDS}
+        self.columns.update({name: [] for name, _ in NUMERIC_FIELDS})
+        self.columns[TIMESTAMP_FIELD] = []
+
+    def __len__(self):
+        return len(self.columns[TIMESTAMP_FIELD])
+
+    def add(self, restaurant, ts, lat=None, lng=None):
+        """Add one restaurant (Restaurant or dict) seen at time ts (epoch seconds)"""
+        get = restaurant.get
+        for name in STRING_FIELDS:
+            value = get(name)
+            self.columns[name].append('' if value is None else str(value))
+        self.columns['cuisines'].append([str(c) for c in (get('cuisines') or [])])
+        self.columns['avgRating'].append(_number(get('avgRating')))
+        self.columns['deliveryTime'].append(int(_number(get('deliveryTime'))))
+        self.columns['isOpen'].append(bool(get('isOpen')))
+        self.columns['lat'].append(_number(lat, float('nan')))
+        self.columns['lng'].append(_number(lng, float('nan')))
+        self.columns[TIMESTAMP_FIELD].append(int(ts))
+
+    def extend(self, snapshot):
+        """Copy every row of an open Snapshot"""
+        for name, values in self.columns.items():
+            values.extend(snapshot.column(name))
+
+    def _encode(self):
+        """Return (column specs, [(offset, bytes)]) with offsets relative to the data section"""
+        specs, buffers = [], []
+
+        def add_buffer(data, dtype):
+            if not _LITTLE_ENDIAN and data.itemsize > 1:
+                data = array(data.typecode, data)
+                data.byteswap()
+            offset = _align(buffers[-1][0] + len(buffers[-1][1])) if buffers else 0
+            buffers.append((offset, data.tobytes()))
+            return [offset, len(data), dtype]
+
+        def add_dictionary(values):
+            offsets, blob = array('I', [0]), bytearray()
+            for value in values:
+                blob += value.encode('utf-8')
+                offsets.append(len(blob))
+            return {'dict_offsets': add_buffer(offsets, '<u4'),
+                    'dict_data': add_buffer(array('B', blob), '<u1')}
+
+        for name in STRING_FIELDS:
+            lookup = {}
+            codes = array('I', (lookup.setdefault(value, len(lookup)) for value in self.columns[name]))
+            column = {'name': name, 'encoding': 'dictionary', 'codes': add_buffer(codes, '<u4')}
+            column.update(add_dictionary(lookup))
+            specs.append(column)
+
+        for name in LIST_FIELDS:
+            lookup, offsets, codes = {}, array('I', [0]), array('I')
+            for values in self.columns[name]:
+                codes.extend(lookup.setdefault(value, len(lookup)) for value in values)
+                offsets.append(len(codes))
+            column = {'name': name, 'encoding': 'list_dictionary',
+                      'offsets': add_buffer(offsets, '<u4'), 'codes': add_buffer(codes, '<u4')}
+            column.update(add_dictionary(lookup))
+            specs.append(column)
+
+        for name, dtype in NUMERIC_FIELDS:
+            values = array(_ARRAY_TYPECODES[dtype], self.columns[name])
+            specs.append({'name': name, 'encoding': 'plain', 'values': add_buffer(values, dtype)})
+
+        stamps = self.columns[TIMESTAMP_FIELD]
+        base = stamps[0] if stamps else 0
+        deltas = array('i', (b - a for a, b in zip([base] + stamps[:-1], stamps)))
+        specs.append({'name': TIMESTAMP_FIELD, 'encoding': 'delta', 'base': base,
+                      'deltas': add_buffer(deltas, '<i4')})
+        return specs, buffers
+
+    def segment(self):
+        """The rows as one encoded segment, padded to the next 8-byte boundary"""
+        specs, buffers = self._encode()
+        header = json.dumps({'version': VERSION, 'rows': len(self), 'columns': specs},
+                            separators=(',', ':')).encode('utf-8')
+        data_start = _align(_PREFIX + len(header))
+        out = bytearray(MAGIC + struct.pack('<I', len(header)) + header)
+        for offset, data in buffers:
+            out += b'\0' * (data_start + offset - len(out))
+            out += data
+        out += b'\0' * (_align(len(out)) - len(out))
+        return bytes(out)
+
+    def write(self, path):
+        """Write a single-segment file atomically (temp file + rename)"""
+        data = self.segment()
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.snapshot-')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            if os.path.exists(path):
+                # mkstemp files are owner-only; keep the archive's existing mode
+                os.chmod(tmp_path, os.stat(path).st_mode & 0o777)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+
+def _align(position):
+    return (position + ALIGN - 1) // ALIGN * ALIGN
+
+
+def _buffer_refs(specs):
+    for spec in specs:
+        for value in spec.values():
+            if isinstance(value, list) and len(value) == 3:
+                yield value
+
+
+def _segment_end(start, header_length, specs):
+    """Offset just past a segment's last buffer"""
+    data_start = _align(start + _PREFIX + header_length)
+    end = max((offset + count * int(dtype[2:]) for offset, count, dtype in _buffer_refs(specs)), default=0)
+    return data_start + end
+
+
+def _parse_header(prefix, read_header, start, size):
+    """(header, header length, end) for the segment at start, or None if it is missing or cut short"""
+    if len(prefix) < _PREFIX or prefix[:len(MAGIC)] != MAGIC:
+        return None
+    (length,) = struct.unpack_from('<I', prefix, len(MAGIC))
+    if start + _PREFIX + length > size:
+        return None
+    try:
+        header = json.loads(read_header(length))
+    except ValueError:
+        return None
+    end = _segment_end(start, length, header['columns'])
+    if end > size:
+        return None
+    return header, length, end
+
+
+class _Segment:
+    """One segment of a snapshot file, read through the file's mmap"""
+
+    def __init__(self, mm, start, header, header_length):
+        self._mmap = mm
+        self.version = header['version']
+        self.rows = header['rows']
+        self.specs = {column['name']: column for column in header['columns']}
+        self._data_start = _align(start + _PREFIX + header_length)
+        self._dictionaries = {}
+
+    def buffer(self, ref):
+        """Zero-copy memoryview over one buffer, cast to its element type"""
+        offset, count, dtype = ref
+        offset += self._data_start
+        itemsize = int(dtype[2:])
+        view = memoryview(self._mmap)[offset:offset + count * itemsize]
+        if _LITTLE_ENDIAN or itemsize == 1:
+            return view.cast(_TYPECODES[dtype])
+        swapped = array(_TYPECODES[dtype], view.tobytes())
+        swapped.byteswap()
+        return memoryview(swapped)
+
+    def dictionary(self, name):
+        """Distinct values of a dictionary-encoded column, indexed by code (decoded once)"""
+        if name not in self._dictionaries:
+            spec = self.specs[name]
+            offsets = self.buffer(spec['dict_offsets'])
+            data = self.buffer(spec['dict_data'])
+            self._dictionaries[name] = [bytes(data[offsets[i]:offsets[i + 1]]).decode('utf-8')
+                                        for i in range(len(offsets) - 1)]
+        return self._dictionaries[name]
+
+    def timestamps(self):
+        spec = self.specs[TIMESTAMP_FIELD]
+        stamps, current = [], spec['base']
+        for delta in self.buffer(spec['deltas']):
+            current += delta
+            stamps.append(current)
+        return stamps
+
+    def column(self, name):
+        spec = self.specs[name]
+        encoding = spec['encoding']
+        if encoding == 'dictionary':
+            values = self.dictionary(name)
+            return [values[code] for code in self.buffer(spec['codes'])]
+        if encoding == 'list_dictionary':
+            values = self.dictionary(name)
+            offsets, codes = self.buffer(spec['offsets']), self.buffer(spec['codes'])
+            return [[values[code] for code in codes[offsets[i]:offsets[i + 1]]] for i in range(self.rows)]
+        if encoding == 'delta':
+            return self.timestamps()
+        return self.buffer(spec['values']).tolist()
+
+    def numpy(self, ref):
+        import numpy
+        offset, count, dtype = ref
+        return numpy.frombuffer(self._mmap, dtype=dtype, count=count, offset=self._data_start + offset)
+
+
+class Snapshot:
+    """
+    Read-only view of a snapshot file through mmap. A segment cut short by
+    an interrupted append is ignored.
+    Arrays returned by to_numpy() may point into the mapping, so keep the
+    Snapshot open while they are in use.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"{path}: empty snapshot file")
+        if self._mmap[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"{path}: not a snapshot file")
+        self.segments = []
+        start, size = 0, len(self._mmap)
+        while start < size:
+            parsed = _parse_header(self._mmap[start:start + _PREFIX],
+                                   lambda length: self._mmap[start + _PREFIX:start + _PREFIX + length],
+                                   start, size)
+            if parsed is None:
+                break
+            header, length, end = parsed
+            self.segments.append(_Segment(self._mmap, start, header, length))
+            start = _align(end)
+        self.rows = sum(segment.rows for segment in self.segments)
+        self.version = max((segment.version for segment in self.segments), default=VERSION)
+        self.specs = self.segments[0].specs if self.segments else {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        try:
+            self._mmap.close()
+        except BufferError:
+            # NumPy arrays still reference the mapping; it's freed with them
+            pass
+        self._file.close()
+
+    @property
+    def names(self):
+        return list(self.specs)
+
+    def dictionary(self, name):
+        """Distinct values of a dictionary-encoded column across all segments, in first-seen order"""
+        return list(dict.fromkeys(value for segment in self.segments for value in segment.dictionary(name)))
+
+    def timestamps(self):
+        """Epoch seconds per row (prefix sum of the stored deltas)"""
+        return self.column(TIMESTAMP_FIELD)
+
+    def column(self, name):
+        """Decoded Python values for a column"""
+        values = []
+        for segment in self.segments:
+            values.extend(segment.column(name))
+        return values
+
+    def records(self):
+        """Iterate rows as dicts (decodes everything; for export and debugging)"""
+        columns = {name: self.column(name) for name in self.specs}
+        for i in range(self.rows):
+            yield {name: values[i] for name, values in columns.items()}
+
+    def _segment_arrays(self, segment, name):
+        spec = segment.specs[name]
+        encoding = spec['encoding']
+        if encoding == 'dictionary':
+            return segment.numpy(spec['codes']), segment.dictionary(name)
+        if encoding == 'list_dictionary':
+            return segment.numpy(spec['offsets']), segment.numpy(spec['codes']), segment.dictionary(name)
+        if encoding == 'delta':
+            return spec['base'] + segment.numpy(spec['deltas']).cumsum(dtype='int64')
+        return segment.numpy(spec['values'])
+
+    def _concatenate(self, name):
+        import numpy
+
+        parts = [self._segment_arrays(segment, name) for segment in self.segments]
+        encoding = self.specs[name]['encoding']
+        if encoding not in ('dictionary', 'list_dictionary'):
+            return numpy.concatenate(parts)
+        values = self.dictionary(name)
+        position = {value: i for i, value in enumerate(values)}
+        # Map each segment's codes onto the shared dictionary
+        codes = [numpy.array([position[value] for value in part[-1]], dtype='<u4')[part[-2]]
+                 for part in parts]
+        if encoding == 'dictionary':
+            return numpy.concatenate(codes), values
+        shifts = numpy.cumsum([0] + [len(c) for c in codes[:-1]])
+        offsets = [parts[0][0]] + [part[0][1:] + shift for part, shift in zip(parts[1:], shifts[1:])]
+        return numpy.concatenate(offsets).astype('<u4'), numpy.concatenate(codes), values
+
+    def to_numpy(self):
+        """
+        {column: ndarray}. Dictionary columns map to (codes, values) tuples
+        and list columns to (offsets, codes, values). With one segment,
+        numeric columns and codes are views of the file; with several they
+        are copied into new arrays, codes remapped onto one shared
+        dictionary. compact_snapshot() makes a file one segment again.
+        """
+        if len(self.segments) == 1:
+            return {name: self._segment_arrays(self.segments[0], name) for name in self.specs}
+        return {name: self._concatenate(name) for name in self.specs}
+
+    def to_pandas(self):
+        """DataFrame with categorical string columns built from the stored codes"""
+        import pandas
+
+        data = {}
+        for name, value in self.to_numpy().items():
+            encoding = self.specs[name]['encoding']
+            if encoding == 'dictionary':
+                codes, values = value
+                data[name] = pandas.Categorical.from_codes(codes.astype('int32'), categories=values)
+            elif encoding == 'list_dictionary':
+                data[name] = self.column(name)
+            elif encoding == 'delta':
+                data[name] = pandas.to_datetime(value, unit='s')
+            else:
+                data[name] = value
+        return pandas.DataFrame(data)
+
+
+def load(path):
+    """Open a snapshot file for reading"""
+    return Snapshot(path)
+
+
+@contextmanager
+def _locked(path):
+    """Serialise appends and compaction of one file across processes"""
+    if fcntl is None:
+        yield
+        return
+    with open(f"{path}.lock", 'a') as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def _scan(f):
+    """
+    (end of the last complete segment, total rows) reading only segment
+    headers. Raises ValueError for a non-empty file that doesn't start with
+    a complete segment, so appending never truncates someone else's file.
+    """
+    size = os.fstat(f.fileno()).st_size
+    start = end = rows = 0
+    while start < size:
+        f.seek(start)
+        parsed = _parse_header(f.read(_PREFIX), f.read, start, size)
+        if parsed is None:
+            if start == 0:
+                raise ValueError(f"{f.name}: not a snapshot file")
+            break
+        header, _, end = parsed
+        rows += header['rows']
+        start = _align(end)
+    return end, rows
+
+
+def append_snapshot(path, rows, ts=None):
+    """
+    Append search results to a snapshot file as a new segment, creating the
+    file if needed. rows is an iterable of (restaurant, lat, lng). Only the
+    segment headers of the existing file are read; returns the total row count.
+    """
+    ts = time.time() if ts is None else ts
+    builder = SnapshotBuilder()
+    for restaurant, lat, lng in rows:
+        builder.add(restaurant, ts, lat, lng)
+    data = builder.segment()
+    with _locked(path), open(path, 'a+b') as f:
+        end, existing = _scan(f)
+        # Drop what an interrupted append left after the last complete segment,
+        # so the new segment is reachable
+        if end != os.fstat(f.fileno()).st_size:
+            f.truncate(end)
+        f.write(b'\0' * (_align(end) - end) + data)
+        f.flush()
+        os.fsync(f.fileno())
+    return existing + len(builder)
+
+
+def compact_snapshot(path):
+    """Rewrite a snapshot file as a single segment; returns the row count"""
+    with _locked(path):
+        builder = SnapshotBuilder()
+        with Snapshot(path) as existing:
+            builder.extend(existing)
+        builder.write(path)
+    return len(builder)
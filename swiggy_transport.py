@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP transport for Swiggy CLI
+
+One pooled requests.Session per client with keep-alive connections,
+precomputed browser headers and bounded retries with backoff. Every API
+call goes through SwiggyTransport.request, and hooks added with add_hook
+wrap that single call site.
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+API_BASE = "https://www.swiggy.com/dapi"
+
+USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+DEFAULT_HEADERS = {
+    "User-Agent": USER_AGENT,
+    "Accept": "application/json",
+    "Referer": "https://www.swiggy.com/",
+}
+
+# 202 is Swiggy's "come back later" response from its anti-automation layer
+RETRY_STATUSES = (202, 429, 500, 502, 503, 504)
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF = 0.5
+DEFAULT_TIMEOUT = 30
+
+
+class SwiggyTransport:
+    """
+    Connection-pooled transport shared by the v1 and v2 clients.
+
+    Hooks are callables hook(send, method, url, **kwargs) that must return
+    send(method, url, **kwargs) (or a substitute response). They run in the
+    order they were added, outermost first.
+    """
+
+    def __init__(self, api_base=API_BASE, pool_size=DEFAULT_POOL_SIZE, retries=DEFAULT_RETRIES,
+                 backoff=DEFAULT_BACKOFF, timeout=DEFAULT_TIMEOUT, headers=None):
+        self.api_base = api_base.rstrip("/")
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.hooks = []
+
+        self.session = requests.Session()
+        self.session.headers.update(DEFAULT_HEADERS)
+        if headers:
+            self.session.headers.update(headers)
+        self.pool_size = 0
+        self.resize_pool(pool_size)
+
+    def _retry(self):
+        return Retry(
+            total=self.retries,
+            connect=self.retries,
+            read=self.retries,
+            status=self.retries,
+            backoff_factor=self.backoff,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=frozenset(["GET", "HEAD"]),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+
+    def resize_pool(self, pool_size):
+        """Keep up to pool_size idle connections per host (only ever grows)"""
+        if pool_size <= self.pool_size:
+            return
+        self.pool_size = pool_size
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size, max_retries=self._retry())
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def add_hook(self, hook):
+        self.hooks.append(hook)
+
+    def remove_hook(self, hook):
+        if hook in self.hooks:
+            self.hooks.remove(hook)
+
+    def url(self, endpoint):
+        if endpoint.startswith(("http://", "https://")):
+            return endpoint
+        return f"{self.api_base}/{endpoint.lstrip('/')}"
+
+    def _send(self, method, url, **kwargs):
+        return self.session.request(method, url, **kwargs)
+
+    def request(self, method, endpoint, **kwargs):
+        """Send a request to an API endpoint path (e.g. 'menu/pl') or absolute URL"""
+        kwargs.setdefault("timeout", self.timeout)
+        send = self._send
+        for hook in reversed(self.hooks):
+            send = _bind(hook, send)
+        return send(method, self.url(endpoint), **kwargs)
+
+    def get(self, endpoint, params=None, headers=None, **kwargs):
+        return self.request("GET", endpoint, params=params, headers=headers, **kwargs)
+
+    def post(self, endpoint, json=None, headers=None, **kwargs):
+        return self.request("POST", endpoint, json=json, headers=headers, **kwargs)
+
+    def close(self):
+        self.session.close()
+
+
+def _bind(hook, send):
+    def wrapped(method, url, **kwargs):
+        return hook(send, method, url, **kwargs)
+    return wrapped
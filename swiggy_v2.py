@@ -4,208 +4,341 @@ Swiggy CLI v2.0 - Enhanced with auth token extraction from API responses
 """
 
 import argparse
-import json
-import requests
-import re
+import atexit
 import sys
 import os
-from datetime import datetime
+import threading
 from getpass import getpass
 
+import swiggy_commands
+from swiggy_cache import ResponseCache
+from swiggy_commands import (Colors, bbox_arg, compact_snapshot_file, finish_profile, plan_coverage,
+                             positive_int, prefetch, print_color, print_error, print_info,
+                             print_order_update, print_restaurants, print_success, print_warning,
+                             rank_order, ranking_requested, run_bench_load, run_daemon, save_snapshot,
+                             search_grid, sync_catalog, watch_search, weights_arg, write_output)
+from swiggy_output import FORMATS
+from swiggy_json import decode_restaurants, loads as json_loads
+from swiggy_menu import parse_menu
+from swiggy_parse import Restaurant
+from swiggy_profile import NULL_PROFILER, Profiler
+from swiggy_rank import SORT_KEYS
+from swiggy_ratelimit import DEFAULT_CONCURRENCY, SHARED_STATE_FILE, RateLimiter
+from swiggy_session import SessionStore
+from swiggy_singleflight import SingleFlight
+
+# Network, asyncio and SQLite modules are imported by the commands that
+# use them, keeping --help and other offline commands fast to start
+
 # Configuration
 CONFIG_DIR = os.path.expanduser("~/.swiggy-cli")
 CONFIG_FILE = os.path.join(CONFIG_DIR, "config.json")
 SESSION_FILE = os.path.join(CONFIG_DIR, "session.json")
+SOCKET_FILE = os.path.join(CONFIG_DIR, "daemon_v2.sock")
 
 # Swiggy API endpoints (unofficial)
 BASE_URL = "https://www.swiggy.com"
 API_BASE = "https://www.swiggy.com/dapi"
 
-# Colors for terminal output
-class Colors:
-    GREEN = '\033[92m'
-    YELLOW = '\033[93m'
-    RED = '\033[91m'
-    BLUE = '\033[94m'
-    MAGENTA = '\033[95m'
-    CYAN = '\033[96m'
-    WHITE = '\033[97m'
-    RESET = '\033[0m'
-    BOLD = '\033[1m'
-
-def print_color(message, color=Colors.WHITE):
-    print(f"{color}{message}{Colors.RESET}")
-
-def print_success(message):
-    print_color(f"✓ {message}", Colors.GREEN)
-
-def print_error(message):
-    print_color(f"✗ {message}", Colors.RED)
-
-def print_warning(message):
-    print_color(f"⚠ {message}", Colors.YELLOW)
-
-def print_info(message):
-    print_color(f"ℹ {message}", Colors.BLUE)
+# Browser client hints sent with search requests
+SEARCH_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/143.0.0.0 Safari/537.36",
+    "sec-ch-ua-platform": "MacIntel",
+    "sec-ch-ua": '"Chrome/143.0.0.0 Safari/537.36"',
+    "sec-ch-ua-mobile": "?0",
+    "sec-fetch-dest": "empty",
+    "sec-fetch-mode": "cors",
+    "sec-fetch-site": "same-origin"
+}
+
+# Auth cookies set by the API -> session field they are saved under
+AUTH_COOKIES = {
+    "__SW": 'auth_token',
+    "_sid": 'sid',
+    "_device_id": 'device_id',
+}
 
 class SwiggyClient:
-    def __init__(self):
-        self.session = requests.Session()
+    def __init__(self, cache=None, menu_index=None, profiler=None, rate_limiter=None,
+                 api_base=API_BASE, recorder=None):
+        self._lock = threading.Lock()
+        self._session_lock = threading.Lock()
+        self._transport = None
+        self.api_base = api_base
+        # FixtureRecorder set by --record
+        self.recorder = recorder
+        self.profiler = profiler if profiler is not None else NULL_PROFILER
+        self.rate_limiter = rate_limiter
         self.auth_token = None
+        # session.json is read on the first authenticated request, not here
+        self.sessions = SessionStore(SESSION_FILE)
         self.session_data = {}
-        self.load_session()
+        self._session_loaded = False
+        self.cache = cache if cache is not None else ResponseCache()
+        self._menu_index = menu_index
+        # Identical concurrent GETs share one request (threads, async executors, daemon)
+        self.flights = SingleFlight()
+        # DaemonConnection set by main() when `swiggy daemon` is running
+        self.daemon = None
+
+    @property
+    def transport(self):
+        # Created on first use so offline commands never import requests
+        with self._lock:
+            if self._transport is None:
+                from swiggy_transport import SwiggyTransport
+                transport = SwiggyTransport(self.api_base)
+                # Outermost hook, so the profiler times requests without limiter waits
+                if self.rate_limiter is not None:
+                    transport.add_hook(self.rate_limiter.transport_hook)
+                if self.profiler is not NULL_PROFILER:
+                    transport.add_hook(self.profiler.transport_hook)
+                # Innermost, so fixtures hold exactly what the server sent
+                if self.recorder is not None:
+                    transport.add_hook(self.recorder.transport_hook)
+                if self._session_loaded:
+                    self._apply_session(transport.session)
+                self._transport = transport
+            return self._transport
+
+    @property
+    def session(self):
+        return self.transport.session
+
+    @property
+    def menu_index(self):
+        with self._lock:
+            if self._menu_index is None:
+                from swiggy_index import MenuIndex
+                self._menu_index = MenuIndex()
+            return self._menu_index
+
+    def _forward(self, command, **params):
+        if self.daemon is None:
+            return False, None
+        from swiggy_daemon import DaemonUnavailable
+        try:
+            return True, self.daemon.call(command, **params)
+        except DaemonUnavailable:
+            # Daemon stopped since startup; handle this and later calls locally
+            self.daemon = None
+            return False, None
 
     def ensure_config_dir(self):
         os.makedirs(CONFIG_DIR, exist_ok=True)
 
     def load_session(self):
-        if os.path.exists(SESSION_FILE):
-            try:
-                with open(SESSION_FILE, 'r') as f:
-                    self.session_data = json.load(f)
-                    self.auth_token = self.session_data.get('auth_token')
-                    if 'cookies' in self.session_data:
-                        for name, value in self.session_data['cookies'].items():
-                            self.session.cookies.set(name, value)
-            except Exception as e:
-                print_error(f"Failed to load session: {e}")
-                self.session_data = {}
-
-    def save_session(self):
-        self.ensure_config_dir()
-        session_to_save = {
+        try:
+            self.session_data = self.sessions.load()
+        except (OSError, ValueError) as e:
+            print_error(f"Failed to load session: {e}")
+            self.session_data = {}
+        self.auth_token = self.session_data.get('auth_token')
+        self._session_loaded = True
+        if self._transport is not None:
+            self._apply_session(self._transport.session)
+
+    def ensure_session(self):
+        # Once per process (and after reload_session); threads share the cookie jar
+        if self._session_loaded:
+            return
+        with self._session_lock:
+            if not self._session_loaded:
+                self.load_session()
+
+    def reload_session(self):
+        # Forget the in-memory session if another process changed session.json
+        if not self._session_loaded or not self.sessions.changed():
+            return
+        with self._session_lock:
+            self.session_data = {}
+            self.auth_token = None
+            self._session_loaded = False
+            if self._transport is not None:
+                self._transport.session.cookies.clear()
+
+    def _apply_session(self, session):
+        for name, value in self.session_data.get('cookies', {}).items():
+            session.cookies.set(name, value)
+
+    def _store_session(self):
+        # Merged under the store's lock, so other processes' fields survive
+        changes = {
             'auth_token': self.auth_token,
-            'cookies': dict(self.session.cookies),
-            'headers': self.session.headers.copy()
+            'cookies': self.session.cookies.get_dict(),
+            'headers': dict(self.session.headers),
         }
-        with open(SESSION_FILE, 'w') as f:
-            json.dump(session_to_save, f, indent=2)
+        for key in ('sid', 'device_id'):
+            if key in self.session_data:
+                changes[key] = self.session_data[key]
+        self.session_data = self.sessions.update(changes)
+
+    def save_session(self):
+        self._store_session()
         print_success("Session saved")
 
+    def _cached_get(self, endpoint, params, headers=None):
+        """
+        GET an API endpoint (e.g. 'menu/pl') through the response cache.
+        Returns (status_code, body, response); response is None on a cache hit.
+        """
+        body = self.cache.get(endpoint, params)
+        if body is not None:
+            self.profiler.cache_hit(endpoint)
+            return 200, body, None
+
+        def fetch():
+            response = self.transport.get(endpoint, params=params, headers=headers)
+            if response.status_code == 200:
+                self.cache.put(endpoint, params, response.content)
+            return response.status_code, response.content, response
+
+        result, shared = self.flights.do(self.cache.key(endpoint, params), fetch)
+        if shared:
+            self.profiler.coalesced(endpoint)
+        return result
+
+    def _auth_headers(self):
+        self.ensure_session()
+        return {"Cookie": f"__SW={self.auth_token}"} if self.auth_token else {}
+
     def extract_auth_from_response(self, response):
         """
         Extract auth token from Swiggy API response cookies.
         Key cookies: __SW (auth token), _sid (session), _device_id (device)
+        requests has already parsed Set-Cookie into response.cookies and the
+        session's jar; the session is only saved when one of these changed.
         """
-        if response.headers.get('set-cookie'):
-            cookies = response.headers.get('set-cookie', '')
-            # Extract __SW token (main auth)
-            sw_match = re.search(r'__SW=([^;]+)', cookies)
-            if sw_match:
-                self.auth_token = sw_match.group(1)
-                print_success(f"Auth token extracted: {self.auth_token[:20]}...")
-
-            # Extract session ID
-            sid_match = re.search(r'_sid=([^;]+)', cookies)
-            if sid_match:
-                self.session_data['sid'] = sid_match.group(1)
-
-            # Extract device ID
-            device_match = re.search(r'_device_id=([^;]+)', cookies)
-            if device_match:
-                self.session_data['device_id'] = device_match.group(1)
-
-            # Save all cookies to session
-            for cookie in cookies.split(','):
-                name_value = cookie.strip().split('=', 1)
-                if len(name_value) == 2:
-                    self.session.cookies.set(name_value[0], name_value[1])
+        found = {}
+        for cookie in response.cookies:
+            if cookie.name in AUTH_COOKIES:
+                found[AUTH_COOKIES[cookie.name]] = cookie.value
+        if not found:
+            return
+
+        # Load first, so the saved token can't overwrite the fresh one
+        self.ensure_session()
+        with self._session_lock:
+            token = found.pop('auth_token', None)
+            changed = token is not None and token != self.auth_token
+            if changed:
+                self.auth_token = token
+                print_success(f"Auth token extracted: {token[:20]}...")
+            for key, value in found.items():
+                if self.session_data.get(key) != value:
+                    self.session_data[key] = value
+                    changed = True
+            if changed:
+                self._store_session()
 
     def search_restaurants(self, query, lat=None, lng=None):
         """
         Search restaurants - this also captures auth tokens!
         """
-        if not lat or not lng:
-            lat = "12.9716"
-            lng = "77.5946"
-
         print_info(f"Searching for '{query}'...")
 
         try:
-            url = f"{API_BASE}/restaurants/list/v5"
-            params = {"lat": lat, "lng": lng, "search": query}
-
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/143.0.0.0 Safari/537.36",
-                "Accept": "application/json",
-                "Referer": "https://www.swiggy.com/",
-                "sec-ch-ua-platform": "MacIntel",
-                "sec-ch-ua": '"Chrome/143.0.0.0 Safari/537.36"',
-                "sec-ch-ua-mobile": "?0",
-                "sec-fetch-dest": "empty",
-                "sec-fetch-mode": "cors",
-                "sec-fetch-site": "same-origin"
-            }
-
-            response = self.session.get(url, params=params, headers=headers)
-
-            if response.status_code == 200:
-                data = response.json()
-                restaurants = self._parse_restaurants(data)
-
-                # Extract auth tokens from response
-                self.extract_auth_from_response(response)
-
-                print_success(f"Found {len(restaurants)} restaurant(s)")
-                return restaurants
-            else:
-                print_error(f"Search failed: HTTP {response.status_code}")
-                return []
+            restaurants = self.fetch_restaurants(query, lat, lng)
+            print_success(f"Found {len(restaurants)} restaurant(s)")
+            return restaurants
 
         except Exception as e:
             print_error(f"Search failed: {e}")
             return []
 
-    def get_menu(self, restaurant_id, lat=None, lng=None):
+    def fetch_restaurants(self, query, lat=None, lng=None):
         """
-        Get menu using extracted auth token
+        Fetch and parse search results without printing progress.
+        Raises on HTTP errors; safe to call from worker threads.
         """
+        forwarded, result = self._forward('search', query=query, lat=lat, lng=lng)
+        if forwarded:
+            return [Restaurant(*r) for r in result]
+
         if not lat or not lng:
             lat = "12.9716"
             lng = "77.5946"
 
+        params = {"lat": lat, "lng": lng, "search": query}
+
+        status_code, body, response = self._cached_get("restaurants/list/v5", params, SEARCH_HEADERS)
+
+        if status_code != 200:
+            raise RuntimeError(f"HTTP {status_code}")
+
+        with self.profiler.span("parse:restaurants"):
+            restaurants = decode_restaurants(body)
+
+        # Extract auth tokens from response
+        if response is not None:
+            self.extract_auth_from_response(response)
+
+        return restaurants
+
+    def get_menu(self, restaurant_id, lat=None, lng=None, category=None, limit=None):
+        """
+        Get menu using extracted auth token
+        """
         print_info(f"Fetching menu for restaurant ID: {restaurant_id}")
 
         try:
-            url = f"{API_BASE}/menu/pl"
-            params = {
-                "page-type": "REGULAR_MENU",
-                "complete-menu": "true",
-                "lat": lat,
-                "lng": lng,
-                "restaurantId": restaurant_id
-            }
-
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                "Accept": "application/json",
-                "Referer": "https://www.swiggy.com/",
-                "Cookie": f"__SW={self.auth_token}" if self.auth_token else ""
-            }
-
-            response = self.session.get(url, params=params, headers=headers)
-
-            if response.status_code == 200:
-                data = response.json()
-                menu_items = self._parse_menu(data)
-                print_success(f"Found {len(menu_items)} menu item(s)")
-                return menu_items
-            elif response.status_code == 202:
-                # Try to extract auth from response even on 202
-                self.extract_auth_from_response(response)
-                print_warning("Got 202 - retrying with new auth token...")
-                return self.get_menu(restaurant_id, lat, lng)
-            else:
-                print_error(f"Failed to fetch menu: HTTP {response.status_code}")
-                if response.text:
-                    error_data = response.json() if response.headers.get('content-type', '').startswith('application/json') else {}
-                    print_error(f"Error: {error_data.get('statusMessage', 'Unknown error')}")
-                return None
+            menu_items = self.fetch_menu(restaurant_id, lat, lng, category, limit)
+            print_success(f"Found {len(menu_items)} menu item(s)")
+            return menu_items
 
         except Exception as e:
             print_error(f"Failed to fetch menu: {e}")
             return None
 
+    def fetch_menu(self, restaurant_id, lat=None, lng=None, category=None, limit=None):
+        """
+        Fetch, parse and index a menu without printing progress.
+        With category or limit, parsing stops early and nothing is indexed.
+        Raises RuntimeError on HTTP errors; safe to call from worker threads.
+        """
+        forwarded, result = self._forward('menu', restaurant_id=restaurant_id, lat=lat, lng=lng,
+                                          category=category, limit=limit)
+        if forwarded:
+            return result
+
+        if not lat or not lng:
+            lat = "12.9716"
+            lng = "77.5946"
+
+        params = {
+            "page-type": "REGULAR_MENU",
+            "complete-menu": "true",
+            "lat": lat,
+            "lng": lng,
+            "restaurantId": restaurant_id
+        }
+
+        status_code, body, response = self._cached_get("menu/pl", params, self._auth_headers())
+
+        if status_code == 202:
+            # The transport has already retried with backoff; pick up any
+            # fresh auth token from the 202's cookies and try once more
+            self.extract_auth_from_response(response)
+            status_code, body, response = self._cached_get("menu/pl", params, self._auth_headers())
+
+        if status_code != 200:
+            message = f"HTTP {status_code}"
+            if response.headers.get('content-type', '').startswith('application/json'):
+                try:
+                    message += f" ({response.json().get('statusMessage', 'Unknown error')})"
+                except ValueError:
+                    pass
+            raise RuntimeError(message)
+
+        with self.profiler.span("decode:menu"):
+            data = json_loads(body)
+        with self.profiler.span("parse:menu"):
+            menu_items = parse_menu(data, category, limit)
+        if category is None and limit is None:
+            with self.profiler.span("index:menu"):
+                self._index_menu(restaurant_id, menu_items)
+        return menu_items
+
     def _parse_restaurants(self, data):
         restaurants = []
         if 'data' not in data:
@@ -246,69 +379,117 @@ class SwiggyClient:
 
         return restaurants
 
-    def _parse_menu(self, data):
-        menu_items = []
-        if 'data' not in data:
-            return menu_items
+    def _index_menu(self, restaurant_id, menu_items):
+        import sqlite3
 
-        menu_data = data['data']
-
-        # Try different response structures
-        if 'menu' in menu_data:
-            menu_obj = menu_data['menu']
-            if 'items' in menu_obj:
-                for item in menu_obj['items']:
-                    menu_items.append({
-                        'id': item.get('id', ''),
-                        'name': item.get('name', ''),
-                        'price': item.get('price', 0),
-                        'description': item.get('description', ''),
-                        'isVeg': item.get('isVeg', True)
-                    })
+        try:
+            self.menu_index.add_menu(restaurant_id, menu_items)
+        except sqlite3.Error as e:
+            print_warning(f"Could not update menu index: {e}")
 
-        return menu_items
+    def _parse_menu(self, data):
+        return parse_menu(data)
 
     def get_order_status(self, order_id, lat=None, lng=None):
         """
         Get order status using extracted auth token
         """
+        print_info(f"Checking status for order {order_id}")
+
+        try:
+            return self.fetch_order_status(order_id, lat, lng)
+
+        except RuntimeError as e:
+            print_error(f"Failed to get status: {e}")
+            return None
+        except Exception as e:
+            print_error(f"Failed to get order status: {e}")
+            return None
+
+    def fetch_order_status(self, order_id, lat=None, lng=None):
+        """
+        Fetch an order's status without printing progress.
+        Raises RuntimeError on HTTP errors.
+        """
+        forwarded, result = self._forward('status', order_id=order_id, lat=lat, lng=lng)
+        if forwarded:
+            return result
+
         if not lat or not lng:
             lat = "12.9716"
             lng = "77.5946"
 
-        print_info(f"Checking status for order {order_id}")
+        params = {"lat": lat, "lng": lng}
 
-        try:
-            url = f"{API_BASE}/orders/{order_id}"
-            params = {"lat": lat, "lng": lng}
+        status_code, body, _ = self._cached_get(f"orders/{order_id}", params, self._auth_headers())
 
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                "Accept": "application/json",
-                "Referer": "https://www.swiggy.com/",
-                "Cookie": f"__SW={self.auth_token}" if self.auth_token else ""
-            }
+        if status_code != 200:
+            raise RuntimeError(f"HTTP {status_code}")
 
-            response = self.session.get(url, params=params, headers=headers)
+        with self.profiler.span("decode:order"):
+            data = json_loads(body)
+        return {
+            'orderId': data.get('data', {}).get('orderId', ''),
+            'status': data.get('data', {}).get('status', 'Unknown'),
+            'eta': data.get('data', {}).get('eta', 'N/A'),
+            'deliveryPartner': data.get('data', {}).get('deliveryPartner', 'N/A'),
+            'restaurantName': data.get('data', {}).get('restaurantName', 'N/A'),
+            'total': data.get('data', {}).get('total', 0)
+        }
 
-            if response.status_code == 200:
-                data = response.json()
-                status_info = {
-                    'orderId': data.get('data', {}).get('orderId', ''),
-                    'status': data.get('data', {}).get('status', 'Unknown'),
-                    'eta': data.get('data', {}).get('eta', 'N/A'),
-                    'deliveryPartner': data.get('data', {}).get('deliveryPartner', 'N/A'),
-                    'restaurantName': data.get('data', {}).get('restaurantName', 'N/A'),
-                    'total': data.get('data', {}).get('total', 0)
-                }
-                return status_info
-            else:
-                print_error(f"Failed to get status: HTTP {response.status_code}")
-                return None
+    def fetch_active_orders(self, lat=None, lng=None):
+        """
+        Fetch active orders keyed by order ID in one request, so monitoring
+        several orders doesn't poll each one. Raises RuntimeError on HTTP errors.
+        """
+        if not lat or not lng:
+            lat = "12.9716"
+            lng = "77.5946"
 
-        except Exception as e:
-            print_error(f"Failed to get order status: {e}")
-            return None
+        response = self.transport.get("orders/list", params={"lat": lat, "lng": lng},
+                                      headers=self._auth_headers())
+
+        if response.status_code != 200:
+            raise RuntimeError(f"HTTP {response.status_code}")
+
+        with self.profiler.span("decode:orders"):
+            data = json_loads(response.content)
+        orders = data.get('data') if isinstance(data, dict) else None
+        # Either a list of orders or {"orders": [...]}
+        if isinstance(orders, dict):
+            orders = orders.get('orders')
+        if not isinstance(orders, list):
+            return {}
+        return {order['orderId']: order for order in orders
+                if isinstance(order, dict) and order.get('orderId')}
+
+def monitor_orders(client, args):
+    """
+    Follow every order in args.order_ids from one loop until each is final
+    """
+    from swiggy_monitor import OrderMonitor, iter_order_updates
+
+    monitor = OrderMonitor(
+        lambda order_id: client.fetch_order_status(order_id, args.lat, args.lng),
+        fetch_many=lambda: client.fetch_active_orders(args.lat, args.lng),
+        interval=args.interval
+    )
+
+    if len(args.order_ids) == 1:
+        print_info(f"Monitoring order {args.order_ids[0]} (Ctrl+C to stop)")
+    else:
+        print_info(f"Monitoring {len(args.order_ids)} orders (Ctrl+C to stop)")
+    print("-" * 60)
+
+    try:
+        for update in iter_order_updates(monitor, args.order_ids):
+            print_order_update(update, show_id=len(args.order_ids) > 1)
+
+    except KeyboardInterrupt:
+        print("\n")
+        print_info("Monitoring stopped by user")
+    except Exception as e:
+        print_error(f"Monitoring error: {e}")
 
 def main():
     parser = argparse.ArgumentParser(
@@ -317,144 +498,335 @@ def main():
         epilog="""
 Examples:
   swiggy.py search "pizza"
+  swiggy.py search "pizza" --grid grid.csv --concurrency 32
   swiggy.py menu 10575
   swiggy.py status ord_abc123
+  swiggy.py sync "pizza" --grid grid.csv >> changes.jsonl
+  swiggy.py plan "pizza" --bbox 12.85,77.5,13.1,77.75 --out city.csv
+  swiggy.py daemon &
+  swiggy.py --replay bench load --rps 200
         """
     )
 
     parser.add_argument('--lat', help='Latitude for location', default="12.9716")
     parser.add_argument('--lng', help='Longitude for location', default="77.5946")
+    parser.add_argument('--no-cache', action='store_true', help='Bypass the response cache')
+    parser.add_argument('--no-rate-limit', action='store_true',
+                        help='Disable the adaptive per-endpoint request throttle')
+    parser.add_argument('--shared-rate-limit', action='store_true',
+                        help='Share the request throttle with other swiggy processes')
+    parser.add_argument('--no-daemon', action='store_true',
+                        help='Run in-process even when a daemon is running')
+    parser.add_argument('--profile', action='store_true',
+                        help='Print request, parse and render timings to stderr at exit')
+    parser.add_argument('--profile-trace', metavar='FILE',
+                        help='With --profile, also write a Chrome trace JSON to FILE')
+    parser.add_argument('--record', nargs='?', const='', metavar='DIR',
+                        help='Save search/menu/order responses as fixtures (default: benchmarks/fixtures)')
+    parser.add_argument('--replay', nargs='?', const='', metavar='DIR',
+                        help='Serve API requests from recorded fixtures on a local server instead of swiggy.com')
+    parser.add_argument('--replay-latency', type=float, default=0.0, metavar='MS',
+                        help='With --replay, delay each response by MS milliseconds')
+    parser.add_argument('--replay-error-rate', type=float, default=0.0, metavar='P',
+                        help='With --replay, answer this fraction of requests with HTTP 503')
+    parser.add_argument('--refresh', action='store_true', help='Ignore cached responses but store fresh ones')
 
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
 
+    # Shared --format option for commands that return records
+    format_parser = argparse.ArgumentParser(add_help=False)
+    format_parser.add_argument('--format', choices=FORMATS, default='text',
+                               help='Output format (default: text); machine formats are never truncated')
+
     # Search command
-    search_parser = subparsers.add_parser('search', help='Search restaurants')
+    search_parser = subparsers.add_parser('search', help='Search restaurants', parents=[format_parser])
     search_parser.add_argument('query', help='Search query')
+    search_parser.add_argument('--grid', metavar='CSV', help='CSV file of lat,lng points to search concurrently')
+    search_parser.add_argument('--concurrency', type=positive_int, default=DEFAULT_CONCURRENCY,
+                               help='Max requests in flight with --grid (default: %(default)s)')
+    search_parser.add_argument('--rate', type=float, default=None, help='Max requests per second with --grid')
+    search_parser.add_argument('--snapshot', metavar='FILE', help='Append results to a columnar snapshot file')
+    search_parser.add_argument('--merge', action='store_true',
+                               help='With --grid, one record per restaurant with its delivery time at each location')
+    search_parser.add_argument('--sort', choices=SORT_KEYS,
+                               help='Order results by rating, delivery time, cost for two or weighted score')
+    search_parser.add_argument('--min-rating', type=float, metavar='R', help='Only restaurants rated at least R')
+    search_parser.add_argument('--max-eta', type=float, metavar='MIN',
+                               help='Only restaurants delivering within MIN minutes')
+    search_parser.add_argument('--open-only', action='store_true', help='Only restaurants that are open now')
+    search_parser.add_argument('--weights', type=weights_arg, metavar='SPEC',
+                               help='Score weights, e.g. rating=0.5,eta=0.3,cost=0.2 (implies --sort score)')
+    search_parser.add_argument('--watch', type=float, metavar='SECONDS',
+                               help='Re-run the search every SECONDS, updating changed rows in place')
 
     # Menu command
-    menu_parser = subparsers.add_parser('menu', help='Get restaurant menu')
-    menu_parser.add_argument('restaurant_id', help='Restaurant ID')
+    menu_parser = subparsers.add_parser('menu', help='Get restaurant menu', parents=[format_parser])
+    menu_parser.add_argument('restaurant_id', nargs='?', help='Restaurant ID')
+    menu_parser.add_argument('--ids-file', metavar='FILE',
+                             help='Fetch menus for every restaurant ID in FILE (one per line)')
+    menu_parser.add_argument('--workers', type=positive_int,
+                             help='Parallel fetches with --ids-file (default: 8)')
+    menu_parser.add_argument('--out', default='menus.jsonl',
+                             help='JSONL output for --ids-file; reruns resume from it (default: menus.jsonl)')
+    menu_parser.add_argument('--category', metavar='NAME',
+                             help='Only items in categories whose title contains NAME')
+    menu_parser.add_argument('--limit', type=int, metavar='N',
+                             help='Stop after N items (skips the menu index)')
 
     # Status command
-    status_parser = subparsers.add_parser('status', help='Get order status')
+    status_parser = subparsers.add_parser('status', help='Get order status', parents=[format_parser])
     status_parser.add_argument('order_id', help='Order ID')
 
     # Monitor command
-    monitor_parser = subparsers.add_parser('monitor', help='Monitor order live')
-    monitor_parser.add_argument('order_id', help='Order ID')
-    monitor_parser.add_argument('--interval', type=int, default=30, help='Update interval in seconds')
+    monitor_parser = subparsers.add_parser('monitor', help='Monitor orders live')
+    monitor_parser.add_argument('order_ids', nargs='+', metavar='order_id', help='Order ID(s)')
+    monitor_parser.add_argument('--interval', type=int, default=30,
+                                help='Poll interval in seconds before an order has a known phase')
 
     # Orders command
-    subparsers.add_parser('orders', help='List active orders')
+    subparsers.add_parser('orders', help='List active orders', parents=[format_parser])
+
+    # Find-item command
+    find_parser = subparsers.add_parser('find-item', help='Search menu items across cached restaurants')
+    find_parser.add_argument('query', help='Item name or description words')
+    find_parser.add_argument('--max-price', type=float, help='Maximum price in rupees')
+    find_parser.add_argument('--veg', action='store_true', help='Only vegetarian items')
+    find_parser.add_argument('--limit', type=int, default=20, help='Max results (default: 20)')
+
+    # Sync command
+    sync_parser = subparsers.add_parser('sync', help='Update the restaurant catalog and print changes as JSONL')
+    sync_parser.add_argument('query', help='Search query')
+    sync_parser.add_argument('--grid', metavar='CSV', help='CSV file of lat,lng points to sync')
+    sync_parser.add_argument('--concurrency', type=positive_int, default=DEFAULT_CONCURRENCY,
+                             help='Max requests in flight with --grid (default: %(default)s)')
+    sync_parser.add_argument('--rate', type=float, default=None,
+                             help='Max requests per second to the API host with --grid')
+    sync_parser.add_argument('--out', metavar='FILE', help='Append changes to FILE instead of stdout')
+
+    # Plan command
+    plan_parser = subparsers.add_parser('plan', help='Pick search points covering an area with few requests')
+    plan_parser.add_argument('query', help='Search query')
+    area = plan_parser.add_mutually_exclusive_group(required=True)
+    area.add_argument('--bbox', type=bbox_arg, metavar='S,W,N,E',
+                      help='Bounding box as south,west,north,east')
+    area.add_argument('--polygon', metavar='CSV', help='CSV file of lat,lng polygon vertices')
+    plan_parser.add_argument('--cell', type=float, default=4.0, metavar='KM',
+                             help='Starting cell size (default: 4)')
+    plan_parser.add_argument('--min-cell', type=float, default=0.5, metavar='KM',
+                             help='Cells are not split below this size (default: 0.5)')
+    plan_parser.add_argument('--similarity', type=float, default=0.9, metavar='F',
+                             help='A cell is uniform when every point returns this fraction of its restaurants '
+                                  '(default: 0.9)')
+    plan_parser.add_argument('--min-new', type=int, default=1, metavar='N',
+                             help='Only split cells whose new points found N unseen restaurants (default: 1)')
+    plan_parser.add_argument('--max-requests', type=int, metavar='N', help='Stop after about N searches')
+    plan_parser.add_argument('--concurrency', type=positive_int, default=DEFAULT_CONCURRENCY,
+                             help='Max requests in flight (default: %(default)s)')
+    plan_parser.add_argument('--rate', type=float, default=None, help='Max requests per second to the API host')
+    plan_parser.add_argument('--out', default='plan.csv',
+                             help='Grid CSV of the searched points (default: plan.csv)')
+
+    # Daemon command
+    daemon_parser = subparsers.add_parser('daemon', help='Keep a warm client running for faster commands')
+    daemon_parser.add_argument('--stop', action='store_true', help='Stop the running daemon')
+
+    # Snapshot command
+    snapshot_parser = subparsers.add_parser('snapshot', help='Maintain --snapshot files')
+    snapshot_commands = snapshot_parser.add_subparsers(dest='snapshot_command', required=True)
+    compact_parser = snapshot_commands.add_parser(
+        'compact', help='Rewrite a snapshot file as one segment so reads map it without copying')
+    compact_parser.add_argument('file', help='Snapshot file')
+
+    # Bench command
+    bench_parser = subparsers.add_parser('bench', help='Capacity-test the client against a mock API')
+    bench_commands = bench_parser.add_subparsers(dest='bench_command', required=True)
+    load_parser = bench_commands.add_parser(
+        'load', help='Search at a fixed rate against replayed fixtures and report capacity')
+    load_parser.add_argument('--query', default='pizza', help='Search query (default: pizza)')
+    load_parser.add_argument('--rps', type=float, default=50.0,
+                             help='Requests per second to offer; 0 = as fast as possible (default: 50)')
+    load_parser.add_argument('--concurrency', type=positive_int, default=8, help='Worker threads (default: 8)')
+    load_parser.add_argument('--duration', type=float, default=10.0, help='Seconds to run (default: 10)')
+    load_parser.add_argument('--grid', metavar='CSV', help='Cycle searches through these lat,lng points')
+    load_parser.add_argument('--parser', choices=('dicts', 'streaming', 'fast'), default='dicts',
+                             help='JSON decode + _parse_restaurants, the streaming parser, or the '
+                                  'fastest decode_restaurants backend (default: dicts)')
+    load_parser.add_argument('--target', metavar='URL',
+                             help='API base of a mock server (default: replay benchmarks/fixtures, or --replay)')
+    load_parser.add_argument('--json', action='store_true', help='Print the report as JSON')
 
     args = parser.parse_args()
 
+    if args.command == 'menu' and not (args.restaurant_id or args.ids_file):
+        menu_parser.error("a restaurant ID or --ids-file is required")
+    if args.command == 'menu' and args.limit is not None and args.limit < 1:
+        menu_parser.error("--limit must be at least 1")
+    if args.command == 'search' and args.watch is not None:
+        if args.watch <= 0:
+            search_parser.error("--watch must be greater than 0")
+        if args.grid or args.format != 'text':
+            search_parser.error("--watch works with single-location text output only")
+
+    if getattr(args, 'format', 'text') != 'text' or args.command == 'sync':
+        # Keep stdout clean for the records
+        swiggy_commands.STATUS_STREAM = sys.stderr
+
     if not args.command:
         parser.print_help()
         sys.exit(1)
 
-    client = SwiggyClient()
+    profiler = None
+    if args.profile or args.profile_trace:
+        profiler = Profiler()
+        atexit.register(finish_profile, profiler, args.profile_trace)
+
+    rate_limiter = None
+    if not args.no_rate_limit:
+        try:
+            rate_limiter = RateLimiter(shared_path=SHARED_STATE_FILE if args.shared_rate_limit else None)
+        except (OSError, RuntimeError) as e:
+            print_error(f"Rate limiter unavailable: {e}")
+            sys.exit(1)
+
+    api_base = API_BASE
+    if args.replay is not None:
+        from swiggy_fixtures import FIXTURES_DIR, ReplayServer
+        replay = ReplayServer(args.replay or FIXTURES_DIR, latency=args.replay_latency / 1000.0,
+                              error_rate=args.replay_error_rate).start()
+        atexit.register(replay.stop)
+        if not len(replay):
+            print_warning(f"No recorded exchanges in {args.replay or FIXTURES_DIR}")
+        api_base = replay.api_base
+
+    recorder = None
+    if args.record is not None:
+        from swiggy_fixtures import FIXTURES_DIR, FixtureRecorder
+        recorder = FixtureRecorder(args.record or FIXTURES_DIR)
+
+    # Replayed responses never enter the real cache; recording, --watch and
+    # sync always fetch (they exist to see changes) but still store what they get
+    client = SwiggyClient(cache=ResponseCache(enabled=not (args.no_cache or args.replay is not None),
+                                              refresh=args.refresh or recorder is not None
+                                              or getattr(args, 'watch', None) is not None
+                                              or args.command == 'sync'),
+                          profiler=profiler, rate_limiter=rate_limiter,
+                          api_base=api_base, recorder=recorder)
+
+    # Hand search/menu/status to a running daemon unless flags change how they run
+    if (args.command in ('search', 'menu', 'status') and not args.no_daemon
+            and not (args.no_cache or args.refresh or profiler or api_base != API_BASE or recorder
+                     or getattr(args, 'watch', None) is not None)):
+        from swiggy_daemon import connect
+        client.daemon = connect(SOCKET_FILE)
 
     if args.command == 'search':
-        restaurants = client.search_restaurants(args.query, args.lat, args.lng)
-        if restaurants:
-            print("\n" + "="*60)
-            for i, r in enumerate(restaurants[:10], 1):
-                cuisines = ', '.join(r.get('cuisines', []))
-                rating = r.get('avgRatingString', 'N/A')
-                total_ratings = r.get('totalRatingsString', '0')
-                delivery_time = r.get('deliveryTimeStr', 'N/A')
-                cost = r.get('costForTwo', 'N/A')
-                locality = r.get('locality', '')
-                area = r.get('areaName', '')
-                location = f"{locality}, {area}" if locality else area
-                is_open = "Open" if r.get('isOpen', False) else "Closed"
-
-                print_color(f"{i}. {r.get('name', 'Unknown')}", Colors.BOLD)
-                print(f"   Rating: {rating} ({total_ratings}) | Delivery: {delivery_time} | {is_open}")
-                print(f"   Cuisine: {cuisines}")
-                print(f"   Cost: {cost} | {location}")
-                print(f"   ID: {r.get('id', 'N/A')}")
-                print()
+        if args.watch is not None:
+            watch_search(client, args)
+        elif args.grid:
+            search_grid(client, args)
+        else:
+            restaurants = client.search_restaurants(args.query, args.lat, args.lng)
+            # The snapshot archives everything the API returned, unfiltered
+            if args.snapshot and restaurants:
+                save_snapshot(args, [(r, args.lat, args.lng) for r in restaurants])
+            if ranking_requested(args) and restaurants:
+                restaurants = [restaurants[i] for i in rank_order(client, args, restaurants)]
+                if not restaurants:
+                    print_warning("No restaurants match the filters")
+            with client.profiler.span("render"):
+                if args.format != 'text':
+                    write_output(args, restaurants, 'restaurant')
+                elif restaurants:
+                    print("\n" + "="*60)
+                    print_restaurants(restaurants[:10])
 
     elif args.command == 'menu':
-        menu_items = client.get_menu(args.restaurant_id, args.lat, args.lng)
-        if menu_items:
-            print("\n" + "="*60)
-            print_color("MENU", Colors.BOLD)
-            print("="*60)
-            for i, item in enumerate(menu_items[:20], 1):
-                name = item.get('name', 'Unknown')
-                price = item.get('price', 0) / 100  # Convert paisa to rupees
-                veg_indicator = "🟢" if item.get('isVeg', True) else "🔴"
-                description = item.get('description', '')
-
-                print_color(f"{i}. {veg_indicator} {name}", Colors.WHITE)
-                print(f"   Price: ₹{price}")
-                if description:
-                    print(f"   {description[:80]}{'...' if len(description) > 80 else ''}")
-                print()
+        if args.ids_file:
+            prefetch(client, args)
+        else:
+            menu_items = client.get_menu(args.restaurant_id, args.lat, args.lng, args.category, args.limit)
+            with client.profiler.span("render"):
+                if args.format != 'text':
+                    write_output(args, menu_items or [], 'menu_item')
+                elif menu_items:
+                    print("\n" + "="*60)
+                    print_color("MENU", Colors.BOLD)
+                    print("="*60)
+                    category = None
+                    for i, item in enumerate(menu_items if args.limit else menu_items[:20], 1):
+                        if item.get('category') and item['category'] != category:
+                            category = item['category']
+                            print_color(category, Colors.BOLD)
+                        name = item.get('name', 'Unknown')
+                        price = (item.get('price') or 0) / 100  # Convert paise to rupees
+                        veg_indicator = "🟢" if item.get('isVeg', True) else "🔴"
+                        description = item.get('description', '')
+
+                        print_color(f"{i}. {veg_indicator} {name}", Colors.WHITE)
+                        print(f"   Price: ₹{price:g}")
+                        if description:
+                            print(f"   {description[:80]}{'...' if len(description) > 80 else ''}")
+                        print()
 
     elif args.command == 'status':
         status = client.get_order_status(args.order_id, args.lat, args.lng)
-        if status:
-            print("\n" + "="*60)
-            print_color(f"Order: {status.get('orderId', args.order_id)}", Colors.BOLD)
-            print("="*60)
-            print(f"Status: {status.get('status', 'Unknown')}")
-            if status.get('eta'):
-                print(f"ETA: {status.get('eta')}")
-            if status.get('restaurantName'):
-                print(f"Restaurant: {status.get('restaurantName')}")
-            if status.get('total'):
-                total = status.get('total', 0) / 100
-                print(f"Total: ₹{total}")
-            if status.get('deliveryPartner'):
-                print(f"Delivery Partner: {status.get('deliveryPartner')}")
-            print()
+        with client.profiler.span("render"):
+            if args.format != 'text':
+                write_output(args, [status] if status else [], 'order_status')
+            elif status:
+                print("\n" + "="*60)
+                print_color(f"Order: {status.get('orderId', args.order_id)}", Colors.BOLD)
+                print("="*60)
+                print(f"Status: {status.get('status', 'Unknown')}")
+                if status.get('eta'):
+                    print(f"ETA: {status.get('eta')}")
+                if status.get('restaurantName'):
+                    print(f"Restaurant: {status.get('restaurantName')}")
+                if status.get('total'):
+                    total = status.get('total', 0) / 100
+                    print(f"Total: ₹{total}")
+                if status.get('deliveryPartner'):
+                    print(f"Delivery Partner: {status.get('deliveryPartner')}")
+                print()
 
     elif args.command == 'monitor':
-        import time as time_module
-        print_info(f"Monitoring order {args.order_id} (Ctrl+C to stop)")
-        print("-" * 60)
+        monitor_orders(client, args)
 
-        last_status = None
-
-        try:
-            while True:
-                status_info = client.get_order_status(args.order_id, args.lat, args.lng)
-
-                if status_info:
-                    current_status = status_info.get('status', 'unknown')
-                    timestamp = datetime.now().strftime("%H:%M:%S")
-
-                    if current_status != last_status:
-                        print_color(f"[{timestamp}] ", Colors.CYAN, end="")
-                        print_color(f"Status: {current_status.upper()}", Colors.BOLD)
+    elif args.command == 'orders':
+        print_warning("Orders list requires additional API investigation")
 
-                        if status_info.get('eta'):
-                            print_info(f"ETA: {status_info.get('eta')}")
-                        if status_info.get('deliveryPartner'):
-                            print_info(f"Delivery Partner: {status_info.get('deliveryPartner')}")
+    elif args.command == 'sync':
+        sync_catalog(client, args)
 
-                        last_status = current_status
+    elif args.command == 'plan':
+        plan_coverage(client, args)
 
-                        if current_status.lower() in ['delivered', 'cancelled', 'failed']:
-                            print_color("\n" + "="*60, Colors.GREEN)
-                            print_success(f"Order {current_status}")
-                            print_color("="*60 + "\n", Colors.GREEN)
-                            break
+    elif args.command == 'daemon':
+        run_daemon(client, args, SOCKET_FILE)
 
-                time_module.sleep(args.interval)
+    elif args.command == 'snapshot':
+        compact_snapshot_file(args)
 
-        except KeyboardInterrupt:
-            print("\n")
-            print_info("Monitoring stopped by user")
-        except Exception as e:
-            print_error(f"Monitoring error: {e}")
+    elif args.command == 'bench':
+        run_bench_load(client, args, SEARCH_HEADERS)
 
-    elif args.command == 'orders':
-        print_warning("Orders list requires additional API investigation")
+    elif args.command == 'find-item':
+        max_price = round(args.max_price * 100) if args.max_price is not None else None
+        matches = client.menu_index.search(args.query, max_price, True if args.veg else None, args.limit)
+        if not matches:
+            print_warning("No matching items in the menu index")
+            print_info("Menus are indexed as you fetch them with 'menu <restaurant-id>'")
+        else:
+            print("\n" + "="*60)
+            print_color(f"ITEMS MATCHING '{args.query}'", Colors.BOLD)
+            print("="*60)
+            for i, item in enumerate(matches, 1):
+                veg_indicator = "🟢" if item.is_veg else "🔴"
+                print_color(f"{i}. {veg_indicator} {item.name}", Colors.WHITE)
+                print(f"   Price: ₹{item.price / 100:g} | Restaurant ID: {item.restaurant_id}")
+                if item.description:
+                    print(f"   {item.description[:80]}{'...' if len(item.description) > 80 else ''}")
+                print()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Watch mode for Swiggy CLI (`swiggy search --watch SECONDS`)
+
+Each refresh is diffed against the previous result set by restaurant id.
+On a terminal, results are shown as a table of one-line rows and only the
+rows whose text changed are rewritten in place with ANSI cursor movement,
+so an unchanged refresh sends a single status line. Elsewhere (a pipe or
+a log file) only the changes are printed, one line each.
+"""
+
+import shutil
+import time
+from collections import namedtuple
+
+# Fields whose change counts as a change to a restaurant
+WATCH_FIELDS = ('name', 'avgRatingString', 'deliveryTime', 'deliveryTimeStr', 'isOpen', 'costForTwo')
+
+ResultDiff = namedtuple('ResultDiff', ['added', 'removed', 'changed'])
+
+CLEAR_LINE = '\033[2K'
+
+
+def diff_results(previous, current, fields=WATCH_FIELDS):
+    """
+    ResultDiff of id sets between two restaurant lists: ids only in current,
+    ids only in previous, and ids in both whose watched fields differ
+    """
+    before = {r.get('id'): r for r in previous}
+    after = {r.get('id'): r for r in current}
+    changed = set()
+    for rid, r in after.items():
+        old = before.get(rid)
+        if old is not None and any(old.get(field) != r.get(field) for field in fields):
+            changed.add(rid)
+    return ResultDiff(set(after) - set(before), set(before) - set(after), changed)
+
+
+def format_row(r, width, i=None):
+    """One fixed-layout table row (numbered when i is given), cut to width so it never wraps"""
+    status = "Open" if r.get('isOpen') else "Closed"
+    tail = (f" {r.get('avgRatingString') or 'N/A':>4}  {r.get('deliveryTimeStr') or 'N/A':<12}"
+            f" {status:<6}  {r.get('costForTwo') or ''}").rstrip()
+    head = f"{i:>3}. " if i is not None else ""
+    name_width = max(8, min(32, width - len(head) - len(tail)))
+    name = r.get('name') or 'Unknown'
+    if len(name) > name_width:
+        name = name[:name_width - 1] + '…'
+    return f"{head}{name:<{name_width}}{tail}"[:width]
+
+
+def describe_change(r, old):
+    """Plain-text line for one changed restaurant: 'Name: field a -> b, ...'"""
+    parts = []
+    if old.get('avgRatingString') != r.get('avgRatingString'):
+        parts.append(f"rating {old.get('avgRatingString')} -> {r.get('avgRatingString')}")
+    if old.get('deliveryTimeStr') != r.get('deliveryTimeStr') or old.get('deliveryTime') != r.get('deliveryTime'):
+        parts.append(f"ETA {old.get('deliveryTimeStr')} -> {r.get('deliveryTimeStr')}")
+    if bool(old.get('isOpen')) != bool(r.get('isOpen')):
+        parts.append("opened" if r.get('isOpen') else "closed")
+    if old.get('costForTwo') != r.get('costForTwo'):
+        parts.append(f"cost {old.get('costForTwo')} -> {r.get('costForTwo')}")
+    if old.get('name') != r.get('name'):
+        parts.append(f"renamed from {old.get('name')}")
+    return f"{r.get('name')}: {', '.join(parts)}"
+
+
+class LiveTable:
+    """
+    Rows redrawn in place on a terminal. The cursor is kept at the start of
+    the status line under the table; update() moves up to each changed row,
+    rewrites it and comes back, leaving unchanged rows untouched.
+    rows are (text, color) pairs; color is an ANSI prefix or ''.
+    """
+
+    def __init__(self, stream, reset=''):
+        self.stream = stream
+        self.reset = reset
+        self.rows = []
+        self.status = None
+        self.bytes_written = 0
+
+    def update(self, rows, status):
+        old = self.rows
+        out = []
+        # Cursor row, counted from the first table row; the status line is len(old)
+        cursor = len(old)
+        for k in range(max(len(old), len(rows))):
+            new = rows[k] if k < len(rows) else None
+            if k < len(old) and new == old[k]:
+                continue
+            if k < cursor:
+                out.append(f"\033[{cursor - k}A")
+            elif k > cursor:
+                out.append(f"\033[{k - cursor}B")
+            cursor = k
+            out.append('\r' + CLEAR_LINE)
+            if new is not None:
+                text, color = new
+                out.append(f"{color}{text}{self.reset}" if color else text)
+            if k >= len(old):
+                # Past the old table (and its status line): grow the screen
+                out.append('\n')
+                cursor += 1
+        height = len(rows)
+        if height < len(old):
+            # The old status line is still showing below the shrunk table
+            out.append(f"\033[{len(old) - cursor}B\r{CLEAR_LINE}" if len(old) > cursor else '\r' + CLEAR_LINE)
+            cursor = len(old)
+        if cursor != height or status != self.status or out:
+            if cursor < height:
+                out.append(f"\033[{height - cursor}B")
+            elif cursor > height:
+                out.append(f"\033[{cursor - height}A")
+            out.append('\r' + CLEAR_LINE + status)
+        self.rows = list(rows)
+        self.status = status
+        if out:
+            data = ''.join(out)
+            self.stream.write(data)
+            self.stream.flush()
+            self.bytes_written += len(data)
+
+    def close(self):
+        """Leave the cursor on a fresh line below the table"""
+        self.stream.write('\n')
+        self.stream.flush()
+
+
+def watch_schedule(interval, clock=time.monotonic, sleep=time.sleep):
+    """Yield once per refresh, every `interval` seconds from the first"""
+    start = clock()
+    n = 0
+    while True:
+        yield n
+        n += 1
+        delay = start + n * interval - clock()
+        if delay < 0:
+            # A slow refresh overran; skip the missed slots instead of bunching
+            n += int(-delay // interval) + 1
+            delay = start + n * interval - clock()
+        sleep(delay)
+
+
+def terminal_size():
+    """(columns, rows) for sizing the table"""
+    size = shutil.get_terminal_size()
+    return size.columns, size.lines
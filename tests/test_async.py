@@ -0,0 +1,73 @@
+import asyncio
+import gc
+import logging
+import os
+import signal
+import threading
+import time
+
+import pytest
+
+from swiggy_async import iter_async
+from swiggy_monitor import OrderMonitor, iter_order_updates
+
+
+def interrupt_after(seconds):
+    timer = threading.Timer(seconds, os.kill, (os.getpid(), signal.SIGINT))
+    timer.start()
+    return timer
+
+
+@pytest.mark.skipif(not hasattr(signal, 'SIGINT'), reason="needs SIGINT")
+@pytest.mark.parametrize('delay', [0.05, 0.25, 0.4])
+def test_sigint_stops_monitor_with_keyboard_interrupt(delay, caplog):
+    def fetch_status(order_id):
+        time.sleep(0.1)
+        return {'status': 'Preparing'}
+
+    monitor = OrderMonitor(fetch_status, interval=0.05, intervals={'preparing': 0.05})
+    timer = interrupt_after(delay)
+    with caplog.at_level(logging.ERROR, logger='asyncio'):
+        with pytest.raises(KeyboardInterrupt):
+            for update in iter_order_updates(monitor, ['1', '2']):
+                pass
+        timer.join()
+        gc.collect()
+    assert not [r for r in caplog.records if 'destroyed' in r.getMessage()]
+
+
+def test_interrupt_cancels_pending_step():
+    cleaned = []
+
+    async def agen():
+        try:
+            yield 1
+            await asyncio.sleep(10)
+            yield 2
+        finally:
+            cleaned.append(True)
+
+    timer = interrupt_after(0.05)
+    items = []
+    with pytest.raises(KeyboardInterrupt):
+        for item in iter_async(agen()):
+            items.append(item)
+    timer.join()
+    assert items == [1]
+    assert cleaned == [True]
+
+
+def test_closing_early_runs_generator_cleanup():
+    cleaned = []
+
+    async def agen():
+        try:
+            for i in range(10):
+                yield i
+        finally:
+            cleaned.append(True)
+
+    it = iter_async(agen())
+    assert next(it) == 0
+    it.close()
+    assert cleaned == [True]
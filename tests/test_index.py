@@ -0,0 +1,19 @@
+from swiggy_index import MenuIndex
+
+
+def test_same_named_items_without_ids_are_kept(tmp_path):
+    index = MenuIndex(str(tmp_path / 'menu_index.db'))
+    items = [
+        {'name': 'Paneer Tikka', 'category': 'Starters', 'price': 24000},
+        {'name': 'Paneer Tikka', 'category': 'Combos', 'price': 32000},
+        {'name': 'Paneer Tikka', 'category': 'Combos', 'price': 32000},
+        {'id': 7, 'name': 'Paneer Tikka', 'price': 26000},
+    ]
+    index.add_menu(1, items)
+    matches = index.search('paneer tikka', limit=10)
+    assert sorted(match.price for match in matches) == [24000, 26000, 32000, 32000]
+    # Reindexing the same menu gives every item the same key again
+    keys = {match.item_id for match in matches}
+    index.add_menu(1, items)
+    assert {match.item_id for match in index.search('paneer tikka', limit=10)} == keys
+    index.close()
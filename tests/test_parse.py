@@ -0,0 +1,114 @@
+import json
+
+import pytest
+
+import swiggy_json
+from payloads import listing_payloads, synthesize_menu, synthesize_nested_menu
+from swiggy_menu import parse_menu
+from swiggy_parse import iter_restaurants, restaurants_from_data
+
+
+def entry(i):
+    return {'info': {'id': str(i), 'name': f'Restaurant {i}'}}
+
+
+def grid(*ids):
+    return {'gridElements': {'infoWithStyle': {'restaurants': [entry(i) for i in ids]}}}
+
+
+# Cards with nested fields of the wrong type, between good ones
+MALFORMED_LISTING = {'data': {'cards': [
+    {'card': {'card': {'gridElements': {'infoWithStyle': {'restaurants': [
+        entry(20), {'info': {'id': '21', 'name': 'Bad sla', 'sla': 'soon'}},
+        {'info': {'id': '22', 'name': 'List sla', 'sla': [30]}}, entry(23)]}}}}},
+    {'card': {'card': {'gridElements': 'compact'}}},
+    {'card': {'card': {'gridElements': {'infoWithStyle': ['x']}}}},
+    {'card': {'card': {'gridElements': {'infoWithStyle': {'restaurants': 5}}}}},
+    {'card': {'card': grid(24)}},
+]}}
+
+ODD_LISTINGS = [
+    # card.card and a card with gridElements directly on it
+    {'data': {'cards': [{'card': {'card': grid(1, 2)}}, {'card': grid(3)}]}},
+    # An inner card wins over the wrapper's own gridElements
+    {'data': {'cards': [{'card': {'card': {'x': grid(9)}, **grid(4)}}]}},
+    {'data': {'cards': [{'card': {**grid(5), 'card': {'y': 1}}}]}},
+    {'data': {'cards': [{'card': {'card': 5}}, 7, None, {'card': None}, {'card': {'card': grid(6)}}]}},
+    # gridElements anywhere off the card path is not a listing
+    {'data': {'cards': [{'card': {'card': {'header': grid(10), **grid(11)}}}], 'other': grid(12)},
+     'extra': grid(13)},
+    {'data': {'cards': [{'card': {'card': {'gridElements': {'infoWithStyle': {'restaurants': [
+        {'info': {'id': 1}}, 5, {'info': 3}, entry(14)]}}}}}]}},
+    {'data': []},
+    [],
+    {'data': {'cards': None}},
+    MALFORMED_LISTING,
+]
+
+PAYLOADS = [json.dumps(listing).encode() for listing in ODD_LISTINGS] + listing_payloads(3)
+
+
+@pytest.mark.parametrize('raw', PAYLOADS)
+def test_streaming_parser_matches_dict_walk(raw):
+    assert list(iter_restaurants(raw)) == restaurants_from_data(json.loads(raw))
+
+
+@pytest.mark.parametrize('name', swiggy_json.available_backends())
+def test_backends_agree(name):
+    backend = swiggy_json.get_backend(name)
+    for raw in PAYLOADS:
+        assert backend.decode_restaurants(raw) == restaurants_from_data(json.loads(raw))
+
+
+def test_nested_grid_elements_are_ignored():
+    raw = json.dumps(ODD_LISTINGS[4])
+    assert [r.id for r in iter_restaurants(raw)] == ['11']
+
+
+def test_malformed_body_keeps_earlier_restaurants():
+    raw = json.dumps(ODD_LISTINGS[0])[:-20]
+    assert [r.id for r in iter_restaurants(raw)] == ['1', '2']
+
+
+def test_malformed_cards_are_skipped():
+    raw = json.dumps(MALFORMED_LISTING)
+    assert [r.id for r in restaurants_from_data(MALFORMED_LISTING)] == ['20', '23', '24']
+    assert [r.id for r in iter_restaurants(raw)] == ['20', '23', '24']
+
+
+@pytest.mark.parametrize('name', swiggy_json.BACKENDS)
+def test_each_backend_skips_malformed_cards(name, monkeypatch):
+    if name not in swiggy_json.available_backends():
+        pytest.skip(f"{name} is not installed")
+    monkeypatch.setenv(swiggy_json.ENV_VAR, name)
+    monkeypatch.setattr(swiggy_json, '_selected', None)
+    raw = json.dumps(MALFORMED_LISTING).encode()
+    assert [r.id for r in swiggy_json.decode_restaurants(raw)] == ['20', '23', '24']
+    assert swiggy_json.backend_name() == name
+
+
+def test_restaurant_record_access():
+    restaurant = restaurants_from_data(ODD_LISTINGS[0])[0]
+    assert restaurant['name'] == restaurant.get('name') == restaurant.name == 'Restaurant 1'
+    assert restaurant.get('missing', 'x') == 'x'
+    assert restaurant[0] == '1'
+    # Membership is the tuple's: values, not field names
+    assert '1' in restaurant and 'name' not in restaurant
+
+
+def test_flat_menu_prices_are_paise():
+    data = json.loads(synthesize_menu(0, items=10))
+    items = parse_menu(data)
+    assert [item['price'] for item in items] == [item['price'] for item in data['data']['items']]
+    assert all(item['price'] % 100 == 0 for item in items)
+
+
+def test_nested_menu():
+    data = json.loads(synthesize_nested_menu(0, items=100, categories=10))
+    items = parse_menu(data)
+    assert len(items) == 100
+    assert all(item['price'] > 0 and item['category'] for item in items)
+    first = items[0]['category']
+    assert parse_menu(data, limit=3) == items[:3]
+    matching = parse_menu(data, category=first.upper())
+    assert matching and all(first in item['category'] for item in matching)
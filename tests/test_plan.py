@@ -0,0 +1,108 @@
+import random
+
+import pytest
+
+from swiggy_plan import CoveragePlanner, _Cell, parse_bbox, point_in_polygon
+
+BBOX = (12.90, 77.50, 12.98, 77.58)
+
+
+def fake_search(listing, shuffle=None, fail=()):
+    """search() for CoveragePlanner over listing(lat, lng) -> ids"""
+    calls = []
+
+    def search(locations):
+        locations = list(locations)
+        calls.append(locations)
+        if shuffle is not None:
+            shuffle.shuffle(locations)
+        for lat, lng in locations:
+            if (lat, lng) in fail:
+                yield lat, lng, None
+            else:
+                yield lat, lng, [{'id': rid} for rid in listing(float(lat), float(lng))]
+    return search, calls
+
+
+def clustered(lat, lng):
+    # One restaurant per ~1 km square; responses near the center are cut at 20
+    ids = [f'{round(lat, 2)}:{round(lng, 2)}:{n}' for n in range(8)]
+    if abs(lat - 12.94) < 0.02 and abs(lng - 77.54) < 0.02:
+        ids += [f'dense:{round(lat, 3)}:{round(lng, 3)}:{n}' for n in range(12)]
+    return ids[:20]
+
+
+def test_parse_bbox():
+    assert parse_bbox('12.9,77.5,13.0,77.6') == (12.9, 77.5, 13.0, 77.6)
+    with pytest.raises(ValueError):
+        parse_bbox('13.0,77.5,12.9,77.6')
+    with pytest.raises(ValueError):
+        parse_bbox('12.9,77.5')
+
+
+def test_uniform_area_is_not_split():
+    search, calls = fake_search(lambda lat, lng: ['a', 'b', 'c'])
+    planner = CoveragePlanner(search, BBOX, cell_km=4.0, min_cell_km=0.5)
+    samples = list(planner.run())
+    assert len(calls) == 1
+    assert planner.requests == len(samples) == len(planner.points())
+    assert planner.seen == {'a', 'b', 'c'}
+
+
+def test_full_pages_are_refined():
+    search, calls = fake_search(clustered)
+    planner = CoveragePlanner(search, BBOX, cell_km=4.0, min_cell_km=0.5)
+    list(planner.run())
+    assert planner.rounds > 1
+    assert len(calls) == planner.rounds
+
+
+def test_plan_does_not_depend_on_response_order():
+    plans = []
+    for seed in range(3):
+        search, _ = fake_search(clustered, shuffle=random.Random(seed))
+        planner = CoveragePlanner(search, BBOX, cell_km=4.0, min_cell_km=0.5)
+        list(planner.run())
+        plans.append(planner.points())
+    assert plans[0] == plans[1] == plans[2]
+
+
+def test_failed_searches_are_recorded():
+    search, calls = fake_search(lambda lat, lng: ['a'], fail={('12.9000', '77.5000')})
+    planner = CoveragePlanner(search, BBOX)
+    samples = list(planner.run())
+    failed = [s for s in samples if s.ids is None]
+    assert [(s.lat, s.lng) for s in failed] == [('12.9000', '77.5000')]
+    assert planner.samples[('12.9000', '77.5000')] is None
+
+
+def test_max_requests_truncates():
+    search, _ = fake_search(clustered)
+    planner = CoveragePlanner(search, BBOX, cell_km=2.0, min_cell_km=0.25, max_requests=10)
+    list(planner.run())
+    assert planner.requests <= 10
+    assert planner.truncated
+
+
+def test_small_polygon_is_seeded_from_its_vertices():
+    polygon = [(12.901, 77.501), (12.905, 77.502), (12.902, 77.505)]
+    planner = CoveragePlanner(lambda locations: iter(()), bbox=(12.90, 77.50, 12.94, 77.54), polygon=polygon)
+    cell = _Cell(12.90, 77.50, 12.94, 77.54, 0)
+    assert not any(point_in_polygon(lat, lng, polygon) for lat, lng in cell.points())
+    assert planner._cell_keys(cell) == [('12.9010', '77.5010'), ('12.9050', '77.5020'), ('12.9020', '77.5050')]
+
+
+def test_polygon_points_stay_inside():
+    polygon = [(12.90, 77.50), (12.98, 77.50), (12.90, 77.58)]
+    search, calls = fake_search(lambda lat, lng: [f'{lat}:{lng}'])
+    planner = CoveragePlanner(search, polygon=polygon, cell_km=2.0, min_cell_km=1.0)
+    list(planner.run())
+    assert planner.points()
+    assert all(point_in_polygon(float(lat), float(lng), polygon) for lat, lng in planner.points())
+
+
+def test_invalid_cell_sizes():
+    with pytest.raises(ValueError):
+        CoveragePlanner(lambda locations: iter(()), BBOX, cell_km=1.0, min_cell_km=2.0)
+    with pytest.raises(ValueError):
+        CoveragePlanner(lambda locations: iter(()))
@@ -0,0 +1,12 @@
+from swiggy_prefetch import prefetch_menus
+
+
+def test_filtered_records_do_not_satisfy_a_full_run(tmp_path):
+    out = str(tmp_path / 'menus.jsonl')
+    menu_filter = {'category': 'Starters', 'limit': None}
+    assert prefetch_menus(lambda restaurant_id: [restaurant_id], ['1', '2'], out, 2,
+                          menu_filter=menu_filter) == (2, 0, 0)
+    assert prefetch_menus(lambda restaurant_id: [restaurant_id], ['1', '2'], out, 2,
+                          menu_filter=menu_filter) == (0, 0, 2)
+    assert prefetch_menus(lambda restaurant_id: [restaurant_id], ['1', '2'], out, 2) == (2, 0, 0)
+    assert prefetch_menus(lambda restaurant_id: [restaurant_id], ['1', '2'], out, 2) == (0, 0, 2)
@@ -0,0 +1,30 @@
+from types import SimpleNamespace
+
+from swiggy_ratelimit import BACKOFF_FACTOR, DEFAULT_RATES, RateLimiter
+
+LISTING_URL = "https://www.swiggy.com/dapi/restaurants/list/v5"
+
+
+def send_status(status):
+    return lambda method, url, **kwargs: SimpleNamespace(status_code=status)
+
+
+def test_fanout_without_rate_keeps_backoff():
+    limiter = RateLimiter()
+    limiter.fit_fanout('restaurants/list', 32)
+    base_rate = DEFAULT_RATES['restaurants/list'][0]
+    assert limiter.rates['restaurants/list'] == (base_rate, 32)
+    # One token per worker up front
+    for _ in range(31):
+        limiter.transport_hook(send_status(200), "GET", LISTING_URL)
+    before = limiter.rate('restaurants/list')
+    limiter.transport_hook(send_status(202), "GET", LISTING_URL)
+    assert limiter.rate('restaurants/list') == before * BACKOFF_FACTOR
+
+
+def test_fanout_with_rate():
+    limiter = RateLimiter()
+    limiter.fit_fanout('restaurants/list', 16, rate=20.0)
+    assert limiter.rates['restaurants/list'] == (20.0, 16)
+    limiter.transport_hook(send_status(429), "GET", LISTING_URL)
+    assert limiter.rate('restaurants/list') == 20.0 * BACKOFF_FACTOR
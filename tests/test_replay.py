@@ -0,0 +1,48 @@
+import pytest
+
+from bench_suite import synthesize_fixtures
+from payloads import synthesize_listing
+from swiggy import SwiggyClient
+from swiggy_async import iter_grid_search
+from swiggy_cache import ResponseCache
+from swiggy_fixtures import ReplayServer
+from swiggy_index import MenuIndex
+from swiggy_parse import iter_restaurants
+
+
+@pytest.fixture(scope='module')
+def fixtures(tmp_path_factory):
+    directory = str(tmp_path_factory.mktemp('fixtures'))
+    synthesize_fixtures(directory)
+    return directory
+
+
+@pytest.fixture
+def client(fixtures, tmp_path):
+    with ReplayServer(fixtures) as server:
+        yield SwiggyClient(cache=ResponseCache(enabled=False),
+                           menu_index=MenuIndex(str(tmp_path / 'menu_index.db')),
+                           api_base=server.api_base)
+
+
+def test_search_through_replay(client):
+    restaurants = client.fetch_restaurants('query3', '12.9716', '77.5946')
+    assert restaurants == list(iter_restaurants(synthesize_listing(3)))
+
+
+def test_grid_search_through_replay(client):
+    locations = [('12.9716', '77.5946')] * 4 + [('12.9352', '77.6245')] * 4
+    results = list(iter_grid_search(client, 'query0', locations, concurrency=4))
+    assert len(results) == len(locations)
+    assert all(result.error is None and result.restaurants for result in results)
+
+
+def test_replay_errors_surface(fixtures, tmp_path):
+    # A status the transport doesn't retry, so the test doesn't wait out backoff
+    with ReplayServer(fixtures, error_rate=1.0, error_status=403, seed=0) as server:
+        client = SwiggyClient(cache=ResponseCache(enabled=False),
+                              menu_index=MenuIndex(str(tmp_path / 'menu_index.db')),
+                              api_base=server.api_base)
+        results = list(iter_grid_search(client, 'query0', [('12.9716', '77.5946')] * 3, concurrency=2))
+    assert len(results) == 3
+    assert all(result.restaurants is None and result.error is not None for result in results)
@@ -0,0 +1,56 @@
+import json
+
+import pytest
+
+from swiggy_session import SessionStore
+
+
+def test_missing_session_is_empty(tmp_path):
+    assert SessionStore(str(tmp_path / 'session.json')).load() == {}
+
+
+def test_save_load_update_clear(tmp_path):
+    path = tmp_path / 'session.json'
+    store = SessionStore(str(path))
+    store.save({'cookies': {'a': '1'}})
+    assert json.loads(path.read_text()) == {'cookies': {'a': '1'}}
+    assert store.update({'lat': '12.9'}) == {'cookies': {'a': '1'}, 'lat': '12.9'}
+    assert SessionStore(str(path)).load() == {'cookies': {'a': '1'}, 'lat': '12.9'}
+    store.clear()
+    assert not path.exists()
+    assert store.load() == {}
+
+
+def test_sees_writes_from_another_store(tmp_path):
+    path = str(tmp_path / 'session.json')
+    reader, writer = SessionStore(path), SessionStore(path)
+    writer.save({'n': 1})
+    assert reader.load() == {'n': 1}
+    assert not reader.changed()
+    writer.save({'n': 2, 'longer': True})
+    assert reader.changed()
+    assert reader.load() == {'n': 2, 'longer': True}
+
+
+def test_load_returns_a_copy(tmp_path):
+    store = SessionStore(str(tmp_path / 'session.json'))
+    store.save({'n': 1})
+    store.load()['n'] = 2
+    assert store.load() == {'n': 1}
+
+
+def test_corrupt_session(tmp_path):
+    path = tmp_path / 'session.json'
+    path.write_text('[1, 2]')
+    store = SessionStore(str(path))
+    with pytest.raises(ValueError):
+        store.load()
+    # update starts over instead of failing
+    assert store.update({'n': 1}) == {'n': 1}
+
+
+def test_no_temporary_files_left(tmp_path):
+    store = SessionStore(str(tmp_path / 'session.json'))
+    for n in range(5):
+        store.save({'n': n})
+    assert not [p.name for p in tmp_path.iterdir() if p.name.startswith('.session-')]
@@ -0,0 +1,73 @@
+import math
+
+import pytest
+
+from swiggy_parse import Restaurant
+from swiggy_snapshot import append_snapshot, compact_snapshot, load
+
+
+def restaurant(rid, rating=4.3, is_open=True, cuisines=('North Indian', 'Biryani')):
+    return Restaurant(rid, f'Restaurant {rid}', 'Indiranagar', 'Indiranagar', '₹400 for two',
+                      list(cuisines), rating, str(rating), '1K+', 30, '25-30 mins', is_open)
+
+
+def test_round_trip(tmp_path):
+    path = str(tmp_path / 'pizza.snap')
+    rows = [(restaurant('1', 4.35), '12.9716', '77.5946'),
+            (restaurant('2', 3.9, False, ()), '12.9352', '77.6245')]
+    assert append_snapshot(path, rows, ts=1700000000) == 2
+    with load(path) as snap:
+        records = list(snap.records())
+    assert [r['id'] for r in records] == ['1', '2']
+    assert records[0]['name'] == 'Restaurant 1'
+    assert records[0]['avgRating'] == 4.35
+    assert records[0]['cuisines'] == ['North Indian', 'Biryani']
+    assert records[1]['cuisines'] == []
+    assert records[0]['isOpen'] is True and records[1]['isOpen'] is False
+    assert records[0]['lat'] == 12.9716 and records[1]['lng'] == 77.6245
+    assert [r['ts'] for r in records] == [1700000000, 1700000000]
+
+
+def test_appends_add_segments(tmp_path):
+    path = str(tmp_path / 'pizza.snap')
+    for n in range(3):
+        append_snapshot(path, [(restaurant(str(n)), None, None)], ts=1700000000 + n)
+    with load(path) as snap:
+        assert len(snap.segments) == 3
+        assert snap.column('id') == ['0', '1', '2']
+        assert snap.timestamps() == [1700000000, 1700000001, 1700000002]
+        assert math.isnan(snap.column('lat')[0])
+
+    assert compact_snapshot(path) == 3
+    with load(path) as snap:
+        assert len(snap.segments) == 1
+        assert snap.column('id') == ['0', '1', '2']
+        assert snap.timestamps() == [1700000000, 1700000001, 1700000002]
+
+
+def test_torn_append_is_ignored_and_overwritten(tmp_path):
+    path = tmp_path / 'pizza.snap'
+    append_snapshot(str(path), [(restaurant('1'), None, None)], ts=1700000000)
+    with open(path, 'ab') as f:
+        f.write(b'SWGSNAP1\x40\x00\x00\x00{"half')
+    with load(str(path)) as snap:
+        assert snap.column('id') == ['1']
+    assert append_snapshot(str(path), [(restaurant('2'), None, None)], ts=1700000001) == 2
+    with load(str(path)) as snap:
+        assert snap.column('id') == ['1', '2']
+
+
+def test_other_files_are_not_overwritten(tmp_path):
+    path = tmp_path / 'results.json'
+    path.write_text('{"restaurants": []}\n')
+    with pytest.raises(ValueError):
+        append_snapshot(str(path), [(restaurant('1'), None, None)], ts=1700000000)
+    assert path.read_text() == '{"restaurants": []}\n'
+
+
+def test_torn_first_segment_is_not_truncated(tmp_path):
+    path = tmp_path / 'pizza.snap'
+    path.write_bytes(b'SWGSNAP1\x40\x00\x00\x00{"half')
+    with pytest.raises(ValueError):
+        append_snapshot(str(path), [(restaurant('1'), None, None)], ts=1700000000)
+    assert path.read_bytes() == b'SWGSNAP1\x40\x00\x00\x00{"half'
@@ -0,0 +1,48 @@
+import io
+
+from swiggy_watch import LiveTable, diff_results
+
+
+def restaurant(rid, **fields):
+    return dict({'id': rid, 'name': f'R{rid}', 'avgRatingString': '4.1', 'isOpen': True}, **fields)
+
+
+def test_diff_results():
+    previous = [restaurant('1'), restaurant('2'), restaurant('3')]
+    current = [restaurant('2'), restaurant('3', avgRatingString='4.4'), restaurant('4')]
+    diff = diff_results(previous, current)
+    assert diff.added == {'4'}
+    assert diff.removed == {'1'}
+    assert diff.changed == {'3'}
+
+
+def test_diff_results_ignores_unwatched_fields():
+    diff = diff_results([restaurant('1', locality='A')], [restaurant('1', locality='B')])
+    assert diff == (set(), set(), set())
+
+
+def test_live_table_redraws_only_changes():
+    stream = io.StringIO()
+    table = LiveTable(stream)
+    rows = [('one', ''), ('two', ''), ('three', '')]
+    table.update(rows, 'status')
+    assert all(text in stream.getvalue() for text, _ in rows)
+
+    stream.seek(0)
+    stream.truncate()
+    table.update(rows, 'status')
+    assert stream.getvalue() == ''
+
+    table.update([('one', ''), ('TWO', ''), ('three', '')], 'status')
+    written = stream.getvalue()
+    assert 'TWO' in written
+    assert 'one' not in written and 'three' not in written
+
+
+def test_live_table_shrinks_and_keeps_status_last():
+    stream = io.StringIO()
+    table = LiveTable(stream)
+    table.update([('a', ''), ('b', ''), ('c', '')], 'first')
+    table.update([('a', '')], 'second')
+    assert stream.getvalue().endswith('second')
+    assert table.rows == [('a', '')]